@@ -1,42 +1,238 @@
+import warnings
+
 import numpy as np
 
-# Data sederhana : luas rumah(x) dan harga (y)
-x = np.array([2104,1600,2400,1416,3000]) # fitur
-y = np.array([400,330,369,232,540])     # target
+# ========================================
+# BATCH GRADIENT DESCENT - LINEAR REGRESSION
+# ========================================
+# rumus aslinya
+# θj := θj - α * (1/m) * Σ (hθ(x(i)) - y(i)) * xj(i)
+#
+# bentuk matrix (semua θ sekaligus, berapapun jumlah fitur) :
+# θ := θ - α/m * Xᵀ(Xθ - y)
+#
+"""Bayangkan kamu latihan lempar bola ke keranjang 🏀.
+
+Kalau bola meleset sedikit → koreksi gaya lemparan sedikit.
+
+Kalau meleset jauh → koreksi lebih besar.
+
+Kalau kamu kumpulin semua lemparan dari 100 kali percobaan, lalu hitung rata-rata error dan koreksi gaya sekali besar → itu batch gradient descent.
+
+Jadi bukan koreksi per lemparan, tapi koreksi setelah melihat semua lemparan sekaligus."""
+
+
+# ========== VERSI SEDERHANA (1 FITUR, LOOP EPOCH TETAP) ==========
+
+def gradient_descent_simple(x, y, alpha=0.0001, epochs=1000):
+    """
+    versi awal file ini : 1 fitur, alpha tetap, jumlah epoch tetap
+    (bug lama : theta1 di update dengan np.sum(error), seharusnya np.sum(error * x))
+    """
+    theta0 = 0.0    # intercept
+    theta1 = 0.0    # slope
+    m = len(x)
+
+    for epoch in range(epochs):
+        y_pred = theta0 + theta1 * x
+        error = y_pred - y
+
+        # Update θ0 ( intercept ) dan θ1 ( slope ) bersamaan
+        grad0 = (1 / m) * np.sum(error)
+        grad1 = (1 / m) * np.sum(error * x)
+        theta0 = theta0 - alpha * grad0
+        theta1 = theta1 - alpha * grad1
+
+    return theta0, theta1
+
+
+# ========== SOLVER ==========
+
+class BatchGradientDescent:
+    """
+    batch gradient descent untuk linear regression (loss J = 1/2m Σ error²)
+
+    Parameters :
+    - alpha     : learning rate awal (di ruang fitur yang sudah di scale)
+                  untuk 'fixed' harus < 2/λmax(XᵀX/m) ; fitur di scale -> λmax <= jumlah fitur + 1,
+                  jadi 0.1 aman untuk fitur yang tidak terlalu collinear
+    - step      : 'fixed'       -> alpha tetap, kalau loss naik / tidak finite -> berhenti + warning
+                  'backtracking'-> line search Armijo : alpha dikecilkan sampai loss turun cukup,
+                                   tebakan awal tiap iterasi = step Barzilai-Borwein (dari perubahan
+                                   gradient), jauh lebih cepat untuk fitur yang collinear
+                  'adaptive'    -> bold driver : loss turun -> alpha × 1.1,
+                                   loss naik -> step dibatalkan, alpha × 0.5
+    - scale     : standardize fitur dulu (mean 0, std 1) -> kontur loss lebih "bulat",
+                  alpha besar aman dan konvergen jauh lebih cepat
+    - max_iter  : batas iterasi
+    - tol_grad  : stop kalau ||gradient|| < tol_grad
+    - tol_loss  : stop kalau penurunan loss relatif < tol_loss
+
+    setelah fit : intercept_, coef_ (di skala fitur asli), losses, n_iter_, converged_, diverged_
+    (diverged_ = True -> theta terakhir yang loss-nya masih turun yang dipakai)
+    """
+
+    def __init__(self, alpha=0.1, step="backtracking", scale=True, max_iter=10_000,
+                 tol_grad=1e-8, tol_loss=1e-12):
+        if step not in ("fixed", "backtracking", "adaptive"):
+            raise ValueError(f"step tidak dikenal: {step}")
+        self.alpha = alpha
+        self.step = step
+        self.scale = scale
+        self.max_iter = max_iter
+        self.tol_grad = tol_grad
+        self.tol_loss = tol_loss
+
+    @staticmethod
+    def _loss_and_grad(X, y, theta0, theta, error):
+        """J dan gradient (θ0, θ) ; error di isi in-place"""
+        m = len(y)
+        np.matmul(X, theta, out=error)
+        error += theta0 - y
+        loss = float(error @ error) / (2 * m)
+        return loss, error.sum() / m, X.T @ error / m
+
+    @staticmethod
+    def _loss(X, y, theta0, theta, error):
+        np.matmul(X, theta, out=error)
+        error += theta0 - y
+        return float(error @ error) / (2 * len(y))
+
+    def fit(self, X, y):
+        X = np.asarray(X, dtype=float)
+        if X.ndim == 1:
+            X = X.reshape(-1, 1)
+        y = np.asarray(y, dtype=float).reshape(-1)
+
+        # feature scaling : theta dicari di ruang fitur yang sudah di scale
+        if self.scale:
+            self.mean_ = X.mean(axis=0)
+            self.std_ = X.std(axis=0)
+            self.std_[self.std_ == 0] = 1.0
+            Xs = (X - self.mean_) / self.std_
+        else:
+            Xs = X
+
+        theta0, theta = 0.0, np.zeros(X.shape[1])
+        error = np.empty(len(y))
+        alpha = self.alpha
+        self.losses = []
+        self.converged_ = False
+        self.diverged_ = False
+
+        loss, grad0, grad = self._loss_and_grad(Xs, y, theta0, theta, error)
+        if not np.isfinite(loss):
+            raise ValueError("loss awal tidak finite, cek X / y (ada inf atau nilai terlalu besar?)")
+        for iteration in range(1, self.max_iter + 1):
+            self.losses.append(loss)
+            grad_sq = grad0 * grad0 + float(grad @ grad)
+            if np.sqrt(grad_sq) < self.tol_grad:
+                self.converged_ = True
+                break
+
+            if self.step == "backtracking":
+                # Armijo : J(θ - αg) <= J(θ) - c·α·||g||²
+                while True:
+                    new_loss = self._loss(Xs, y, theta0 - alpha * grad0, theta - alpha * grad, error)
+                    if new_loss <= loss - 0.5 * alpha * grad_sq or alpha < 1e-20:
+                        break
+                    alpha *= 0.5
+            elif self.step == "adaptive":
+                # bold driver : step yang membuat loss naik ditolak, coba lagi dengan alpha lebih kecil
+                # (retry di sini, bukan iterasi baru -> losses / n_iter_ hanya menghitung step yang diterima)
+                while True:
+                    new_loss = self._loss(Xs, y, theta0 - alpha * grad0, theta - alpha * grad, error)
+                    if new_loss <= loss or alpha < 1e-20:
+                        break
+                    alpha *= 0.5
+
+            previous_theta = (theta0, theta)
+            previous_grad = (grad0, grad)
+            theta0, theta = theta0 - alpha * grad0, theta - alpha * grad
+            previous, (loss, grad0, grad) = loss, self._loss_and_grad(Xs, y, theta0, theta, error)
+
+            if abs(previous - loss) <= self.tol_loss * max(abs(previous), 1e-300):
+                self.converged_ = True
+                self.losses.append(loss)
+                break
+
+            # fixed step : loss linear regression harus turun terus kalau alpha < 2/λmax,
+            # loss naik = mulai divergen -> berhenti, pakai theta sebelumnya
+            if not np.isfinite(loss) or (self.step == "fixed" and loss > previous):
+                warnings.warn(f"gradient descent divergen di iterasi {iteration} (loss {previous:.4g} -> {loss:.4g}), "
+                              f"alpha={alpha:g} terlalu besar ; pakai alpha lebih kecil atau step='backtracking'",
+                              RuntimeWarning, stacklevel=2)
+                (theta0, theta), loss = previous_theta, previous
+                self.diverged_ = True
+                break
 
-# inisialisasi parameter
-theta0 = 0.0    #   intercept
-theta1 = 0.0    # slope
-alpha = 0.0001    # learning rate
-m = len(x)
+            if self.step == "backtracking":
+                # Barzilai-Borwein : α = sᵀs / sᵀΔg dengan s = -α·g_lama
+                grad_change = grad_sq - (previous_grad[0] * grad0 + float(previous_grad[1] @ grad))
+                alpha = alpha * grad_sq / grad_change if grad_change > 0 else alpha * 2.0
+            elif self.step == "adaptive":
+                alpha *= 1.1
 
-# gradient decent loop
-for epoch in range(1000):
-    # prediksi
-    y_pred = theta0 + theta1 * x
+        self.n_iter_ = len(self.losses)
+        if not self.converged_ and not self.diverged_:
+            warnings.warn(f"belum konvergen setelah {self.max_iter} iterasi (fitur collinear / alpha terlalu kecil?)",
+                          RuntimeWarning, stacklevel=2)
 
-    # hitung error
-    error = y_pred - y
+        # kembalikan ke skala fitur asli : y = θ0 + Σ θj (xj - μj)/σj
+        if self.scale:
+            self.coef_ = theta / self.std_
+            self.intercept_ = theta0 - float(self.coef_ @ self.mean_)
+        else:
+            self.coef_, self.intercept_ = theta, theta0
+        return self
 
-    # rumus aslinya
-    # # θj := θj - α * (1/m) * Σ (hθ(x(i)) - y(i)) * xj(i)
-    # Di sini ada 2 parameter: θ0 dan θ1
-    """Bayangkan kamu latihan lempar bola ke keranjang 🏀.
+    def predict(self, X):
+        X = np.asarray(X, dtype=float)
+        if X.ndim == 1:
+            X = X.reshape(-1, 1)
+        return X @ self.coef_ + self.intercept_
 
-    Kalau bola meleset sedikit → koreksi gaya lemparan sedikit.
 
-    Kalau meleset jauh → koreksi lebih besar.
+if __name__ == "__main__":
+    # Data sederhana : luas rumah(x) dan harga (y)
+    x = np.array([2104, 1600, 2400, 1416, 3000])  # fitur
+    y = np.array([400, 330, 369, 232, 540])       # target
 
-    Kalau kamu kumpulin semua lemparan dari 100 kali percobaan, lalu hitung rata-rata error dan koreksi gaya sekali besar → itu batch gradient descent.
+    # solusi exact (least squares) sebagai pembanding
+    exact = np.linalg.lstsq(np.c_[np.ones(len(x)), x], y, rcond=None)[0]
+    print(f"exact (lstsq)        : theta0={exact[0]:.4f}, theta1={exact[1]:.6f}")
 
-    Jadi bukan koreksi per lemparan, tapi koreksi setelah melihat semua lemparan sekaligus."""
+    # versi lama : 1000 epoch, alpha 0.0001 tanpa scaling -> slope langsung meledak
+    # (x ribuan, alpha harus < ~1e-7 supaya stabil, lalu intercept hampir tidak bergerak)
+    with np.errstate(over="ignore", invalid="ignore"):
+        theta0, theta1 = gradient_descent_simple(x, y)
+    print(f"simple (1000 epoch)  : theta0={theta0:.4f}, theta1={theta1:.6f}")
+    theta0, theta1 = gradient_descent_simple(x, y, alpha=1e-7, epochs=1000)
+    print(f"simple alpha=1e-7    : theta0={theta0:.4f}, theta1={theta1:.6f}")
 
-    # Update 00 ( intercept )
-    theta0 = theta0 - alpha * (1/m) * np.sum(error)
+    for step in ("fixed", "backtracking", "adaptive"):
+        solver = BatchGradientDescent(step=step).fit(x, y)
+        print(f"{step:<12} ({solver.n_iter_:4d} it): theta0={solver.intercept_:.4f}, "
+              f"theta1={solver.coef_[0]:.6f}, konvergen={solver.converged_}")
 
-    # update 01 ( slope )
-    theta1 = theta1 - alpha * (1/m) * np.sum(error)
+    # multi fitur : bentuk matrix yang sama
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(1000, 5)) * [1, 10, 100, 1000, 0.1]
+    y_multi = X @ np.array([2.0, -1.0, 0.5, 0.01, 30.0]) + 7 + rng.normal(scale=0.1, size=1000)
+    solver = BatchGradientDescent().fit(X, y_multi)
+    print(f"\n5 fitur ({solver.n_iter_} it) : intercept={solver.intercept_:.4f}, coef={np.round(solver.coef_, 4)}")
 
-# Hasil parameter
-print("theta0:", theta0)
-print("theta1:", theta1)
+    # fitur hampir collinear : alpha fixed terlalu besar -> berhenti dengan warning (bukan hasil nan diam-diam)
+    X_col = rng.normal(size=(1000, 4))
+    X_col[:, 1:3] = X_col[:, [0]] + 1e-3 * X_col[:, 1:3]
+    y_col = X_col @ np.array([1.0, 2.0, 3.0, 4.0]) + rng.normal(size=1000)
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        solver = BatchGradientDescent(alpha=1.0, step="fixed").fit(X_col, y_col)
+    print(f"\ncollinear, fixed alpha=1.0 : diverged={solver.diverged_} ({caught[0].message})")
+    solver = BatchGradientDescent(step="backtracking").fit(X_col, y_col)
+    # arah collinear hampir tidak mengubah loss -> bandingkan loss, bukan koefisien
+    exact = np.linalg.lstsq(np.c_[np.ones(len(X_col)), X_col], y_col, rcond=None)[0]
+    exact_loss = np.mean((y_col - exact[0] - X_col @ exact[1:]) ** 2) / 2
+    print(f"collinear, backtracking ({solver.n_iter_} it) : konvergen={solver.converged_}, "
+          f"loss={solver.losses[-1]:.6f} vs lstsq {exact_loss:.6f}")
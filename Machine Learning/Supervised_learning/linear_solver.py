@@ -0,0 +1,369 @@
+# ========================================
+# LINEAR REGRESSION - CLOSED FORM SOLVER
+# ========================================
+# pengganti LinearRegressionFromScratch di "prediksi rumah/main.ipynb"
+# versi notebook :
+#   X_b = np.c_[np.ones((m,1)), X]                          -> copy seluruh X hanya untuk kolom bias
+#   theta = np.linalg.pinv(X_b.T @ X_b) @ X_b.T @ y        -> pinv (SVD) dari Gram matrix,
+#                                                             condition number = cond(X)²
+# di sini :
+# - bias lewat centering : β dicari dari data yang sudah dikurangi mean,
+#   intercept = mean(y) - mean(X) @ β (tidak ada kolom 1)
+# - solver dipilih dari condition number :
+#   cholesky (XᵀX kondisi baik) -> QR (sedang) -> lstsq / SVD (buruk / rank deficient)
+# - ridge (alpha), intercept tidak ikut di regularisasi
+# - partial_fit : XᵀX dan Xᵀy (sudah di center, update stabil ala Chan) di akumulasi per chunk,
+#   jadi jumlah baris bisa tidak terbatas (streaming), memory hanya d×d
+#
+# contoh :
+#   model = LinearRegressionFromScratch(alpha=1.0).fit(X_train, y_train)
+#   model.score(X_test, y_test)
+#
+#   model = LinearRegressionFromScratch()
+#   for X_chunk, y_chunk in chunks:
+#       model.partial_fit(X_chunk, y_chunk)
+#
+# benchmark vs versi notebook (pinv) :
+#   python linear_solver.py --rows 1000000 --features 50
+# self check semua jalur solver (cholesky / qr / lstsq, ridge, partial_fit) :
+#   python linear_solver.py --check
+
+import argparse
+import time
+
+import numpy as np
+
+try:
+    from scipy.linalg import cho_factor, cho_solve
+except ImportError:     # scipy opsional, fallback ke np.linalg.solve
+    cho_factor = cho_solve = None
+
+
+# batas condition number Gram matrix (= cond(X)²) untuk tiap solver
+CHOLESKY_MAX_COND = 1e8     # error relatif ~ cond(G) * 1e-16 <= 1e-8
+QR_MAX_COND = 1e24          # QR bekerja di X langsung (cond(X) = sqrt(cond(G)) <= 1e12)
+
+
+# ========== SUFFICIENT STATISTICS ==========
+
+class SufficientStats:
+    """
+    statistik cukup untuk least squares, semuanya sudah di center :
+    - n, mean_x (d,), mean_y (k,)
+    - Sxx = Σ (x - x̄)(x - x̄)ᵀ  (d, d)
+    - Sxy = Σ (x - x̄)(y - ȳ)ᵀ  (d, k)
+    - Syy = Σ (y - ȳ)²          (k,)
+    update per chunk pakai rumus gabungan Chan (stabil walaupun mean besar)
+    """
+
+    def __init__(self, n_features=None, n_targets=None):
+        self.n = 0
+        if n_features is not None:
+            self._allocate(n_features, n_targets or 1)
+
+    def _allocate(self, d, k):
+        self.mean_x = np.zeros(d)
+        self.mean_y = np.zeros(k)
+        self.Sxx = np.zeros((d, d))
+        self.Sxy = np.zeros((d, k))
+        self.Syy = np.zeros(k)
+
+    @classmethod
+    def from_arrays(cls, X, y, chunk_size=100_000):
+        stats = cls()
+        for start in range(0, len(X), chunk_size):
+            stats.update(X[start:start + chunk_size], y[start:start + chunk_size])
+        return stats
+
+    def update(self, X, y):
+        """tambah satu chunk (X : (m, d), y : (m,) atau (m, k))"""
+        X = np.asarray(X, dtype=float)
+        y = np.asarray(y, dtype=float)
+        y = y.reshape(len(y), -1)
+        m = len(X)
+        if m == 0:
+            return self
+        if self.n == 0:
+            self._allocate(X.shape[1], y.shape[1])
+
+        # statistik chunk (center dengan mean chunk sendiri)
+        chunk_mean_x = X.mean(axis=0)
+        chunk_mean_y = y.mean(axis=0)
+        Xc = X - chunk_mean_x
+        yc = y - chunk_mean_y
+        chunk = SufficientStats()
+        chunk.n, chunk.mean_x, chunk.mean_y = m, chunk_mean_x, chunk_mean_y
+        chunk.Sxx, chunk.Sxy, chunk.Syy = Xc.T @ Xc, Xc.T @ yc, np.einsum("ij,ij->j", yc, yc)
+        return self.merge(chunk)
+
+    def merge(self, other):
+        """gabungkan statistik lain (misal dari worker lain) ke self"""
+        if other.n == 0:
+            return self
+        if self.n == 0:
+            self.n, self.mean_x, self.mean_y = other.n, other.mean_x.copy(), other.mean_y.copy()
+            self.Sxx, self.Sxy, self.Syy = other.Sxx.copy(), other.Sxy.copy(), other.Syy.copy()
+            return self
+
+        n = self.n + other.n
+        delta_x = other.mean_x - self.mean_x
+        delta_y = other.mean_y - self.mean_y
+        weight = self.n * other.n / n
+        self.Sxx += other.Sxx + weight * np.outer(delta_x, delta_x)
+        self.Sxy += other.Sxy + weight * np.outer(delta_x, delta_y)
+        self.Syy += other.Syy + weight * delta_y * delta_y
+        self.mean_x += delta_x * other.n / n
+        self.mean_y += delta_y * other.n / n
+        self.n = n
+        return self
+
+    def solve(self, alpha=0.0):
+        """
+        β dari (Sxx + αI) β = Sxy : cholesky kalau kondisi baik, selain itu lstsq (SVD)
+        Returns : (coef (d, k), intercept (k,), solver yang dipakai)
+        """
+        A = self.Sxx + alpha * np.eye(len(self.Sxx)) if alpha else self.Sxx
+        coef, solver = _solve_gram(A, self.Sxy)
+        return coef, self.mean_y - self.mean_x @ coef, solver
+
+
+def _condition(A):
+    """condition number matrix simetris positif (semi) definit dari eigenvalue"""
+    eig = np.linalg.eigvalsh(A)
+    return np.inf if eig[0] <= 0 else eig[-1] / eig[0]
+
+
+def _solve_gram(A, B):
+    """solve A X = B untuk A = Gram matrix (simetris), pilih cholesky / lstsq dari kondisi A"""
+    if _condition(A) <= CHOLESKY_MAX_COND:
+        try:
+            if cho_factor is not None:
+                return cho_solve(cho_factor(A), B), "cholesky"
+            L = np.linalg.cholesky(A)
+            return np.linalg.solve(L.T, np.linalg.solve(L, B)), "cholesky"
+        except np.linalg.LinAlgError:
+            pass
+    # kondisi buruk / singular : SVD, hasil minimum norm (sama seperti pinv)
+    return np.linalg.lstsq(A, B, rcond=None)[0], "lstsq"
+
+
+# ========== MODEL ==========
+
+class LinearRegressionFromScratch:
+    """
+    Linear Regression (closed form) + Ridge
+
+    Parameters :
+    - alpha  : kekuatan ridge (0 = OLS biasa), intercept tidak di regularisasi
+    - solver : 'auto' (pilih dari condition number), 'cholesky', 'qr', 'lstsq'
+    - chunk_size : baris per chunk saat menghitung XᵀX (memory tambahan = satu chunk)
+
+    setelah fit : intercept, coefficients (nama sama seperti notebook), solver_
+    """
+
+    def __init__(self, alpha=0.0, solver="auto", chunk_size=100_000):
+        if solver not in ("auto", "cholesky", "qr", "lstsq"):
+            raise ValueError(f"solver tidak dikenal: {solver}")
+        self.alpha = alpha
+        self.solver = solver
+        self.chunk_size = chunk_size
+        self.coefficients = None
+        self.intercept = None
+
+    def fit(self, X, y):
+        """
+        Fit linear regression
+            β = (XcᵀXc + αI)⁻¹ Xcᵀyc ,  intercept = ȳ - x̄ β   (Xc, yc = data di center)
+        """
+        X = np.asarray(X, dtype=float)
+        y = np.asarray(y, dtype=float)
+        self._single_target = y.ndim == 1
+        self.stats_ = SufficientStats.from_arrays(X, y, self.chunk_size)
+
+        solver = self.solver
+        if solver == "auto":
+            cond = _condition(self._gram())
+            solver = "cholesky" if cond <= CHOLESKY_MAX_COND else "qr" if cond <= QR_MAX_COND else "lstsq"
+
+        if solver == "cholesky":
+            coef, _, used = self.stats_.solve(self.alpha)
+            if used != "cholesky":   # cholesky gagal (tidak positive definite)
+                coef, solver = self._solve_on_data(X, y, "lstsq"), "lstsq"
+        else:
+            coef = self._solve_on_data(X, y, solver)
+
+        self.solver_ = solver
+        self._set_coef(coef)
+        return self
+
+    def partial_fit(self, X, y):
+        """
+        tambah chunk data lalu hitung ulang β dari statistik yang di akumulasi
+        (data mentah tidak disimpan, jadi solver selalu lewat Gram : cholesky / lstsq)
+        """
+        y = np.asarray(y, dtype=float)
+        if not hasattr(self, "stats_") or self.stats_.n == 0:
+            self.stats_ = SufficientStats()
+            self._single_target = y.ndim == 1
+        self.stats_.update(X, y)
+        coef, _, self.solver_ = self.stats_.solve(self.alpha)
+        self._set_coef(coef)
+        return self
+
+    def _gram(self):
+        return self.stats_.Sxx + self.alpha * np.eye(len(self.stats_.Sxx))
+
+    def _solve_on_data(self, X, y, solver):
+        """QR / lstsq langsung di X yang di center (butuh satu copy X, tanpa kolom bias)"""
+        Xc = X - self.stats_.mean_x
+        yc = y.reshape(len(y), -1) - self.stats_.mean_y
+        if self.alpha:
+            # ridge = least squares biasa dengan baris tambahan sqrt(α)·I
+            d = X.shape[1]
+            Xc = np.vstack([Xc, np.sqrt(self.alpha) * np.eye(d)])
+            yc = np.vstack([yc, np.zeros((d, yc.shape[1]))])
+        if solver == "qr":
+            Q, R = np.linalg.qr(Xc)
+            return np.linalg.solve(R, Q.T @ yc)
+        return np.linalg.lstsq(Xc, yc, rcond=None)[0]
+
+    def _set_coef(self, coef):
+        intercept = self.stats_.mean_y - self.stats_.mean_x @ coef
+        if self._single_target:
+            self.coefficients, self.intercept = coef[:, 0], float(intercept[0])
+        else:
+            self.coefficients, self.intercept = coef, intercept
+
+    def predict(self, X):
+        """Make prediction"""
+        X = np.asarray(X, dtype=float)
+        return self.intercept + X @ self.coefficients
+
+    def score(self, X, y):
+        """R2 score"""
+        y = np.asarray(y, dtype=float)
+        y_pred = self.predict(X)
+        ss_res = np.sum((y - y_pred) ** 2, axis=0)
+        ss_tot = np.sum((y - np.mean(y, axis=0)) ** 2, axis=0)
+        return 1 - (ss_res / ss_tot)
+
+
+# ========== BENCHMARK ==========
+
+def _pinv_normal_equation(X, y):
+    """versi notebook, untuk pembanding"""
+    m = X.shape[0]
+    X_b = np.c_[np.ones((m, 1)), X]
+    theta = np.linalg.pinv(X_b.T @ X_b) @ X_b.T @ y.reshape(-1, 1)
+    return theta[0, 0], theta[1:].flatten()
+
+
+def benchmark(n_rows=1_000_000, n_features=50, chunk_size=100_000, seed=42):
+    """
+    waktu + error koefisien : pinv (notebook) vs solver ini
+    - data kondisi baik
+    - data ill-conditioned (kolom hampir collinear + mean besar)
+    - partial_fit per chunk
+    """
+    rng = np.random.default_rng(seed)
+    true_coef = rng.normal(size=n_features)
+
+    X = rng.normal(size=(n_rows, n_features))
+    X_ill = X.copy()
+    X_ill[:, 1] = X_ill[:, 0] + 1e-5 * X_ill[:, 1]      # hampir collinear
+    X_ill += 1e4                                         # mean besar -> bias column memperburuk kondisi
+
+    for name, data in (("well-conditioned", X), ("ill-conditioned", X_ill)):
+        y = data @ true_coef + 3.0 + rng.normal(scale=0.1, size=n_rows)
+        reference = np.linalg.lstsq(np.c_[np.ones(n_rows), data], y, rcond=None)[0]
+
+        start = time.perf_counter()
+        intercept, coef = _pinv_normal_equation(data, y)
+        pinv_s = time.perf_counter() - start
+        pinv_err = np.abs(np.r_[intercept, coef] - reference).max()
+
+        start = time.perf_counter()
+        model = LinearRegressionFromScratch(chunk_size=chunk_size).fit(data, y)
+        fit_s = time.perf_counter() - start
+        fit_err = np.abs(np.r_[model.intercept, model.coefficients] - reference).max()
+
+        start = time.perf_counter()
+        streaming = LinearRegressionFromScratch()
+        for s in range(0, n_rows, chunk_size):
+            streaming.partial_fit(data[s:s + chunk_size], y[s:s + chunk_size])
+        stream_s = time.perf_counter() - start
+        stream_err = np.abs(np.r_[streaming.intercept, streaming.coefficients] - reference).max()
+
+        print(f"{name:<17} | pinv {pinv_s:6.2f}s err {pinv_err:9.2e} | "
+              f"fit[{model.solver_}] {fit_s:6.2f}s err {fit_err:9.2e} | "
+              f"partial_fit[{streaming.solver_}] {stream_s:6.2f}s err {stream_err:9.2e}")
+
+
+def self_check(seed=0, rtol=1e-8):
+    """
+    cek cepat semua jalur solver terhadap lstsq pada data augmented (kolom bias + baris ridge) :
+    cholesky / qr / lstsq / auto, ridge, multi target, partial_fit per chunk, dan data ill-conditioned
+    raise AssertionError kalau ada yang beda
+    """
+    rng = np.random.default_rng(seed)
+    n, d = 2_000, 6
+    X = rng.normal(size=(n, d)) * [1, 10, 100, 1, 1, 1] + 50
+    Y = np.column_stack([X @ rng.normal(size=d) + 3, X @ rng.normal(size=d) - 1]) + rng.normal(size=(n, 2))
+
+    def reference(X, Y, alpha):
+        # ridge tanpa regularisasi intercept = lstsq biasa dengan baris tambahan [0, sqrt(α)·I]
+        A = np.vstack([np.c_[np.ones(len(X)), X], np.c_[np.zeros((d, 1)), np.sqrt(alpha) * np.eye(d)]])
+        theta = np.linalg.lstsq(A, np.vstack([Y, np.zeros((d, Y.shape[1]))]), rcond=None)[0]
+        return theta[0], theta[1:]
+
+    def check(name, model, intercept, coef):
+        got = np.r_[np.atleast_1d(model.intercept), np.ravel(model.coefficients)]
+        expected = np.r_[np.atleast_1d(intercept), np.ravel(coef)]
+        scale = np.abs(expected).max()
+        assert np.allclose(got, expected, rtol=rtol, atol=rtol * scale), f"{name}: {np.abs(got - expected).max():.3e}"
+        print(f"  ok  {name:<34} solver={model.solver_}")
+
+    for alpha in (0.0, 5.0):
+        intercept, coef = reference(X, Y[:, :1], alpha)
+        for solver in ("auto", "cholesky", "qr", "lstsq"):
+            model = LinearRegressionFromScratch(alpha=alpha, solver=solver, chunk_size=300).fit(X, Y[:, 0])
+            check(f"fit solver={solver} alpha={alpha}", model, intercept[0], coef[:, 0])
+
+        model = LinearRegressionFromScratch(alpha=alpha)
+        for start in range(0, n, 333):
+            model.partial_fit(X[start:start + 333], Y[start:start + 333, 0])
+        check(f"partial_fit alpha={alpha}", model, intercept[0], coef[:, 0])
+
+        intercept, coef = reference(X, Y, alpha)
+        check(f"multi target alpha={alpha}", LinearRegressionFromScratch(alpha=alpha).fit(X, Y), intercept, coef)
+
+    # score = R² standar
+    model = LinearRegressionFromScratch().fit(X, Y[:, 0])
+    residual = Y[:, 0] - model.predict(X)
+    r2 = 1 - residual @ residual / np.sum((Y[:, 0] - Y[:, 0].mean()) ** 2)
+    assert np.isclose(model.score(X, Y[:, 0]), r2), "score"
+    print("  ok  score (R²)")
+
+    # ill-conditioned (kolom hampir collinear) : auto harus pindah ke qr / lstsq, prediksi tetap akurat
+    X_ill = X.copy()
+    X_ill[:, 1] = X_ill[:, 0] + 1e-6 * rng.normal(size=n)
+    model = LinearRegressionFromScratch().fit(X_ill, Y[:, 0])
+    intercept, coef = reference(X_ill, Y[:, :1], 0.0)
+    expected = intercept[0] + X_ill @ coef[:, 0]
+    assert model.solver_ != "cholesky", model.solver_
+    assert np.allclose(model.predict(X_ill), expected, rtol=1e-6, atol=1e-6 * np.abs(expected).max()), "ill-conditioned"
+    print(f"  ok  ill-conditioned prediksi           solver={model.solver_}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark closed form solver vs pinv normal equation")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--features", type=int, default=50)
+    parser.add_argument("--chunk-size", type=int, default=100_000)
+    parser.add_argument("--check", action="store_true", help="jalankan self check solver (bukan benchmark)")
+    args = parser.parse_args()
+
+    if args.check:
+        self_check()
+    else:
+        benchmark(args.rows, args.features, args.chunk_size)
@@ -0,0 +1,300 @@
+# ========================================
+# REGRESSION SWEEP - BANYAK KOMBINASI FITUR SEKALIGUS
+# ========================================
+# di yt_prediction_regresion_linear.ipynb tiap kombinasi fitur (X1 = like_count, X2 = 3 fitur, ...)
+# di split + di fit ulang dari data mentah. di sini :
+# 1. split train/test SATU kali (index sama persis dengan train_test_split sklearn)
+# 2. satu pass data -> SufficientStats train & test (XᵀX, Xᵀy, yᵀy yang sudah di center)
+# 3. tiap kombinasi fitur = sub-block dari XᵀX :
+#       β = (Sxx[S,S] + αI)⁻¹ Sxy[S]   -> di solve batch per ukuran kombinasi
+# 4. R² dan RMSE (train & test) langsung dari statistik, tanpa data mentah :
+#       SSE = Syy - 2βᵀSxy + βᵀSxxβ + n·(ȳ - b - x̄β)²
+#    MAE tidak bisa dari statistik orde 2 -> satu pass prediksi (chunk) untuk SEMUA kombinasi
+#    sekaligus (bukan fit ulang), bisa dibatasi ke N kombinasi terbaik (mae_top) atau dimatikan (compute_mae=False)
+#
+# contoh (di notebook) :
+#   from regression_sweep import regression_sweep
+#   results = regression_sweep(df[features].values, df['view_count'].values, feature_names=features,
+#                              combinations=[['like_count', 'comment_count', 'video_age_days']])
+#   results.head()
+#
+# benchmark vs fit LinearRegression per kombinasi :
+#   python regression_sweep.py --rows 200000 --features 200 --max-size 2
+
+import argparse
+import itertools
+import time
+
+import numpy as np
+import pandas as pd
+
+from linear_solver import CHOLESKY_MAX_COND, SufficientStats, _solve_gram
+
+
+# ========== SPLIT ==========
+
+def train_test_indices(n_samples, test_size=0.2, random_state=42):
+    """index train/test, sama dengan sklearn train_test_split(..., test_size, random_state)"""
+    n_test = int(np.ceil(test_size * n_samples)) if isinstance(test_size, float) else int(test_size)
+    permutation = np.random.RandomState(random_state).permutation(n_samples)
+    return permutation[n_test:], permutation[:n_test]
+
+
+def _stats_for_rows(X, y, rows, chunk_size):
+    """SufficientStats untuk baris tertentu, di gather per chunk (tidak copy seluruh subset)"""
+    stats = SufficientStats()
+    for start in range(0, len(rows), chunk_size):
+        idx = np.sort(rows[start:start + chunk_size])
+        stats.update(X[idx], y[idx])
+    return stats
+
+
+# ========== SOLVE SEMUA KOMBINASI ==========
+
+def _solve_group(stats, combos, alpha):
+    """
+    solve semua kombinasi dengan ukuran sama (combos : (C, k) index fitur) secara batch
+    Returns : coef (C, k), intercept (C,)
+    """
+    n_combos, k = combos.shape
+    A = stats.Sxx[combos[:, :, None], combos[:, None, :]]       # (C, k, k) sub-block
+    b = stats.Sxy[combos, 0]                                     # (C, k)
+    if alpha:
+        A = A + alpha * np.eye(k)
+
+    coef = np.zeros((n_combos, k))
+    if k == 1:
+        # 1 fitur : β = Sxy / Sxx (fitur konstan -> β = 0)
+        var = A[:, 0, 0]
+        np.divide(b[:, 0], var, out=coef[:, 0], where=var > 0)
+    else:
+        eig = np.linalg.eigvalsh(A)
+        good = (eig[:, 0] > 0) & (eig[:, -1] <= CHOLESKY_MAX_COND * eig[:, 0])
+        if good.any():
+            coef[good] = np.linalg.solve(A[good], b[good, :, None])[:, :, 0]
+        # kombinasi ill-conditioned / collinear : satu-satu lewat lstsq
+        for c in np.flatnonzero(~good):
+            coef[c] = _solve_gram(A[c], b[c, :, None])[0][:, 0]
+
+    intercept = stats.mean_y[0] - np.einsum("ck,ck->c", stats.mean_x[combos], coef)
+    return coef, intercept
+
+
+def _sse(stats, combos, coef, intercept):
+    """Σ error² untuk tiap kombinasi di data yang diwakili stats (bisa data yang tidak dipakai fit)"""
+    Sxx = stats.Sxx[combos[:, :, None], combos[:, None, :]]
+    Sxy = stats.Sxy[combos, 0]
+    centered = stats.Syy[0] - 2 * np.einsum("ck,ck->c", coef, Sxy) + np.einsum("ck,ckl,cl->c", coef, Sxx, coef)
+    bias = stats.mean_y[0] - intercept - np.einsum("ck,ck->c", stats.mean_x[combos], coef)
+    return np.maximum(centered + stats.n * bias ** 2, 0.0)
+
+
+def _absolute_errors(X, y, rows, groups, max_memory_mb):
+    """
+    Σ |error| untuk semua kombinasi : satu pass baris (chunk), prediksi semua kombinasi per chunk
+    chunk di transpose (fitur, baris) supaya gather fitur = copy baris yang contiguous
+    """
+    total = [np.zeros(len(combos)) for combos, _, _ in groups]
+    n_combos = max(sum(len(combos) for combos, _, _ in groups), 1)
+    chunk_size = max(1, int(max_memory_mb * 2 ** 20 // (8 * 2 * n_combos)))
+
+    for start in range(0, len(rows), chunk_size):
+        idx = np.sort(rows[start:start + chunk_size])
+        X_chunk = np.ascontiguousarray(X[idx].T)          # (d, m)
+        y_chunk = y[idx]
+        for g, (combos, coef, intercept) in enumerate(groups):
+            pred = np.take(X_chunk, combos[:, 0], axis=0)  # (C, m)
+            pred *= coef[:, 0, None]
+            term = np.empty_like(pred) if combos.shape[1] > 1 else None
+            for t in range(1, combos.shape[1]):
+                np.take(X_chunk, combos[:, t], axis=0, out=term)
+                term *= coef[:, t, None]
+                pred += term
+            pred += intercept[:, None]
+            pred -= y_chunk
+            np.abs(pred, out=pred)
+            total[g] += pred.sum(axis=1)
+    return total
+
+
+# ========== SWEEP ==========
+
+def _feature_index(feature, column, n_features):
+    """nama / index fitur -> index kolom, error jelas kalau tidak ada"""
+    if isinstance(feature, (int, np.integer)) and not isinstance(feature, bool):
+        if not 0 <= feature < n_features:
+            raise ValueError(f"index fitur {feature} di luar range 0..{n_features - 1}")
+        return int(feature)
+    if feature not in column:
+        raise KeyError(f"fitur tidak dikenal: {feature!r} (feature_names: {list(column)})")
+    return column[feature]
+
+
+def regression_sweep(X, y, feature_names=None, combinations=None, max_size=1, alpha=0.0,
+                     test_size=0.2, random_state=42, compute_mae=True, mae_top=None, chunk_size=100_000,
+                     max_memory_mb=256):
+    """
+    evaluasi linear regression untuk banyak kombinasi fitur dari satu pass statistik
+
+    Parameters :
+    - X, y          : data lengkap (belum di split), y 1D
+    - feature_names : nama kolom X (default x0, x1, ...)
+    - combinations  : kombinasi tambahan (list of list nama / index fitur)
+    - max_size      : semua kombinasi sampai ukuran ini ikut di evaluasi (1 = semua single feature)
+                      hati-hati : d=200, max_size=2 -> 20.100 kombinasi
+    - alpha         : ridge
+    - test_size, random_state : sama seperti train_test_split
+    - compute_mae   : MAE butuh satu pass prediksi tambahan, R²/RMSE tidak
+    - mae_top       : kalau di isi, MAE hanya dihitung untuk N kombinasi dengan R² test terbaik
+                      (biaya pass MAE ~ baris × kombinasi, R²/RMSE tidak tergantung jumlah baris)
+                      tepat N kombinasi, R² yang sama di batas N tidak ikut semua (dipilih salah satu)
+    - chunk_size    : baris per chunk saat menghitung statistik
+    - max_memory_mb : batas memory matrix prediksi (chunk × kombinasi) saat hitung MAE
+
+    Returns : DataFrame satu baris per kombinasi, di urutkan dari R² test terbaik
+              (kosong, kolom tetap sama, kalau max_size=0 dan combinations kosong)
+    Raises  : KeyError nama fitur tidak dikenal, ValueError index fitur di luar range
+    """
+    X = np.asarray(X, dtype=float)
+    y = np.asarray(y, dtype=float).ravel()
+    n_features = X.shape[1]
+    if feature_names is None:
+        feature_names = [f"x{j}" for j in range(n_features)]
+    feature_names = list(feature_names)
+    column = {name: j for j, name in enumerate(feature_names)}
+
+    # daftar kombinasi (unik, urutan index), dikelompokkan per ukuran
+    wanted = set()
+    for size in range(1, max_size + 1):
+        wanted.update(itertools.combinations(range(n_features), size))
+    for combo in combinations or []:
+        if len(combo) == 0:
+            raise ValueError("combinations tidak boleh berisi kombinasi kosong")
+        wanted.add(tuple(sorted({_feature_index(f, column, n_features) for f in combo})))
+    if not wanted:
+        # max_size=0 tanpa combinations : tidak ada yang di evaluasi
+        metrics = ["r2_train", "r2_test", "rmse_train", "rmse_test"] + (["mae_train", "mae_test"] if compute_mae else [])
+        return pd.DataFrame(columns=["features", "n_features", *metrics, "intercept", "coef"])
+    by_size = {}
+    for combo in wanted:
+        by_size.setdefault(len(combo), []).append(combo)
+
+    # satu pass -> statistik train & test
+    train_rows, test_rows = train_test_indices(len(X), test_size, random_state)
+    train = _stats_for_rows(X, y, train_rows, chunk_size)
+    test = _stats_for_rows(X, y, test_rows, chunk_size)
+
+    groups = []
+    for size in sorted(by_size):
+        combos = np.array(sorted(by_size[size]), dtype=np.intp)
+        coef, intercept = _solve_group(train, combos, alpha)
+        groups.append((combos, coef, intercept))
+
+    metrics = []
+    for combos, coef, intercept in groups:
+        sse_train = _sse(train, combos, coef, intercept)
+        sse_test = _sse(test, combos, coef, intercept)
+        metrics.append({
+            "r2_train": 1 - sse_train / train.Syy[0],
+            "r2_test": 1 - sse_test / test.Syy[0],
+            "rmse_train": np.sqrt(sse_train / train.n),
+            "rmse_test": np.sqrt(sse_test / test.n),
+        })
+
+    if compute_mae:
+        # MAE hanya untuk mae_top kombinasi terbaik (R² test), sisanya NaN
+        selected = [np.ones(len(combos), dtype=bool) for combos, _, _ in groups]
+        if mae_top is not None and mae_top < len(wanted):
+            # tepat mae_top kombinasi (kalau R² sama, argpartition pilih salah satu), NaN dianggap terburuk
+            r2_all = np.concatenate([m["r2_test"] for m in metrics])
+            r2_all = np.where(np.isnan(r2_all), -np.inf, r2_all)
+            best = np.argpartition(-r2_all, mae_top - 1)[:mae_top] if mae_top else np.empty(0, dtype=np.intp)
+            chosen = np.zeros(len(r2_all), dtype=bool)
+            chosen[best] = True
+            selected = np.split(chosen, np.cumsum([len(combos) for combos, _, _ in groups])[:-1])
+        subset = [(combos[mask], coef[mask], intercept[mask])
+                  for (combos, coef, intercept), mask in zip(groups, selected)]
+        abs_train = _absolute_errors(X, y, train_rows, subset, max_memory_mb)
+        abs_test = _absolute_errors(X, y, test_rows, subset, max_memory_mb)
+        for g, mask in enumerate(selected):
+            metrics[g]["mae_train"] = np.full(len(mask), np.nan)
+            metrics[g]["mae_test"] = np.full(len(mask), np.nan)
+            metrics[g]["mae_train"][mask] = abs_train[g] / train.n
+            metrics[g]["mae_test"][mask] = abs_test[g] / test.n
+
+    records = []
+    for (combos, coef, intercept), result in zip(groups, metrics):
+        for c, combo in enumerate(combos):
+            record = {"features": tuple(feature_names[j] for j in combo), "n_features": len(combo)}
+            record.update({metric: float(values[c]) for metric, values in result.items()})
+            record["intercept"] = float(intercept[c])
+            record["coef"] = tuple(coef[c])
+            records.append(record)
+
+    return pd.DataFrame(records).sort_values("r2_test", ascending=False, ignore_index=True)
+
+
+# ========== BENCHMARK ==========
+
+def make_youtube_like(n_rows=100_000, n_extra=20, seed=42):
+    """data sintetis mirip dataset youtube : like, comment, umur video + fitur lain (kebanyakan noise)"""
+    rng = np.random.default_rng(seed)
+    like = rng.lognormal(7, 1.5, n_rows)
+    comment = like * rng.uniform(0.02, 0.08, n_rows)
+    age = rng.integers(1, 365, n_rows).astype(float)
+    extra = rng.normal(size=(n_rows, n_extra))
+    views = 25 * like + 80 * comment + 150 * age + extra[:, :3] @ [5000, -3000, 1000] + rng.normal(0, 20_000, n_rows)
+    names = ["like_count", "comment_count", "video_age_days"] + [f"feature_{j}" for j in range(n_extra)]
+    return np.column_stack([like, comment, age, extra]), views, names
+
+
+def benchmark(n_rows=100_000, n_extra=20, max_size=2, seed=42):
+    """sweep vs loop split + LinearRegression().fit per kombinasi (cara notebook)"""
+    from sklearn.linear_model import LinearRegression
+    from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+    from sklearn.model_selection import train_test_split
+
+    X, y, names = make_youtube_like(n_rows, n_extra, seed)
+
+    start = time.perf_counter()
+    results = regression_sweep(X, y, names, max_size=max_size)
+    sweep_s = time.perf_counter() - start
+
+    # cara notebook untuk sebagian kombinasi, lalu ekstrapolasi
+    sample = results.sample(min(len(results), 50), random_state=seed)
+    start = time.perf_counter()
+    max_diff = 0.0
+    for _, row in sample.iterrows():
+        cols = [names.index(f) for f in row["features"]]
+        X_train, X_test, y_train, y_test = train_test_split(X[:, cols], y, test_size=0.2, random_state=42)
+        reg = LinearRegression().fit(X_train, y_train)
+        pred = reg.predict(X_test)
+        expected = (r2_score(y_test, pred), np.sqrt(mean_squared_error(y_test, pred)),
+                    mean_absolute_error(y_test, pred))
+        got = (row["r2_test"], row["rmse_test"], row["mae_test"])
+        max_diff = max(max_diff, max(abs(e - g) / max(abs(e), 1e-12) for e, g in zip(expected, got)))
+    loop_s = (time.perf_counter() - start) / len(sample) * len(results)
+
+    print(f"{len(results)} kombinasi, {n_rows} baris, {X.shape[1]} fitur")
+    print(f"sweep                : {sweep_s:8.2f}s")
+    print(f"loop fit (estimasi)  : {loop_s:8.2f}s  ({loop_s / sweep_s:.0f}x)")
+    print(f"selisih relatif maks : {max_diff:.2e}")
+    print(results.head(10)[["features", "r2_train", "r2_test", "rmse_test", "mae_test"]].to_string())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Regression sweep semua kombinasi fitur")
+    parser.add_argument("--csv", help="path dataset (misal youtube_recommendation_dataset.csv)")
+    parser.add_argument("--target", default="view_count")
+    parser.add_argument("--rows", type=int, default=100_000, help="jumlah baris data sintetis")
+    parser.add_argument("--features", type=int, default=20, help="jumlah fitur tambahan data sintetis")
+    parser.add_argument("--max-size", type=int, default=2)
+    args = parser.parse_args()
+
+    if args.csv:
+        df = pd.read_csv(args.csv).dropna()
+        features = [c for c in df.select_dtypes("number").columns if c != args.target]
+        results = regression_sweep(df[features].values, df[args.target].values, features, max_size=args.max_size)
+        print(results.drop(columns=["coef"]).head(20).to_string())
+    else:
+        benchmark(args.rows, args.features, args.max_size)
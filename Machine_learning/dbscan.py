@@ -0,0 +1,570 @@
+# ========================================
+# DBSCAN CLUSTERING - MODULE
+# ========================================
+# versi module dari DBSCAN.ipynb, tapi algoritma DBSCAN ditulis sendiri (NumPy)
+# bukan memanggil sklearn.cluster.DBSCAN
+#
+# cara kerja :
+# - grid index : ruang dibagi jadi sel berukuran eps, titik di sort berdasarkan sel
+#   -> tetangga sebuah titik pasti ada di sel sendiri atau sel sebelahnya (3^d sel)
+# - region query dikerjakan per chunk titik (vectorized), chunk bisa paralel (n_jobs)
+# - cluster = connected component antar core point (hooking + pointer jumping)
+# - memory_bounded=True : pasangan tetangga tidak disimpan, dihitung ulang di pass kedua
+#   -> memory hanya sebesar satu chunk, cocok untuk jutaan titik 2D/3D
+#
+# grid index efektif untuk dimensi rendah (2D/3D), untuk dimensi tinggi jumlah sel
+# tetangga (3^d) meledak
+#
+# contoh :
+#   from dbscan import DBSCAN, perform_dbscan
+#   labels = DBSCAN(eps=0.3, min_samples=5).fit_predict(X_scaled)
+#
+# benchmark vs sklearn :
+#   python dbscan.py --sizes 10000 100000 1000000
+# benchmark parameter sweep (experiment_parameters) :
+#   python dbscan.py --sweep --sizes 100000 --data moons
+
+import argparse
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+
+# ========== GRID INDEX ==========
+
+class GridIndex:
+    """
+    spatial hash grid dengan ukuran sel = eps
+    titik disimpan urut berdasarkan key sel supaya isi satu sel = slice contiguous
+    """
+
+    def __init__(self, X, eps):
+        self.eps = eps
+        X = np.asarray(X, dtype=float)
+        n, d = X.shape
+
+        cells = np.floor((X - X.min(axis=0)) / eps).astype(np.int64) + 1
+        # +3 : padding supaya sel tetangga (-1 / +1) tidak "wrap" ke baris lain
+        shape = cells.max(axis=0) + 3
+        if np.prod(shape.astype(float)) >= 2 ** 62:
+            raise ValueError("eps terlalu kecil untuk grid index (jumlah sel melebihi int64)")
+
+        # key sel = mixed radix dari koordinat sel
+        strides = np.ones(d, dtype=np.int64)
+        for dim in range(d - 2, -1, -1):
+            strides[dim] = strides[dim + 1] * shape[dim + 1]
+        keys = cells @ strides
+
+        self.order = np.argsort(keys, kind="stable")      # posisi sorted -> index asli
+        self.points = X[self.order]
+        self.keys = keys[self.order]
+        self.cell_keys, self.cell_start, cell_count = np.unique(
+            self.keys, return_index=True, return_counts=True)
+        self.cell_end = self.cell_start + cell_count
+        self.row_cell_end = np.repeat(self.cell_end, cell_count)   # akhir sel untuk setiap titik
+
+        # selisih key untuk sel tetangga : cukup setengahnya (delta >= 0) karena jarak simetris,
+        # sel dengan key lebih besar pasti ada di posisi sorted yang lebih besar
+        offsets = np.stack(np.meshgrid(*[[-1, 0, 1]] * d, indexing="ij"), -1).reshape(-1, d)
+        key_offsets = offsets @ strides
+        self.key_offsets = np.sort(key_offsets[key_offsets >= 0])
+        # koordinat per kolom (contiguous) -> gather lebih cepat dibanding points[rows]
+        self.columns = [np.ascontiguousarray(self.points[:, dim]) for dim in range(d)]
+
+    def __len__(self):
+        return len(self.points)
+
+    def neighbor_pairs(self, start, end, return_distance=False):
+        """
+        region query untuk titik sorted[start:end]
+        Returns : (rows, cols) pasangan posisi sorted dengan jarak <= eps dan rows < cols
+                  (setiap pasangan hanya sekali, diri sendiri tidak termasuk)
+                  + jarak tiap pasangan kalau return_distance=True
+        """
+        rows = np.arange(start, end)
+        keys = self.keys[start:end]
+
+        # kandidat : titik di sel tetangga -> (query_row, range_start, range_len)
+        query_rows, range_start, range_len = [], [], []
+        for delta in self.key_offsets:
+            if delta == 0:
+                # sel sendiri : hanya titik setelah row ini
+                query_rows.append(rows)
+                range_start.append(rows + 1)
+                range_len.append(self.row_cell_end[start:end] - rows - 1)
+                continue
+            target = keys + delta
+            pos = np.searchsorted(self.cell_keys, target)
+            pos = np.minimum(pos, len(self.cell_keys) - 1)
+            found = self.cell_keys[pos] == target
+            query_rows.append(rows[found])
+            range_start.append(self.cell_start[pos[found]])
+            range_len.append(self.cell_end[pos[found]] - self.cell_start[pos[found]])
+        query_rows = np.concatenate(query_rows)
+        range_start = np.concatenate(range_start)
+        range_len = np.concatenate(range_len)
+
+        # expand range jadi pasangan (query, kandidat) tanpa loop python
+        total = int(range_len.sum())
+        first = np.cumsum(range_len) - range_len
+        cand_rows = np.repeat(query_rows, range_len)
+        cand_cols = np.arange(total) - np.repeat(first - range_start, range_len)
+
+        dist_sq = np.zeros(total)
+        for column in self.columns:
+            diff = column[cand_rows]
+            diff -= column[cand_cols]
+            diff *= diff
+            dist_sq += diff
+        close = dist_sq <= self.eps * self.eps
+        if return_distance:
+            return cand_rows[close], cand_cols[close], np.sqrt(dist_sq[close])
+        return cand_rows[close], cand_cols[close]
+
+
+# ========== CONNECTED COMPONENTS ==========
+
+def _find(parent, nodes):
+    """root dari setiap node, sekalian path compression untuk node yang ditanya"""
+    roots = parent[nodes]
+    while True:
+        up = parent[roots]
+        if np.array_equal(up, roots):
+            break
+        roots = up
+    parent[nodes] = roots
+    return roots
+
+
+def _link(parent, src, dst):
+    """
+    gabungkan komponen src dan dst : root yang lebih besar di hook ke root terkecil
+    diulang sampai semua pasangan punya root yang sama
+    (parent selalu menunjuk ke index lebih kecil -> tidak mungkin ada cycle)
+    """
+    while len(src):
+        if len(src) >= len(parent):
+            # banyak pasangan : lebih murah compress seluruh parent sekali (pointer jumping)
+            _find(parent, np.arange(len(parent)))
+            root_src, root_dst = parent[src], parent[dst]
+        else:
+            root_src, root_dst = _find(parent, src), _find(parent, dst)
+        differ = root_src != root_dst
+        if not differ.any():
+            break
+        src, dst = src[differ], dst[differ]
+        root_src, root_dst = root_src[differ], root_dst[differ]
+        np.minimum.at(parent, np.maximum(root_src, root_dst), np.minimum(root_src, root_dst))
+
+
+# ========== DBSCAN ==========
+
+def _map_chunks(n, func, chunk_size, n_jobs=1):
+    """jalankan func(start, end) untuk setiap chunk [0, n), hasil urut sesuai chunk"""
+    bounds = [(start, min(start + chunk_size, n)) for start in range(0, n, chunk_size)]
+    if n_jobs == 1:
+        for start, end in bounds:
+            yield func(start, end)
+        return
+
+    # maksimal 2 * n_jobs chunk sekaligus, supaya memory tetap terbatas
+    with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+        pending = deque()
+        for start, end in bounds:
+            pending.append(executor.submit(func, start, end))
+            if len(pending) >= 2 * n_jobs:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _assign_clusters(is_core, pairs, order, parent=None):
+    """
+    dari core mask + pasangan tetangga (posisi sorted) -> (labels, core_sample_indices)
+    - core point yang bertetangga digabung jadi satu cluster
+      (kalau parent diberikan, core point dianggap sudah di link, dipakai dbscan_sweep)
+    - border point ikut cluster core tetangga dengan index asli terkecil
+      (tidak tergantung urutan grid, jadi hasil sama untuk eps grid berbeda)
+    - label dikembalikan ke urutan data asli, dirapikan jadi 0,1,2,...
+    """
+    n = len(is_core)
+    linked = parent is not None
+    parent = parent.copy() if linked else np.arange(n)
+    border_core = np.full(n, n, dtype=np.int64)   # index asli core tetangga, n = belum ada
+    for rows, cols in pairs:
+        core_rows, core_cols = is_core[rows], is_core[cols]
+        if not linked:
+            core_edge = core_rows & core_cols
+            _link(parent, rows[core_edge], cols[core_edge])
+        # pasangan hanya sekali -> border bisa di sisi rows atau cols
+        border_edge = core_cols & ~core_rows
+        np.minimum.at(border_core, rows[border_edge], order[cols[border_edge]])
+        border_edge = core_rows & ~core_cols
+        np.minimum.at(border_core, cols[border_edge], order[rows[border_edge]])
+
+    position = np.empty(n, dtype=np.int64)        # index asli -> posisi sorted
+    position[order] = np.arange(n)
+
+    parent = _find(parent, np.arange(n))
+    sorted_labels = np.full(n, -1, dtype=np.int64)
+    sorted_labels[is_core] = parent[is_core]
+    is_border = border_core < n
+    sorted_labels[is_border] = parent[position[border_core[is_border]]]
+
+    labels = np.empty(n, dtype=np.int64)
+    labels[order] = sorted_labels
+
+    # rapikan label jadi 0,1,2,... sesuai urutan kemunculan di data asli
+    clustered = labels >= 0
+    roots, first_seen, inverse = np.unique(labels[clustered], return_index=True, return_inverse=True)
+    rank = np.empty(len(roots), dtype=np.int64)
+    rank[np.argsort(first_seen)] = np.arange(len(roots))
+    labels[clustered] = rank[inverse]
+
+    core_mask = np.empty(n, dtype=bool)
+    core_mask[order] = is_core
+    return labels, np.flatnonzero(core_mask)
+
+
+class DBSCAN:
+    """
+    DBSCAN berbasis grid index, API mirip sklearn.cluster.DBSCAN
+    (fit / fit_predict, labels_, core_sample_indices_)
+
+    Parameters :
+    - eps            : jarak maksimum antara 2 titik agar dianggap tetangga
+    - min_samples    : jumlah minimum titik dalam radius eps (termasuk titik itu sendiri)
+    - chunk_size     : jumlah titik per region query chunk
+    - n_jobs         : jumlah thread untuk region query
+    - memory_bounded : True -> pasangan tetangga tidak disimpan (dihitung ulang di pass 2)
+
+    border point (bukan core tapi dekat core) ikut cluster dari core point tetangga
+    dengan index terkecil, jadi bisa beda dengan sklearn untuk border point yang
+    berada di antara 2 cluster (core point dan noise selalu sama)
+    """
+
+    def __init__(self, eps=0.5, min_samples=5, chunk_size=20_000, n_jobs=1, memory_bounded=False):
+        self.eps = eps
+        self.min_samples = min_samples
+        self.chunk_size = chunk_size
+        self.n_jobs = n_jobs
+        self.memory_bounded = memory_bounded
+
+    def fit(self, X):
+        X = np.asarray(X, dtype=float)
+        n = len(X)
+        grid = GridIndex(X, self.eps)
+
+        def chunks():
+            return _map_chunks(len(grid), grid.neighbor_pairs, self.chunk_size, self.n_jobs)
+
+        # PASS 1 : hitung jumlah tetangga -> core point
+        cached_pairs = []
+        n_neighbors = np.ones(n, dtype=np.int64)        # titik itu sendiri ikut dihitung
+        for rows, cols in chunks():
+            n_neighbors += np.bincount(rows, minlength=n)
+            n_neighbors += np.bincount(cols, minlength=n)
+            if not self.memory_bounded:
+                cached_pairs.append((rows, cols))
+        is_core = n_neighbors >= self.min_samples
+
+        # PASS 2 : gabungkan core point (pasangan dari cache atau dihitung ulang)
+        pairs = chunks() if self.memory_bounded else cached_pairs
+        self.labels_, self.core_sample_indices_ = _assign_clusters(is_core, pairs, grid.order)
+        return self
+
+    def fit_predict(self, X):
+        return self.fit(X).labels_
+
+
+# ========== PARAMETER SWEEP ==========
+
+def dbscan_sweep(X, eps_values, min_samples_values, chunk_size=20_000, n_jobs=1):
+    """
+    DBSCAN untuk semua kombinasi (eps, min_samples) dengan satu kali region query
+
+    - grid index + pasangan tetangga dihitung sekali di eps terbesar (beserta jaraknya)
+    - pasangan dikelompokkan berdasarkan jarak -> tetangga untuk eps lebih kecil = prefix
+    - jumlah tetangga per eps dihitung sekali, setiap min_samples cukup threshold ulang
+    - per min_samples, eps di proses dari kecil ke besar : cluster eps kecil hanya bisa
+      bergabung di eps besar, jadi union-find diteruskan dan hanya edge baru yang di link
+    hasilnya sama persis dengan DBSCAN(eps, min_samples).fit per kombinasi
+
+    X sebaiknya sudah di scale (lihat standard_scale), sweep tidak scaling ulang
+
+    Returns :
+    - dict {(eps, min_samples): labels}
+    """
+    X = np.asarray(X, dtype=float)
+    n = len(X)
+    grid = GridIndex(X, max(eps_values))
+
+    def query(start, end):
+        return grid.neighbor_pairs(start, end, return_distance=True)
+
+    chunks = list(_map_chunks(n, query, chunk_size, n_jobs))
+    rows = np.concatenate([c[0] for c in chunks])
+    cols = np.concatenate([c[1] for c in chunks])
+    dist = np.concatenate([c[2] for c in chunks])
+    del chunks
+
+    # tidak perlu sort penuh berdasarkan jarak, cukup kelompokkan per eps
+    # (bucket = eps terkecil yang mencakup pasangan ini, stable sort int kecil = radix sort)
+    # dtype terkecil yang muat 0..len(eps) -> uint8 sampai 255 eps, tidak wrap kalau eps lebih banyak
+    eps_sorted = sorted(eps_values)
+    bucket = np.searchsorted(np.asarray(eps_sorted), dist, side="left")
+    bucket = bucket.astype(np.min_scalar_type(len(eps_sorted)))
+    by_bucket = np.argsort(bucket, kind="stable")
+    rows, cols = rows[by_bucket], cols[by_bucket]
+    bucket_end = np.cumsum(np.bincount(bucket, minlength=len(eps_sorted)))
+    n_pairs = {eps: bucket_end[i] for i, eps in enumerate(eps_sorted)}
+    del dist, bucket, by_bucket
+    n_neighbors = {eps: 1 + np.bincount(rows[:n_pairs[eps]], minlength=n)
+                   + np.bincount(cols[:n_pairs[eps]], minlength=n) for eps in eps_sorted}
+
+    results = {}
+    for min_samples in min_samples_values:
+        parent = np.arange(n)
+        was_core = np.zeros(n, dtype=bool)
+        n_linked = 0
+        for eps in eps_sorted:
+            eps_rows, eps_cols = rows[:n_pairs[eps]], cols[:n_pairs[eps]]
+            is_core = n_neighbors[eps] >= min_samples
+
+            # edge core-core yang belum di link di eps sebelumnya :
+            # semua pasangan baru + pasangan lama yang salah satu titiknya baru jadi core
+            core_edge = is_core[eps_rows] & is_core[eps_cols]
+            core_edge[:n_linked] &= ~(was_core[eps_rows[:n_linked]] & was_core[eps_cols[:n_linked]])
+            _link(parent, eps_rows[core_edge], eps_cols[core_edge])
+            was_core, n_linked = is_core, len(eps_rows)
+
+            labels, _ = _assign_clusters(is_core, [(eps_rows, eps_cols)], grid.order, parent)
+            results[(eps, min_samples)] = labels
+
+    return results
+
+
+# ========== HELPER (VERSI NOTEBOOK, SUDAH DIPERBAIKI) ==========
+
+def standard_scale(X):
+    """sama seperti StandardScaler().fit_transform(X) tanpa sklearn"""
+    X = np.asarray(X, dtype=float)
+    std = X.std(axis=0)
+    std[std == 0] = 1.0
+    return (X - X.mean(axis=0)) / std
+
+
+def generate_sample_data(data_type='moons', n_samples=300, random_state=42):
+    """
+    membuat data sampel untuk clustering
+
+    Parameters :
+    - data_type : 'moons', 'circles', 'blobs', atau 'mixed' (blob + noise)
+    - n_samples : jumlah titik (default 300 seperti notebook, bisa di scale up untuk benchmark)
+
+    Returns :
+    - X: array data 2D
+    """
+    from sklearn.datasets import make_blobs, make_circles, make_moons
+
+    if data_type == 'moons':
+        X, _ = make_moons(n_samples=n_samples, noise=0.05, random_state=random_state)
+    elif data_type == 'circles':
+        X, _ = make_circles(n_samples=n_samples, noise=0.05, factor=0.5, random_state=random_state)
+    elif data_type == 'blobs':
+        X, _ = make_blobs(n_samples=n_samples, cluster_std=0.5, random_state=random_state)
+    elif data_type == 'mixed':
+        # perbandingan sama seperti notebook : 200 titik cluster + 50 noise
+        n_noise = n_samples // 5
+        X1, _ = make_blobs(n_samples=n_samples - n_noise, centers=2, cluster_std=0.4,
+                           random_state=random_state)
+        X2 = np.random.default_rng(random_state).uniform(-3, 3, (n_noise, 2))
+        X = np.vstack([X1, X2])
+    else:
+        raise ValueError(f"data_type tidak dikenal: {data_type}")
+    return X
+
+
+def perform_dbscan(X, eps=0.3, min_samples=5, verbose=True, **kwargs):
+    """
+    normalisasi data lalu clustering dengan DBSCAN (module ini)
+
+    Returns :
+    - labels     : label cluster tiap titik, -1 = noise/outlier
+    - n_clusters : jumlah cluster yang ditemukan
+    - n_noise    : jumlah titik yang dianggap noise
+    """
+    labels = DBSCAN(eps=eps, min_samples=min_samples, **kwargs).fit_predict(standard_scale(X))
+
+    n_clusters = len(set(labels)) - (1 if -1 in labels else 0)
+    n_noise = int(np.sum(labels == -1))
+
+    if verbose:
+        print(f"\n{'=' * 60}")
+        print("HASIL CLUSTERING DBSCAN:")
+        print(f"{'=' * 60}")
+        print(f"Parameter eps (epsilon)     : {eps}")
+        print(f"Parameter min_samples       : {min_samples}")
+        print(f"Jumlah cluster              : {n_clusters}")
+        print(f"Jumlah noise                : {n_noise}")
+        print(f"Jumlah Total titik data     : {len(labels)}")
+
+    return labels, n_clusters, n_noise
+
+
+# nama lama di notebook (typo), tetap bisa dipanggil
+perfrom_dbscan = perform_dbscan
+
+
+def _scatter_clusters(ax, X, labels):
+    """plot setiap cluster dengan warna berbeda, noise hitam dengan marker 'x'"""
+    import matplotlib.pyplot as plt
+
+    unique_labels = sorted(set(labels))
+    colors = plt.cm.Spectral(np.linspace(0, 1, len(unique_labels)))
+    for k, col in zip(unique_labels, colors):
+        xy = X[labels == k]
+        if k == -1:
+            ax.scatter(xy[:, 0], xy[:, 1], c=[[0, 0, 0, 1]], marker='x', s=30, label='Noise/Outlier')
+        else:
+            ax.scatter(xy[:, 0], xy[:, 1], c=[col], marker='o', s=30, alpha=0.6,
+                       edgecolors='black', linewidths=0.5, label=f'Cluster {k}')
+
+
+def visualize_clustering(X, labels, title="DBSCAN CLUSTERING"):
+    """visualisasi hasil clustering (X : data original, labels : hasil DBSCAN)"""
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots(figsize=(10, 6))
+    _scatter_clusters(ax, np.asarray(X), np.asarray(labels))
+    ax.set_title(title, fontsize=14, fontweight='bold')
+    ax.set_xlabel('Features 1', fontsize=12)
+    ax.set_ylabel('Features 2', fontsize=12)
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+    plt.tight_layout()
+    plt.show()
+
+
+def experiment_parameters(X, eps_values=(0.2, 0.3, 0.5), min_samples_values=(3, 5, 10)):
+    """
+    Eksperimen dengan berbagai kombinasi parameter DBSCAN
+    untuk memahami pengaruh eps dan min_samples
+
+    scaling dan region query hanya sekali untuk semua kombinasi (lihat dbscan_sweep)
+    """
+    import matplotlib.pyplot as plt
+
+    X_scaled = standard_scale(X)
+    sweep = dbscan_sweep(X_scaled, eps_values, min_samples_values)
+
+    fig, axes = plt.subplots(len(eps_values), len(min_samples_values), figsize=(15, 12), squeeze=False)
+    fig.suptitle('Eksperimen Parameter DBSCAN', fontsize=14, fontweight='bold')
+
+    for i, eps in enumerate(eps_values):
+        for j, min_samp in enumerate(min_samples_values):
+            labels = sweep[(eps, min_samp)]
+            n_clusters = len(set(labels)) - (1 if -1 in labels else 0)
+            n_noise = int(np.sum(labels == -1))
+
+            ax = axes[i, j]
+            _scatter_clusters(ax, X_scaled, labels)
+            ax.set_title(f'eps={eps} min_samp={min_samp}\nCluster={n_clusters}, n_noise={n_noise}',
+                         fontsize=10, fontweight='bold')
+            ax.grid(True, alpha=0.3)
+    plt.tight_layout()
+    plt.show()
+
+
+# ========== BENCHMARK ==========
+
+def benchmark_dbscan(sizes=(10_000, 100_000, 1_000_000), data_types=('moons', 'circles', 'blobs', 'mixed'),
+                     eps=0.3, min_samples=5, n_jobs=1, sklearn_max=1_000_000):
+    """
+    bandingkan waktu fit DBSCAN module ini vs sklearn di data generate_sample_data yang di scale up
+
+    eps di kecilkan sebanding 1/sqrt(n) (data 2D) supaya rata2 jumlah tetangga per titik
+    sama seperti data asli 300 titik, kalau tidak setiap titik punya ribuan tetangga
+    """
+    from sklearn.cluster import DBSCAN as SklearnDBSCAN
+    from sklearn.metrics import adjusted_rand_score
+
+    rows = []
+    for data_type in data_types:
+        for n in sizes:
+            X = standard_scale(generate_sample_data(data_type, n))
+            eps_n = eps * np.sqrt(300 / n)
+            row = {"data": data_type, "n": n, "eps": eps_n}
+
+            for name, memory_bounded in (("grid", False), ("grid_bounded", True)):
+                start = time.perf_counter()
+                model = DBSCAN(eps_n, min_samples, n_jobs=n_jobs, memory_bounded=memory_bounded).fit(X)
+                row[f"{name}_s"] = time.perf_counter() - start
+            row["n_clusters"] = int(model.labels_.max() + 1)
+
+            if n <= sklearn_max:
+                start = time.perf_counter()
+                reference = SklearnDBSCAN(eps=eps_n, min_samples=min_samples, n_jobs=n_jobs).fit(X)
+                row["sklearn_s"] = time.perf_counter() - start
+                row["speedup"] = row["sklearn_s"] / row["grid_s"]
+                row["ari_vs_sklearn"] = adjusted_rand_score(reference.labels_, model.labels_)
+                row["same_core"] = bool(np.array_equal(reference.core_sample_indices_,
+                                                       model.core_sample_indices_))
+
+            rows.append(row)
+            sklearn_part = (f"sklearn {row['sklearn_s']:7.2f}s | speedup {row['speedup']:5.1f}x | "
+                            f"ARI {row['ari_vs_sklearn']:.4f}" if "sklearn_s" in row else "sklearn skipped")
+            print(f"{data_type:<8} n={n:>9,} | grid {row['grid_s']:7.2f}s | "
+                  f"bounded {row['grid_bounded_s']:7.2f}s | {sklearn_part}")
+
+    return rows
+
+
+def benchmark_sweep(n=100_000, data_type='moons', eps_values=(0.2, 0.3, 0.5),
+                    min_samples_values=(3, 5, 10), n_jobs=1):
+    """
+    grid eps x min_samples : sweep incremental vs DBSCAN penuh per kombinasi
+    (eps di scale 1/sqrt(n) sama seperti benchmark_dbscan)
+    """
+    X = generate_sample_data(data_type, n)
+    eps_values = [eps * np.sqrt(300 / n) for eps in eps_values]
+
+    # cara lama : scaling + DBSCAN penuh untuk setiap kombinasi
+    start = time.perf_counter()
+    separate = {}
+    for eps in eps_values:
+        for min_samples in min_samples_values:
+            separate[(eps, min_samples)] = DBSCAN(eps, min_samples, n_jobs=n_jobs).fit_predict(standard_scale(X))
+    separate_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    sweep = dbscan_sweep(standard_scale(X), eps_values, min_samples_values, n_jobs=n_jobs)
+    sweep_s = time.perf_counter() - start
+
+    identical = all(np.array_equal(separate[key], sweep[key]) for key in separate)
+    print(f"{data_type} n={n:,} grid {len(eps_values)}x{len(min_samples_values)} | "
+          f"per kombinasi {separate_s:.2f}s | sweep {sweep_s:.2f}s | "
+          f"speedup {separate_s / sweep_s:.1f}x | identik {identical}")
+    return {"separate_s": separate_s, "sweep_s": sweep_s, "identical": identical}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark DBSCAN grid index vs sklearn")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--data", nargs="+", default=['moons', 'circles', 'blobs', 'mixed'],
+                        choices=['moons', 'circles', 'blobs', 'mixed'])
+    parser.add_argument("--eps", type=float, default=0.3, help="eps untuk 300 titik (di scale sesuai n)")
+    parser.add_argument("--min-samples", type=int, default=5)
+    parser.add_argument("--n-jobs", type=int, default=1)
+    parser.add_argument("--sklearn-max", type=int, default=1_000_000,
+                        help="lewati sklearn untuk n lebih besar dari ini")
+    parser.add_argument("--sweep", action="store_true",
+                        help="benchmark parameter sweep (pakai sizes[0] dan data[0])")
+    args = parser.parse_args()
+
+    if args.sweep:
+        benchmark_sweep(args.sizes[0], args.data[0], n_jobs=args.n_jobs)
+    else:
+        benchmark_dbscan(args.sizes, args.data, args.eps, args.min_samples, args.n_jobs, args.sklearn_max)
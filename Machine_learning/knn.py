@@ -0,0 +1,569 @@
+# ========================================
+# K-NEAREST NEIGHBORS (KNN) - MODULE
+# ========================================
+# versi module dari KNN di k_nearest_neighbors_KNN.ipynb
+# perbedaan dengan versi notebook :
+# - jarak dihitung vectorized untuk banyak query sekaligus
+#   memakai trik ||a||² + ||b||² - 2ab (matrix multiplication), dipotong per chunk
+#   supaya memory tidak meledak
+# - top-k pakai np.argpartition (O(n)) bukan argsort penuh (O(n log n))
+# - opsional index KD-tree / ball-tree yang dibangun saat fit
+#   (cocok untuk data berdimensi rendah dengan jumlah titik besar)
+# - mode approximate 'ivf' (coarse quantizer k-means) dengan knob n_probe
+#   dan partial_fit untuk menambah titik tanpa build ulang
+#
+# contoh :
+#   from knn import KNN
+#   knn = KNN(k=3, algorithm="kd_tree").fit(X_train, y_train)
+#   y_pred = knn.predict(X_test)
+#
+# benchmark :
+#   python knn.py --sizes 10000 100000 1000000
+#   python knn.py --ann --sizes 200000 --features 16 -k 10
+
+import argparse
+import heapq
+import time
+from collections import Counter
+
+import numpy as np
+
+
+# ========== DISTANCE ENGINE (BRUTE FORCE, VECTORIZED) ==========
+
+def squared_norms(X):
+    """||x||² untuk setiap baris X"""
+    return np.einsum("ij,ij->i", X, X)
+
+
+def brute_kneighbors(X_train, Q, k, train_sq_norms=None, max_memory_mb=256):
+    """
+    cari k tetangga terdekat untuk setiap baris Q (brute force, vectorized)
+
+    jarak² = ||q||² + ||x||² - 2 q·x  -> satu matrix multiplication per chunk
+    jumlah query per chunk dibatasi supaya matrix jarak <= max_memory_mb
+
+    Returns :
+    - distances : (n_query, k) jarak euclidean, urut dari yang terdekat
+    - indices   : (n_query, k) index titik di X_train
+    """
+    n_train = len(X_train)
+    k = min(k, n_train)
+    if train_sq_norms is None:
+        train_sq_norms = squared_norms(X_train)
+
+    # 8 byte per elemen float64 di matrix jarak (chunk x n_train)
+    chunk_size = max(1, int(max_memory_mb * 1024 * 1024 // (8 * max(n_train, 1))))
+
+    distances = np.empty((len(Q), k))
+    indices = np.empty((len(Q), k), dtype=np.intp)
+
+    for start in range(0, len(Q), chunk_size):
+        q = Q[start:start + chunk_size]
+        d2 = q @ X_train.T
+        d2 *= -2
+        d2 += squared_norms(q)[:, None]
+        d2 += train_sq_norms[None, :]
+        np.maximum(d2, 0, out=d2)  # error floating point bisa bikin sedikit negatif
+
+        # argpartition : ambil k terkecil tanpa sort seluruh baris
+        if k < n_train:
+            part = np.argpartition(d2, k - 1, axis=1)[:, :k]
+        else:
+            part = np.broadcast_to(np.arange(n_train), (len(q), n_train))
+        part_d2 = np.take_along_axis(d2, part, axis=1)
+
+        # sort hanya k kandidat
+        order = np.argsort(part_d2, axis=1)
+        indices[start:start + len(q)] = np.take_along_axis(part, order, axis=1)
+        distances[start:start + len(q)] = np.sqrt(np.take_along_axis(part_d2, order, axis=1))
+
+    return distances, indices
+
+
+# ========== SPATIAL INDEX (KD-TREE / BALL-TREE) ==========
+
+class _SpatialTree:
+    """
+    base class KD-tree dan ball-tree
+    - data di urutkan ulang sekali saat build, setiap node = range [start, end)
+    - split di dimensi dengan sebaran terbesar, di median (np.argpartition)
+    - query best-first : node dikunjungi urut lower bound jarak, node yang
+      lower bound-nya lebih jauh dari tetangga ke-k di skip
+    - jarak di dalam leaf dihitung vectorized
+    child class hanya menentukan lower bound jarak query ke node
+    """
+
+    def __init__(self, X, leaf_size=40):
+        self.data = np.asarray(X, dtype=float)
+        self.leaf_size = max(1, leaf_size)
+        self.idx = np.arange(len(self.data))
+
+        # node disimpan sebagai list (start, end, left, right); left = -1 untuk leaf
+        self.nodes = []
+        self._init_bounds()
+        self._build(0, len(self.data))
+        self._finalize_bounds()
+
+    def _build(self, start, end):
+        node_id = len(self.nodes)
+        self.nodes.append([start, end, -1, -1])
+        points = self.data[self.idx[start:end]]
+        self._add_bounds(points)
+
+        if end - start > self.leaf_size:
+            spread = points.max(axis=0) - points.min(axis=0)
+            dim = int(np.argmax(spread))
+            if spread[dim] > 0:
+                mid = (end - start) // 2
+                order = np.argpartition(points[:, dim], mid)
+                self.idx[start:end] = self.idx[start:end][order]
+                self.nodes[node_id][2] = self._build(start, start + mid)
+                self.nodes[node_id][3] = self._build(start + mid, end)
+        return node_id
+
+    def query(self, Q, k):
+        """k tetangga terdekat untuk setiap baris Q : (distances, indices)"""
+        Q = np.atleast_2d(np.asarray(Q, dtype=float))
+        k = min(k, len(self.data))
+        distances = np.empty((len(Q), k))
+        indices = np.empty((len(Q), k), dtype=np.intp)
+        # data sudah urut sesuai tree -> leaf = slice yang contiguous
+        ordered = self.data[self.idx]
+
+        for row, q in enumerate(Q):
+            best_d2 = np.full(k, np.inf)
+            best_pos = np.full(k, -1, dtype=np.intp)
+            worst = np.inf
+            heap = [(0.0, 0)]
+
+            while heap:
+                bound, node_id = heapq.heappop(heap)
+                if bound >= worst:
+                    break   # semua node sisa lebih jauh dari tetangga ke-k
+                start, end, left, right = self.nodes[node_id]
+
+                if left == -1:
+                    diff = ordered[start:end] - q
+                    d2 = np.einsum("ij,ij->i", diff, diff)
+                    cand_d2 = np.concatenate([best_d2, d2])
+                    cand_pos = np.concatenate([best_pos, np.arange(start, end)])
+                    keep = np.argpartition(cand_d2, k - 1)[:k]
+                    best_d2, best_pos = cand_d2[keep], cand_pos[keep]
+                    worst = best_d2.max()
+                else:
+                    for child in (left, right):
+                        child_bound = self._lower_bound_sq(child, q)
+                        if child_bound < worst:
+                            heapq.heappush(heap, (child_bound, child))
+
+            order = np.argsort(best_d2)
+            distances[row] = np.sqrt(best_d2[order])
+            indices[row] = self.idx[best_pos[order]]
+
+        return distances, indices
+
+
+class KDTree(_SpatialTree):
+    """KD-tree : setiap node menyimpan bounding box (min & max per dimensi)"""
+
+    def _init_bounds(self):
+        self._lo, self._hi = [], []
+
+    def _add_bounds(self, points):
+        self._lo.append(points.min(axis=0))
+        self._hi.append(points.max(axis=0))
+
+    def _finalize_bounds(self):
+        self.lo, self.hi = np.array(self._lo), np.array(self._hi)
+        del self._lo, self._hi
+
+    def _lower_bound_sq(self, node_id, q):
+        # jarak² dari q ke kotak (0 kalau q di dalam kotak)
+        gap = np.maximum(self.lo[node_id] - q, 0) + np.maximum(q - self.hi[node_id], 0)
+        return float(gap @ gap)
+
+
+class BallTree(_SpatialTree):
+    """Ball-tree : setiap node menyimpan centroid dan radius"""
+
+    def _init_bounds(self):
+        self._centers, self._radius = [], []
+
+    def _add_bounds(self, points):
+        center = points.mean(axis=0)
+        diff = points - center
+        self._centers.append(center)
+        self._radius.append(np.sqrt(np.einsum("ij,ij->i", diff, diff).max()))
+
+    def _finalize_bounds(self):
+        self.centers, self.radius = np.array(self._centers), np.array(self._radius)
+        del self._centers, self._radius
+
+    def _lower_bound_sq(self, node_id, q):
+        diff = q - self.centers[node_id]
+        gap = max(np.sqrt(diff @ diff) - self.radius[node_id], 0.0)
+        return gap * gap
+
+
+# ========== APPROXIMATE INDEX (IVF) ==========
+
+class IVFIndex:
+    """
+    index approximate nearest neighbour ala IVF (inverted file)
+    - build : k-means kecil menghasilkan n_lists centroid (coarse quantizer),
+      setiap titik masuk ke list centroid terdekat
+    - query : hanya list dari n_probe centroid terdekat yang dicek
+      n_probe kecil = cepat tapi recall turun, n_probe = n_lists = exact
+    - add   : titik baru langsung masuk ke list centroid terdekat, tanpa rebuild
+      (centroid tidak di update, jadi kalau distribusi data bergeser jauh -> build ulang)
+    """
+
+    def __init__(self, n_lists=None, n_iter=10, sample_size=None, seed=0):
+        self.n_lists = n_lists
+        self.n_iter = n_iter
+        self.sample_size = sample_size
+        self.seed = seed
+
+    def build(self, X):
+        X = np.asarray(X, dtype=float)
+        rng = np.random.default_rng(self.seed)
+        # default sqrt(n) list -> rata2 sqrt(n) titik per list
+        n_lists = self.n_lists or max(1, int(np.sqrt(len(X))))
+        n_lists = min(n_lists, len(X))
+
+        # k-means (Lloyd) di sample saja, cukup untuk coarse quantizer
+        sample_size = min(len(X), self.sample_size or 64 * n_lists)
+        sample = X[rng.choice(len(X), sample_size, replace=False)]
+        centroids = sample[rng.choice(sample_size, n_lists, replace=False)].copy()
+        for _ in range(self.n_iter):
+            _, nearest = brute_kneighbors(centroids, sample, 1)
+            nearest = nearest[:, 0]
+            counts = np.bincount(nearest, minlength=n_lists)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, nearest, sample)
+            filled = counts > 0
+            centroids[filled] = sums[filled] / counts[filled, None]
+            # centroid kosong di isi ulang dengan titik acak
+            empty = np.flatnonzero(~filled)
+            centroids[empty] = sample[rng.choice(sample_size, len(empty), replace=False)]
+
+        self.centroids = centroids
+        self._centroid_sq_norms = squared_norms(centroids)
+        self._lists = [np.empty((0, X.shape[1])) for _ in range(n_lists)]
+        self._ids = [np.empty(0, dtype=np.intp) for _ in range(n_lists)]
+        self._sq_norms = [np.empty(0) for _ in range(n_lists)]
+        self._pending = {}
+        self.size = 0
+        self.add(X)
+        return self
+
+    def add(self, X):
+        """tambah titik baru, id melanjutkan dari titik terakhir"""
+        X = np.asarray(X, dtype=float)
+        _, nearest = brute_kneighbors(self.centroids, X, 1, self._centroid_sq_norms)
+        nearest = nearest[:, 0]
+        ids = np.arange(self.size, self.size + len(X))
+
+        # di tampung dulu, baru di concatenate saat query (add berkali2 tetap murah)
+        order = np.argsort(nearest, kind="stable")
+        bounds = np.searchsorted(nearest[order], np.arange(len(self.centroids) + 1))
+        for list_id in np.unique(nearest):
+            rows = order[bounds[list_id]:bounds[list_id + 1]]
+            self._pending.setdefault(list_id, []).append((X[rows], ids[rows]))
+
+        self.size += len(X)
+        return self
+
+    def _consolidate(self):
+        for list_id, chunks in self._pending.items():
+            self._lists[list_id] = np.concatenate([self._lists[list_id]] + [c[0] for c in chunks])
+            self._ids[list_id] = np.concatenate([self._ids[list_id]] + [c[1] for c in chunks])
+            self._sq_norms[list_id] = squared_norms(self._lists[list_id])
+        self._pending = {}
+
+    def query(self, Q, k, n_probe=8):
+        """
+        k tetangga (approximate) untuk setiap baris Q : (distances, indices)
+        loop per list (bukan per query) : semua query yang probe list yang sama
+        dihitung sekaligus dengan satu matrix multiplication
+        """
+        if self._pending:
+            self._consolidate()
+        Q = np.atleast_2d(np.asarray(Q, dtype=float))
+        n_probe = min(max(1, n_probe), len(self.centroids))
+
+        _, probes = brute_kneighbors(self.centroids, Q, n_probe, self._centroid_sq_norms)
+        q_sq = squared_norms(Q)
+
+        best_d2 = np.full((len(Q), k), np.inf)
+        best_ids = np.full((len(Q), k), -1, dtype=np.intp)
+
+        # kelompokkan query berdasarkan list yang di probe
+        flat_lists = probes.ravel()
+        flat_rows = np.repeat(np.arange(len(Q)), n_probe)
+        order = np.argsort(flat_lists, kind="stable")
+        bounds = np.searchsorted(flat_lists[order], np.arange(len(self.centroids) + 1))
+
+        for list_id in range(len(self.centroids)):
+            rows = flat_rows[order[bounds[list_id]:bounds[list_id + 1]]]
+            points = self._lists[list_id]
+            if len(rows) == 0 or len(points) == 0:
+                continue
+            d2 = Q[rows] @ points.T
+            d2 *= -2
+            d2 += q_sq[rows, None]
+            d2 += self._sq_norms[list_id][None, :]
+            np.maximum(d2, 0, out=d2)
+
+            cand_d2 = np.concatenate([best_d2[rows], d2], axis=1)
+            cand_ids = np.concatenate(
+                [best_ids[rows], np.broadcast_to(self._ids[list_id], d2.shape)], axis=1)
+            keep = np.argpartition(cand_d2, k - 1, axis=1)[:, :k]
+            best_d2[rows] = np.take_along_axis(cand_d2, keep, axis=1)
+            best_ids[rows] = np.take_along_axis(cand_ids, keep, axis=1)
+
+        order = np.argsort(best_d2, axis=1)
+        return (np.sqrt(np.take_along_axis(best_d2, order, axis=1)),
+                np.take_along_axis(best_ids, order, axis=1))
+
+
+# ========== KNN CLASSIFIER ==========
+
+class KNN:
+    def __init__(self, k=3, algorithm="brute", leaf_size=40, max_memory_mb=256,
+                 n_lists=None, n_probe=8, seed=0):
+        """
+        Inisialisasi KNN classifier
+        k: jumlah tetangga terdekat yang digunakan
+        algorithm: 'brute' (vectorized), 'kd_tree', 'ball_tree', atau 'ivf' (approximate)
+        leaf_size: jumlah titik maksimum per leaf (untuk tree)
+        max_memory_mb: batas memory matrix jarak per chunk (untuk brute)
+        n_lists: jumlah centroid IVF (default sqrt(n))
+        n_probe: jumlah list IVF yang dicek per query -> knob recall vs latency,
+                 boleh diubah setelah fit tanpa build ulang
+        """
+        if algorithm not in ("brute", "kd_tree", "ball_tree", "ivf"):
+            raise ValueError(f"algorithm tidak dikenal: {algorithm}")
+        self.k = k
+        self.algorithm = algorithm
+        self.leaf_size = leaf_size
+        self.max_memory_mb = max_memory_mb
+        self.n_lists = n_lists
+        self.n_probe = n_probe
+        self.seed = seed
+
+    def fit(self, X, y):
+        """
+        Menyimpan data training (dan membangun index kalau pakai tree)
+        X: fitur training data (array 2D)
+        y: label training data (array 1D)
+        """
+        self.X_train = np.asarray(X, dtype=float)
+        self.y_train = np.asarray(y)
+
+        # label di encode ke 0..n_class-1 supaya voting bisa vectorized
+        self.classes_, self._y_encoded = np.unique(self.y_train, return_inverse=True)
+
+        self._train_sq_norms = squared_norms(self.X_train)
+        self.tree_ = None
+        if self.algorithm == "kd_tree":
+            self.tree_ = KDTree(self.X_train, self.leaf_size)
+        elif self.algorithm == "ball_tree":
+            self.tree_ = BallTree(self.X_train, self.leaf_size)
+        elif self.algorithm == "ivf":
+            self.tree_ = IVFIndex(self.n_lists, seed=self.seed).build(self.X_train)
+        return self
+
+    def partial_fit(self, X, y):
+        """
+        Menambah data training tanpa membangun ulang index IVF
+        (brute cukup append, kd_tree / ball_tree tetap di build ulang)
+        """
+        if not hasattr(self, "X_train"):
+            return self.fit(X, y)
+
+        X = np.asarray(X, dtype=float)
+        self.X_train = np.concatenate([self.X_train, X])
+        self.y_train = np.concatenate([self.y_train, np.asarray(y)])
+        self.classes_, self._y_encoded = np.unique(self.y_train, return_inverse=True)
+        self._train_sq_norms = np.concatenate([self._train_sq_norms, squared_norms(X)])
+
+        if self.algorithm == "ivf":
+            self.tree_.add(X)
+        elif self.tree_ is not None:
+            self.tree_ = type(self.tree_)(self.X_train, self.leaf_size)
+        return self
+
+    def euclidean_distance(self, x1, x2):
+        """
+        Menghitung jarak Euclidean antara dua titik
+        """
+        return np.sqrt(np.sum((x1 - x2) ** 2))
+
+    def kneighbors(self, X, k=None):
+        """
+        cari k tetangga terdekat untuk setiap baris X
+        Returns : (distances, indices), masing-masing shape (n_query, k)
+        """
+        X = np.atleast_2d(np.asarray(X, dtype=float))
+        k = self.k if k is None else k
+        if self.algorithm == "ivf":
+            # list yang di probe bisa berisi < k titik -> sisa index -1, jarak inf
+            return self.tree_.query(X, k, self.n_probe)
+        if self.tree_ is not None:
+            return self.tree_.query(X, k)
+        return brute_kneighbors(self.X_train, X, k, self._train_sq_norms, self.max_memory_mb)
+
+    def predict(self, X):
+        """
+        Memprediksi label untuk data baru
+        X: data yang akan diprediksi (array 2D)
+        """
+        _, indices = self.kneighbors(X)
+        valid = indices >= 0                                 # -1 = tetangga tidak ditemukan (ivf)
+        neighbor_labels = self._y_encoded[np.where(valid, indices, 0)]   # (n_query, k)
+        n_query, k = neighbor_labels.shape
+        rows = np.arange(n_query)[:, None]
+
+        # voting : hitung jumlah tiap label
+        votes = np.zeros((n_query, len(self.classes_)), dtype=np.int64)
+        np.add.at(votes, (np.broadcast_to(rows, neighbor_labels.shape), neighbor_labels), valid.astype(np.int64))
+
+        # seri -> pilih label yang muncul paling dekat (sama seperti Counter.most_common)
+        first_rank = np.full_like(votes, k)
+        for rank in range(k - 1, -1, -1):
+            hit = valid[:, rank]
+            first_rank[rows[hit, 0], neighbor_labels[hit, rank]] = rank
+        score = votes * (k + 1) - first_rank
+
+        return self.classes_[np.argmax(score, axis=1)]
+
+
+class KNNLoop:
+    """
+    versi asli dari notebook (loop python per titik) - hanya untuk pembanding benchmark
+    """
+
+    def __init__(self, k=3):
+        self.k = k
+
+    def fit(self, X, y):
+        self.X_train = X
+        self.y_train = y
+        return self
+
+    def euclidean_distance(self, x1, x2):
+        return np.sqrt(np.sum((x1 - x2) ** 2))
+
+    def predict(self, X):
+        return np.array([self._predict_single(x) for x in X])
+
+    def _predict_single(self, x):
+        distances = [self.euclidean_distance(x, x_train) for x_train in self.X_train]
+        k_indices = np.argsort(distances)[:self.k]
+        k_nearest_labels = [self.y_train[i] for i in k_indices]
+        return Counter(k_nearest_labels).most_common(1)[0][0]
+
+
+# ========== BENCHMARK ==========
+
+def _time_per_query(model, X_query):
+    start = time.perf_counter()
+    y_pred = model.predict(X_query)
+    return (time.perf_counter() - start) / len(X_query), y_pred
+
+
+def benchmark_knn(sizes=(10_000, 100_000, 1_000_000), n_features=2, n_queries=1000,
+                  loop_queries=5, k=5, seed=42):
+    """
+    bandingkan waktu per query : loop asli vs brute vectorized vs kd-tree vs ball-tree
+    loop asli hanya dijalankan untuk loop_queries query (terlalu lambat untuk banyak query)
+    """
+    rng = np.random.default_rng(seed)
+    rows = []
+
+    for n in sizes:
+        X_train = rng.normal(size=(n, n_features))
+        y_train = (X_train[:, 0] + 0.5 * rng.normal(size=n) > 0).astype(int)
+        X_query = rng.normal(size=(n_queries, n_features))
+
+        loop_time, loop_pred = _time_per_query(KNNLoop(k).fit(X_train, y_train), X_query[:loop_queries])
+        row = {"n_train": n, "loop_ms_per_query": loop_time * 1000}
+
+        for algorithm in ("brute", "kd_tree", "ball_tree"):
+            start = time.perf_counter()
+            model = KNN(k, algorithm=algorithm).fit(X_train, y_train)
+            fit_time = time.perf_counter() - start
+
+            per_query, y_pred = _time_per_query(model, X_query)
+            row[f"{algorithm}_fit_s"] = fit_time
+            row[f"{algorithm}_ms_per_query"] = per_query * 1000
+            row[f"{algorithm}_speedup"] = loop_time / per_query
+            row[f"{algorithm}_match_loop"] = bool(np.array_equal(y_pred[:loop_queries], loop_pred))
+
+        rows.append(row)
+        print(f"n={n:>9,} | loop {row['loop_ms_per_query']:9.3f} ms/q | "
+              f"brute {row['brute_ms_per_query']:8.4f} ms/q ({row['brute_speedup']:7.0f}x) | "
+              f"kd {row['kd_tree_ms_per_query']:8.4f} ms/q ({row['kd_tree_speedup']:7.0f}x) | "
+              f"ball {row['ball_tree_ms_per_query']:8.4f} ms/q ({row['ball_tree_speedup']:7.0f}x)")
+
+    return rows
+
+
+def recall_at_k(approx_indices, exact_indices):
+    """rata2 fraksi tetangga exact yang juga ditemukan oleh approximate search"""
+    hits = [len(np.intersect1d(a, e)) for a, e in zip(approx_indices, exact_indices)]
+    return float(np.mean(hits)) / exact_indices.shape[1]
+
+
+def benchmark_ann(n=200_000, n_features=16, n_queries=1000, k=10,
+                  n_probes=(1, 2, 4, 8, 16, 32), n_clusters=50, seed=42):
+    """
+    recall@k dan queries/sec IVF untuk beberapa n_probe, dibanding exact brute force
+    data dibuat dari gaussian cluster (lebih mirip data asli dibanding noise uniform)
+    """
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(scale=5.0, size=(n_clusters, n_features))
+    X_train = centers[rng.integers(0, n_clusters, n)] + rng.normal(size=(n, n_features))
+    y_train = rng.integers(0, 2, n)
+    X_query = centers[rng.integers(0, n_clusters, n_queries)] + rng.normal(size=(n_queries, n_features))
+
+    exact = KNN(k, algorithm="brute").fit(X_train, y_train)
+    start = time.perf_counter()
+    _, exact_indices = exact.kneighbors(X_query)
+    exact_qps = n_queries / (time.perf_counter() - start)
+    print(f"exact brute  | recall@{k} 1.000 | {exact_qps:10,.0f} q/s")
+
+    start = time.perf_counter()
+    model = KNN(k, algorithm="ivf", seed=seed).fit(X_train, y_train)
+    print(f"ivf build    | {time.perf_counter() - start:.2f}s ({len(model.tree_.centroids)} lists)")
+
+    rows = [{"n_probe": None, "recall": 1.0, "queries_per_sec": exact_qps}]
+    for n_probe in n_probes:
+        model.n_probe = n_probe
+        start = time.perf_counter()
+        _, approx_indices = model.kneighbors(X_query)
+        qps = n_queries / (time.perf_counter() - start)
+        recall = recall_at_k(approx_indices, exact_indices)
+        rows.append({"n_probe": n_probe, "recall": recall, "queries_per_sec": qps})
+        print(f"ivf probe={n_probe:<3}| recall@{k} {recall:.3f} | {qps:10,.0f} q/s")
+
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark KNN loop vs vectorized vs tree index")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--features", type=int, default=2)
+    parser.add_argument("--queries", type=int, default=1000)
+    parser.add_argument("--loop-queries", type=int, default=5)
+    parser.add_argument("-k", type=int, default=5)
+    parser.add_argument("--ann", action="store_true",
+                        help="benchmark approximate (IVF) : recall@k vs queries/sec, pakai sizes[0] titik")
+    args = parser.parse_args()
+
+    if args.ann:
+        benchmark_ann(args.sizes[0], args.features, args.queries, args.k)
+    else:
+        benchmark_knn(args.sizes, args.features, args.queries, args.loop_queries, args.k)
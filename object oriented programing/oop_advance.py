@@ -6,17 +6,30 @@ AI ASSISTANT MANAGER - OOP LEVEL LANJUTAN
 project ini mendemonstrasikan :
 1. interface ( Abstract Base Class)
 2. SOLID principles
-3. Design Pattern ( Factory, Strategy, Observer )
+3. Design Pattern ( Factory, Strategy, Observer, Decorator )
 4. integrasi dengan gemini AI API
 5. Error handling & logging
+6. Async / concurrent request (asyncio)
 """
 from dotenv import load_dotenv
 import os
 import google.generativeai as genai
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional
+from typing import Any, Callable, Iterator, List, Dict, Optional
 from datetime import datetime
+from collections import OrderedDict, deque
+import asyncio
+import atexit
+import bisect
+import concurrent.futures
+import hashlib
 import json
+import queue
+import random
+import sqlite3
+import threading
+import itertools
+import time
 import warnings
 warnings.filterwarnings("ignore", category=UserWarning)
 
@@ -48,17 +61,116 @@ class AIProviderInterface(ABC):
         """cek apakah provider available"""
         pass
 
+    def generate_batch(self, prompts: List[str]) -> List[str]:
+        """
+        Generate response untuk banyak prompt dalam satu panggilan
+        default: loop generate_response, provider dengan batch api override ini
+        """
+        return [self.generate_response(prompt) for prompt in prompts]
+
+    def stream_response(self, prompt: str) -> Iterator[str]:
+        """
+        Generate response sebagai potongan (chunk)
+        default: satu chunk berisi seluruh response, provider yang support
+        streaming override method ini
+        """
+        yield self.generate_response(prompt)
+
+    def warm_up(self):
+        """Hook opsional: siapkan client sebelum request pertama"""
+        pass
+
+    def health_check(self) -> bool:
+        """Hook opsional: cek koneksi ke provider, default = is_available()"""
+        return self.is_available()
+
+
+class AsyncAIProviderInterface(AIProviderInterface):
+    """
+    Varian asyncio dari AIProviderInterface
+    provider yang implement ini bisa dipanggil concurrent tanpa thread
+    provider sync biasa tetap bisa dipakai lewat asyncio.to_thread
+    """
+
+    @abstractmethod
+    async def generate_response_async(self, prompt: str) -> str:
+        """Generate response secara asynchronous"""
+        pass
+
+
+# ============================================
+# Client Pool - reuse client antar request
+# ============================================
+class ClientPool:
+    """
+    Pool client yang dibuat sekali lalu dipakai ulang antar request dan thread
+    client dibagikan round-robin (client sdk seperti GenerativeModel aman di share)
+    jadi tidak ada blocking, bisa dipakai dari thread maupun asyncio
+    """
+
+    def __init__(self, factory: Callable[[], Any], size: int = 4):
+        if size < 1:
+            raise ValueError("size pool minimal 1")
+        self._factory = factory
+        self.size = size
+        self._clients: List[Any] = []
+        self._cursor = itertools.count()
+        self._lock = threading.Lock()
+
+    def get(self) -> Any:
+        """ambil client berikutnya, client dibuat lazy sampai pool penuh"""
+        index = next(self._cursor) % self.size
+        if index < len(self._clients):
+            return self._clients[index]
+
+        with self._lock:
+            while len(self._clients) <= index:
+                self._clients.append(self._factory())
+            return self._clients[index]
+
+    def warm_up(self):
+        """buat semua client di awal supaya request pertama tidak bayar biaya init"""
+        with self._lock:
+            while len(self._clients) < self.size:
+                self._clients.append(self._factory())
+
+    def health_check(self, check: Callable[[Any], bool]) -> bool:
+        """jalankan fungsi check ke satu client, exception dianggap tidak sehat"""
+        try:
+            return bool(check(self.get()))
+        except Exception:
+            return False
+
+    def __len__(self):
+        return len(self._clients)
+
+
+# genai.configure bersifat global, cukup dipanggil sekali per api key
+_genai_config_lock = threading.Lock()
+_genai_configured_key: Optional[str] = None
+
+
+def _configure_genai(api_key: str) -> bool:
+    """configure sdk gemini sekali saja, return True kalau benar2 dijalankan"""
+    global _genai_configured_key
+    with _genai_config_lock:
+        if _genai_configured_key == api_key:
+            return False
+        genai.configure(api_key=api_key)
+        _genai_configured_key = api_key
+        return True
+
 
 # ============================================
 # 2. CONCRETE IMPLEMENTATION - Gemini Provider
 # ===========================================
 
-class GeminiProvider(AIProviderInterface):
+class GeminiProvider(AsyncAIProviderInterface):
     """Implenetasi konkret dari AIPROVIDERINTERFACE untuk Gemini.
     Prinsip SOLID : single responbility - hanya hanel Gemini API
     mendukung apu key dari .env"""
 
-    def __init__(self,api_key: str = None):
+    def __init__(self,api_key: str = None, pool_size: int = 4):
         # jika api key tidak ada -> minta  lewat input
         if api_key is None or api_key.strip() == '':
             api_key = os.getenv("GEMINI_API_KEY")
@@ -69,28 +181,66 @@ class GeminiProvider(AIProviderInterface):
         self.api_key = api_key.strip()
         self.model_name = "gemini-2.5-flash"
 
+        # GenerativeModel dibuat sekali di pool, bukan per request
+        self._pool = ClientPool(lambda: genai.GenerativeModel(self.model_name), size=pool_size)
+
         self._initialize_client()
 
     def _initialize_client(self):
         print(f"[GEMINI] Client Initialized ({self.api_key[:6]}****)")
         try:
-            genai.configure(api_key=self.api_key)
-            print(f"[GEMINI] cliient initialized")
+            if _configure_genai(self.api_key):
+                print(f"[GEMINI] cliient initialized")
         except Exception as e:
             print(f"Gagal inisialisasi")
 
+    def warm_up(self):
+        """buat semua GenerativeModel di pool sebelum request pertama"""
+        self._pool.warm_up()
+
+    def health_check(self) -> bool:
+        """cek api key dan model bisa diakses"""
+        if not self.is_available():
+            return False
+        return self._pool.health_check(lambda model: genai.get_model(model.model_name) is not None)
+
     def generate_response(self, prompt: str) -> str:
         """
         menggunakan api dari gemini .
         """
         try:
-            model = genai.GenerativeModel(self.model_name)
+            model = self._pool.get()
             response = model.generate_content(prompt)
             return response.text
 
         except Exception as e:
             return f"[GEMINI error] {str(e)}"
 
+    def stream_response(self, prompt: str) -> Iterator[str]:
+        """
+        streaming chunk dari gemini (generate_content dengan stream=True)
+        """
+        try:
+            model = self._pool.get()
+            for chunk in model.generate_content(prompt, stream=True):
+                if chunk.text:
+                    yield chunk.text
+
+        except Exception as e:
+            yield f"[GEMINI error] {str(e)}"
+
+    async def generate_response_async(self, prompt: str) -> str:
+        """
+        versi async, pakai generate_content_async dari sdk gemini
+        """
+        try:
+            model = self._pool.get()
+            response = await model.generate_content_async(prompt)
+            return response.text
+
+        except Exception as e:
+            return f"[GEMINI error] {str(e)}"
+
     def get_provider_name(self) -> str:
         return "Gemini"
 
@@ -100,14 +250,61 @@ class GeminiProvider(AIProviderInterface):
 # ============================================
 # Mock Provider untuk Testing
 # ============================================
-class MockAIProvider(AIProviderInterface):
-    """Provider palsu untuk testing tanpa api"""
+class MockAIProvider(AsyncAIProviderInterface):
+    """Provider palsu untuk testing tanpa api
+    latency bisa di set untuk simulasi waktu response (benchmark offline)
+    jitter dan failure_rate untuk simulasi provider yang lambat / sering gagal"""
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, failure_rate: float = 0.0,
+                 name: str = "Mock AI(Testing)", seed: Optional[int] = None):
+        self.latency = latency              # detik per request
+        self.jitter = jitter                # tambahan latency acak 0..jitter detik
+        self.failure_rate = failure_rate    # peluang request gagal (0..1)
+        self.name = name
+        self._random = random.Random(seed)
 
-    def generate_response(self, prompt: str) -> str:
+    def _simulate(self) -> tuple:
+        """return (delay, gagal atau tidak) untuk satu request"""
+        delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter > 0 else 0.0)
+        failed = self.failure_rate > 0 and self._random.random() < self.failure_rate
+        return delay, failed
+
+    def _reply(self, prompt: str, failed: bool) -> str:
+        if failed:
+            return f"[Mock AI error] simulated failure"
         return f"[Mock AI] Echo: {prompt}"
 
+    def generate_response(self, prompt: str) -> str:
+        delay, failed = self._simulate()
+        if delay > 0:
+            time.sleep(delay)
+        return self._reply(prompt, failed)
+
+    async def generate_response_async(self, prompt: str) -> str:
+        delay, failed = self._simulate()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return self._reply(prompt, failed)
+
+    def generate_batch(self, prompts: List[str]) -> List[str]:
+        """simulasi batch api : satu latency untuk seluruh batch"""
+        delay, _ = self._simulate()
+        if delay > 0:
+            time.sleep(delay)
+        return [self._reply(prompt, self._simulate()[1]) for prompt in prompts]
+
+    def stream_response(self, prompt: str) -> Iterator[str]:
+        """yield per kata, latency dianggap sebagai waktu sampai token pertama"""
+        delay, failed = self._simulate()
+        if delay > 0:
+            time.sleep(delay)
+        words = self._reply(prompt, failed).split(" ")
+        for word in words[:-1]:
+            yield word + " "
+        yield words[-1]
+
     def get_provider_name(self)-> str:
-        return "Mock AI(Testing)"
+        return self.name
 
     def is_available(self)-> bool:
         return True
@@ -123,7 +320,21 @@ class ResponseFormatterStrategy(ABC):
     def format(self,response: str, metadata: Dict) -> str:
         pass
 
-class PlainTextFormatter(ABC):
+    # streaming path : start -> chunk (berkali-kali) -> end
+    # default hanya meneruskan chunk apa adanya
+    def format_start(self, metadata: Dict) -> str:
+        """output sebelum chunk pertama"""
+        return ""
+
+    def format_chunk(self, chunk: str, metadata: Dict) -> str:
+        """format satu chunk response"""
+        return chunk
+
+    def format_end(self, response: str, metadata: Dict) -> str:
+        """output setelah chunk terakhir, metadata sudah lengkap"""
+        return ""
+
+class PlainTextFormatter(ResponseFormatterStrategy):
     """Format response sebgai plain tect"""
 
     def format(self,response: str, metadata: Dict) -> str:
@@ -133,6 +344,9 @@ class DetailedFormatter(ResponseFormatterStrategy):
     """Format response dengan detail metadata"""
 
     def format(self,response: str, metadata: Dict) -> str:
+        return self.format_start(metadata) + response + self.format_end(response, metadata)
+
+    def format_start(self, metadata: Dict) -> str:
         return f"""
 ╔══════════════════════════════════════╗
 ║        AI ASSISTANT RESPONSE         ║
@@ -140,9 +354,13 @@ class DetailedFormatter(ResponseFormatterStrategy):
 Provider: {metadata['provider']}
 Time: {metadata['timestamp']}
 ───────────────────────────────────────
-{response}
+"""
+
+    def format_end(self, response: str, metadata: Dict) -> str:
+        return """
 ───────────────────────────────────────
 """
+
 class JSONFormatter(ResponseFormatterStrategy):
     """Format response dengan detail metadata"""
     def format(self, response: str , metadata : Dict) -> str:
@@ -151,6 +369,17 @@ class JSONFormatter(ResponseFormatterStrategy):
             "metadata" : metadata
         }, indent=2)
 
+    def format_start(self, metadata: Dict) -> str:
+        return '{\n  "response": "'
+
+    def format_chunk(self, chunk: str, metadata: Dict) -> str:
+        # escape json tanpa tanda kutip pembuka/penutup
+        return json.dumps(chunk)[1:-1]
+
+    def format_end(self, response: str, metadata: Dict) -> str:
+        # hasil gabungan sama dengan format() -> tetap json valid
+        return '",\n  "metadata": ' + json.dumps(metadata, indent=2).replace("\n", "\n  ") + "\n}"
+
 # ============================================
 # 4. OBSERVER PATTERN - Event Logging
 # ============================================
@@ -160,6 +389,11 @@ class Observer(ABC):
     def update(self, event: str, data : Dict):
         pass
 
+    def update_batch(self, events: List[tuple]):
+        """terima banyak event sekaligus (dipakai EventBus), default loop update()"""
+        for event, data in events:
+            self.update(event, data)
+
 
 class LoggerObserver(Observer):
     def __init__(self, name="SystemLogger"):
@@ -168,17 +402,27 @@ class LoggerObserver(Observer):
     def update(self, event: str, data : Dict):
         print(f"[LOG :{self.name}] {event} -> {data} ")
 
+    def update_batch(self, events: List[tuple]):
+        # satu print untuk satu batch, bukan satu print per event
+        print("\n".join(f"[LOG :{self.name}] {event} -> {data} " for event, data in events))
+
 class MetricCollector(Observer):
     """Collect metrics untuk analytics"""
 
     def __init__(self):
         self.total_request = 0
         self.total_token = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
 
     def update(self, event: str, data : Dict):
-        if event == "request_completed":
+        if event == "cache_hit":
+            self.cache_hits += 1
+        elif event == "cache_miss":
+            self.cache_misses += 1
+        elif event == "request_completed":
             self.total_request += 1
-            self.total_token += data.get("token", 0)
+            self.total_token += data.get("tokens", 0)
             print(f"Metric - Tottal Request : {self.total_request}, Total Token : {self.total_token}")
 
 # ============================================
@@ -200,6 +444,7 @@ class AIProviderFactory:
         providers = {
             'gemini' : GeminiProvider,
             'mock' : MockAIProvider,
+            'router' : RouterProvider,
     }
         provider_class = providers.get(provider_type.lower())
         if not provider_class:
@@ -219,11 +464,16 @@ class AIAssistantManager:
     - dependency Inversion : depend on interface, not concrate class
     """
 
-    def __init__(self, provider : AIProviderInterface):
+    def __init__(self, provider : AIProviderInterface, max_concurrency: int = 8,
+                 request_timeout: Optional[float] = 30.0, history_size: int = 1000,
+                 history_spill_path: Optional[str] = None):
         self.provider = provider
         self.observer : List[Observer] = []
         self.formatter: ResponseFormatterStrategy = PlainTextFormatter()
-        self.conversation_history : List[Dict] = []
+        self.conversation_history = ConversationHistory(history_size, history_spill_path)
+        self.event_bus: Optional[EventBus] = None
+        self.max_concurrency = max_concurrency  # batas request paralel di ask_many
+        self.request_timeout = request_timeout  # timeout default per request (detik)
 
     # Observer patern method
     def attach_observer(self,observer : Observer):
@@ -232,9 +482,28 @@ class AIAssistantManager:
 
     def notify_observers(self,event: str, data : Dict):
         """Notify semua observer tentang event"""
+        if self.event_bus is not None:
+            self.event_bus.publish(event, data)
+            return
         for observer in self.observer:
             observer.update(event, data)
 
+    def enable_event_bus(self, **kwargs) -> "EventBus":
+        """
+        Kirim event observer lewat EventBus (background thread)
+        supaya observer yang lambat tidak menambah latency ask
+        kwargs diteruskan ke EventBus (max_queue, batch_size, drop_policy, ...)
+        """
+        if self.event_bus is None:
+            self.event_bus = EventBus(self.observer, **kwargs)
+        return self.event_bus
+
+    def shutdown(self, timeout: Optional[float] = 5.0):
+        """flush event yang masih di queue lalu hentikan event bus"""
+        if self.event_bus is not None:
+            self.event_bus.close(timeout)
+            self.event_bus = None
+
     # strategy pattern methods
     def set_formatter(self, formatter : ResponseFormatterStrategy):
         """Set strategy untuk format response"""
@@ -247,51 +516,1325 @@ class AIAssistantManager:
         menerapkan semua pattern yang sudah dibuat
         """
 
-        self.notify_observers("request_started",{
-            "question" : question,
-            "provider" : self.provider.get_provider_name()
-        })
+        self._notify_request_started(question)
 
         #chck porvider availableity
         if not self.provider.is_available():
+            self._notify_request_failed(question, "provider_unavailable")
             return "[error] provider is not available"
 
+        start = time.perf_counter()
         response = self.provider.generate_response(question)
+        latency = time.perf_counter() - start
 
-        entry = {
-            "timestamp" : datetime.now().isoformat(),
-            "question" : question,
-            "response" : response,
-            "provider" : self.provider.get_provider_name(),
-        }
+        return self._complete_request(question, response, latency=latency)
 
-        self.conversation_history.append(entry)
+    def ask_stream(self, question : str) -> Iterator[str]:
+        """
+        Versi streaming dari ask : yield output yang sudah diformat per chunk
+        observer dapat event first_token dan chunk
+        latency yang dicatat adalah time to first token (bukan total waktu)
+        """
+        self._notify_request_started(question)
 
+        if not self.provider.is_available():
+            self._notify_request_failed(question, "provider_unavailable")
+            yield "[error] provider is not available"
+            return
+
+        timestamp = datetime.now().isoformat()
         metadata = {
-            "timestamp" : entry["timestamp"],
-            "provider"  : entry["provider"],
-            "tokens"    : len(response.split())
+            "timestamp" : timestamp,
+            "provider"  : self.provider.get_provider_name(),
         }
 
+        format_start = time.perf_counter()
+        header = self.formatter.format_start(metadata)
+        formatter_time = time.perf_counter() - format_start
+        if header:
+            yield header
+
+        chunks: List[str] = []
+        time_to_first_token = None
+        start = time.perf_counter()
+        stream = self.provider.stream_response(question)
+        finished = False
+
+        try:
+            for index, chunk in enumerate(stream):
+                if time_to_first_token is None:
+                    time_to_first_token = time.perf_counter() - start
+                    self.notify_observers("first_token", {
+                        "provider" : metadata["provider"],
+                        "latency"  : time_to_first_token,
+                    })
+
+                chunks.append(chunk)
+                self.notify_observers("chunk", {
+                    "provider" : metadata["provider"],
+                    "index"    : index,
+                    "chunk"    : chunk,
+                })
+
+                format_start = time.perf_counter()
+                piece = self.formatter.format_chunk(chunk, metadata)
+                formatter_time += time.perf_counter() - format_start
+                if piece:
+                    yield piece
+            finished = True
+        finally:
+            if not finished:
+                # consumer berhenti lebih awal (break / close generator) atau provider error :
+                # response parsial tetap dicatat ke history dan metrics
+                close = getattr(stream, "close", None)
+                if close is not None:
+                    close()
+                partial = self._finish_stream(question, chunks, timestamp, start,
+                                              time_to_first_token, partial=True)
+                partial["formatter_time"] = formatter_time
+                self.notify_observers("request_completed", partial)
+
+        response = "".join(chunks)
+        metadata = self._finish_stream(question, chunks, timestamp, start, time_to_first_token)
+
+        format_start = time.perf_counter()
+        footer = self.formatter.format_end(response, metadata)
+        metadata["formatter_time"] = formatter_time + time.perf_counter() - format_start
+
+        if _is_error_response(response):
+            self._notify_request_failed(question, "provider_error")
+        self.notify_observers("request_completed", metadata)
+        if footer:
+            yield footer
+
+    def _finish_stream(self, question: str, chunks: List[str], timestamp: str, start: float,
+                       time_to_first_token: Optional[float], partial: bool = False) -> Dict:
+        """catat request streaming ke history, return metadata (partial=True kalau stream terputus)"""
+        total_time = time.perf_counter() - start
+        extra = {"partial": True} if partial else {}
+        return self._record_request(
+            question, "".join(chunks), timestamp=timestamp,
+            latency=total_time if time_to_first_token is None else time_to_first_token,
+            total_time=total_time, **extra,
+        )
+
+    async def ask_async(self, question : str, timeout: Optional[float] = None) -> str:
+        """
+        Versi async dari ask
+        provider async di await langsung, provider sync dijalankan di thread
+        timeout : batas waktu per request (default self.request_timeout)
+        """
+        self._notify_request_started(question)
+
+        if not self.provider.is_available():
+            self._notify_request_failed(question, "provider_unavailable")
+            return "[error] provider is not available"
+
+        timeout = self.request_timeout if timeout is None else timeout
+        start = time.perf_counter()
+        try:
+            response = await asyncio.wait_for(self._generate_async(question), timeout)
+        except asyncio.TimeoutError:
+            self.notify_observers("request_timeout", {
+                "question" : question,
+                "provider" : self.provider.get_provider_name(),
+                "timeout"  : timeout,
+                "reason"   : "timeout",
+            })
+            return f"[error] request timeout after {timeout}s"
+
+        latency = time.perf_counter() - start
+        return self._complete_request(question, response, latency=latency)
+
+    async def ask_many(self, questions : List[str], max_concurrency: Optional[int] = None,
+                       timeout: Optional[float] = None) -> List[str]:
+        """
+        Kirim banyak pertanyaan sekaligus secara concurrent
+        jumlah request yang jalan bersamaan dibatasi semaphore
+        hasil dikembalikan sesuai urutan questions
+        """
+        semaphore = asyncio.Semaphore(max_concurrency or self.max_concurrency)
+
+        async def run_one(question: str) -> str:
+            async with semaphore:
+                return await self.ask_async(question, timeout)
+
+        # gather menjaga urutan hasil sama dengan urutan input
+        return list(await asyncio.gather(*(run_one(q) for q in questions)))
+
+    async def _generate_async(self, question: str) -> str:
+        """panggil provider secara async (fallback ke thread untuk provider sync)"""
+        if isinstance(self.provider, AsyncAIProviderInterface):
+            return await self.provider.generate_response_async(question)
+        return await asyncio.to_thread(self.provider.generate_response, question)
+
+    def _notify_request_started(self, question: str):
+        self.notify_observers("request_started",{
+            "question" : question,
+            "provider" : self.provider.get_provider_name()
+        })
+
+    def _notify_request_failed(self, question: str, reason: str):
+        self.notify_observers("request_failed", {
+            "question" : question,
+            "provider" : self.provider.get_provider_name(),
+            "reason"   : reason,
+        })
+
+    def _complete_request(self, question: str, response: str, **extra) -> str:
+        """simpan history, format response, dan notify observer"""
+        metadata = self._record_request(question, response, **extra)
+
+        start = time.perf_counter()
         output = self.formatter.format(response, metadata)
+        metadata["formatter_time"] = time.perf_counter() - start
 
+        if _is_error_response(response):
+            self._notify_request_failed(question, "provider_error")
         self.notify_observers("request_completed", metadata)
 
         return output
 
-    def get_conversation_summary(self):
-        """Dapatkan summary dari conversation history"""
+    def _record_request(self, question: str, response: str,
+                        timestamp: Optional[str] = None, **extra) -> Dict:
+        """simpan ke conversation history dan return metadata request"""
+        entry = self.conversation_history.add(
+            timestamp or datetime.now().isoformat(),
+            question,
+            response,
+            self.provider.get_provider_name(),
+        )
+
+        metadata = {
+            "timestamp" : entry.timestamp,
+            "provider"  : entry.provider,
+            "tokens"    : len(response.split()),
+            **extra,
+        }
+
+        return metadata
+
+    def get_conversation_summary(self, page: Optional[int] = None, page_size: int = 20):
+        """
+        Dapatkan summary dari conversation history
+        page : None = semua giliran di memory, 1 = halaman paling baru, dst
+        """
         if not self.conversation_history:
             return "No conversation yet"
 
-        output = "\n=== CONVERSATION HISTORY ===\n"
-        for i, c in enumerate(self.conversation_history,1):
-            output += f"{i}. {c['timestamp']}\n Q: {c['question']}\nA: {c['response'][:80]}...\n"
+        return "\n=== CONVERSATION HISTORY ===\n" + self.conversation_history.render(page, page_size)
 
-        return output
+# ============================================
+# 7. DECORATOR PATTERN - Response Cache
+# ============================================
+class CachingProvider(AsyncAIProviderInterface):
+    """
+    Decorator pattern : bungkus AIProviderInterface apa saja dengan cache
+    - key = prompt yang sudah dinormalisasi (whitespace saja) + model_name
+      case_insensitive=True -> huruf besar/kecil juga disamakan (opt-in, prompt berisi kode /
+      nama bisa beda arti kalau case beda)
+    - eviction LRU + TTL, dibatasi jumlah entry dan ukuran memory (bytes)
+    - optional persist ke sqlite supaya cache tetap ada setelah restart
+    - hit/miss dilaporkan ke observer (event cache_hit / cache_miss)
+    """
+
+    def __init__(self, provider: AIProviderInterface, ttl: Optional[float] = 3600.0,
+                 max_entries: int = 1024, max_bytes: int = 16 * 1024 * 1024,
+                 db_path: Optional[str] = None, case_insensitive: bool = False):
+        self.provider = provider
+        self.case_insensitive = case_insensitive
+        self.ttl = ttl                  # detik, None = tidak pernah expired
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.observer: List[Observer] = []
+
+        # OrderedDict sebagai LRU: key -> (response, created_at)
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._size_bytes = 0
+        self._lock = threading.Lock()
+
+        self._db = None
+        if db_path is not None:
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS response_cache "
+                "(key TEXT PRIMARY KEY, response TEXT, created_at REAL)"
+            )
+            self._db.commit()
+            self._load_from_disk()
+
+    # Observer pattern (sama seperti AIAssistantManager)
+    def attach_observer(self, observer: Observer):
+        self.observer.append(observer)
+
+    def notify_observers(self, event: str, data: Dict):
+        for observer in self.observer:
+            observer.update(event, data)
+
+    # interface AIProviderInterface
+    def generate_response(self, prompt: str) -> str:
+        key = self._make_key(prompt)
+        cached = self._get(key)
+        if cached is not None:
+            return cached
+
+        response = self.provider.generate_response(prompt)
+        self._put(key, response)
+        return response
+
+    async def generate_response_async(self, prompt: str) -> str:
+        key = self._make_key(prompt)
+        cached = self._get(key)
+        if cached is not None:
+            return cached
+
+        if isinstance(self.provider, AsyncAIProviderInterface):
+            response = await self.provider.generate_response_async(prompt)
+        else:
+            response = await asyncio.to_thread(self.provider.generate_response, prompt)
+        self._put(key, response)
+        return response
+
+    def stream_response(self, prompt: str) -> Iterator[str]:
+        key = self._make_key(prompt)
+        cached = self._get(key)
+        if cached is not None:
+            yield cached
+            return
+
+        # simpan ke cache hanya kalau stream selesai sampai habis
+        chunks: List[str] = []
+        for chunk in self.provider.stream_response(prompt):
+            chunks.append(chunk)
+            yield chunk
+        self._put(key, "".join(chunks))
+
+    def get_provider_name(self) -> str:
+        return self.provider.get_provider_name()
+
+    def is_available(self) -> bool:
+        return self.provider.is_available()
+
+    def warm_up(self):
+        self.provider.warm_up()
+
+    def health_check(self) -> bool:
+        return self.provider.health_check()
+
+    def clear(self):
+        """hapus semua entry (memory dan disk)"""
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
+            if self._db is not None:
+                self._db.execute("DELETE FROM response_cache")
+                self._db.commit()
+
+    def stats(self) -> Dict:
+        total = self.hits + self.misses
+        return {
+            "hits"      : self.hits,
+            "misses"    : self.misses,
+            "hit_rate"  : self.hits / total if total else 0.0,
+            "entries"   : len(self._entries),
+            "bytes"     : self._size_bytes,
+        }
+
+    # helper internal
+    def _make_key(self, prompt: str) -> str:
+        """normalisasi whitespace prompt (+ lowercase kalau case_insensitive) lalu hash bersama model_name"""
+        normalized = " ".join(prompt.split())
+        if self.case_insensitive:
+            normalized = normalized.casefold()
+        model_name = getattr(self.provider, "model_name", self.provider.get_provider_name())
+        return hashlib.sha256(f"{model_name}\x00{normalized}".encode("utf-8")).hexdigest()
+
+    def _is_expired(self, created_at: float) -> bool:
+        return self.ttl is not None and time.time() - created_at > self.ttl
+
+    def _get(self, key: str) -> Optional[str]:
+        with self._lock:
+            item = self._entries.get(key)
+            if item is not None and self._is_expired(item[1]):
+                self._remove(key)
+                item = None
+
+            if item is None:
+                self.misses += 1
+            else:
+                self._entries.move_to_end(key)  # tandai baru dipakai (LRU)
+                self.hits += 1
+            stats = {"hits": self.hits, "misses": self.misses}
+
+        self.notify_observers("cache_miss" if item is None else "cache_hit", {
+            "provider" : self.get_provider_name(),
+            **stats,
+        })
+        return None if item is None else item[0]
+
+    def _put(self, key: str, response: str, created_at: Optional[float] = None,
+             persist: bool = True):
+        # response error tidak di cache supaya request berikutnya dicoba ulang
+        if _is_error_response(response):
+            return
+
+        created_at = time.time() if created_at is None else created_at
+        with self._lock:
+            if key in self._entries:
+                self._remove(key, from_disk=False)
+            self._entries[key] = (response, created_at)
+            self._size_bytes += _entry_size(key, response)
+
+            if persist and self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO response_cache VALUES (?, ?, ?)",
+                    (key, response, created_at),
+                )
+                self._db.commit()
+
+            # evict entry paling lama tidak dipakai sampai di bawah batas
+            while self._entries and (len(self._entries) > self.max_entries
+                                     or self._size_bytes > self.max_bytes):
+                self._remove(next(iter(self._entries)))
+
+    def _remove(self, key: str, from_disk: bool = True):
+        """hapus satu entry, lock harus sudah dipegang caller"""
+        response, _ = self._entries.pop(key)
+        self._size_bytes -= _entry_size(key, response)
+        if from_disk and self._db is not None:
+            self._db.execute("DELETE FROM response_cache WHERE key = ?", (key,))
+            self._db.commit()
+
+    def _load_from_disk(self):
+        """muat entry yang belum expired dari sqlite, yang paling baru masuk terakhir"""
+        rows = self._db.execute(
+            "SELECT key, response, created_at FROM response_cache ORDER BY created_at"
+        ).fetchall()
+        for key, response, created_at in rows:
+            if self._is_expired(created_at):
+                self._db.execute("DELETE FROM response_cache WHERE key = ?", (key,))
+                continue
+            self._put(key, response, created_at, persist=False)
+        self._db.commit()
+
+
+def _entry_size(key: str, response: str) -> int:
+    """perkiraan ukuran satu entry cache dalam bytes"""
+    return len(key) + len(response.encode("utf-8"))
+
+
+def _is_error_response(response: str) -> bool:
+    """response error dari provider diawali '[... error]'"""
+    head = response[:32].lower()
+    return head.startswith("[") and "error]" in head
 
 # ============================================
-# 7. DEMO APPLICATION
+# 8. CONVERSATION HISTORY - Ring Buffer
+# ============================================
+class ConversationEntry:
+    """Satu giliran percakapan, pakai __slots__ supaya hemat memory"""
+
+    __slots__ = ("number", "timestamp", "question", "response", "provider", "_line")
+
+    def __init__(self, number: int, timestamp: str, question: str, response: str, provider: str):
+        self.number = number        # nomor urut global (tidak reset saat buffer berputar)
+        self.timestamp = timestamp
+        self.question = question
+        self.response = response
+        self.provider = provider
+        self._line: Optional[str] = None
+
+    def __getitem__(self, key: str):
+        # supaya kode lama yang akses entry['question'] tetap jalan
+        return getattr(self, key)
+
+    def render(self) -> str:
+        """render baris summary, di cache supaya tidak dibuat ulang tiap panggilan"""
+        if self._line is None:
+            self._line = f"{self.number}. {self.timestamp}\n Q: {self.question}\nA: {self.response[:80]}...\n"
+        return self._line
+
+    def as_dict(self) -> Dict:
+        return {
+            "number"    : self.number,
+            "timestamp" : self.timestamp,
+            "question"  : self.question,
+            "response"  : self.response,
+            "provider"  : self.provider,
+        }
+
+
+class ConversationHistory:
+    """
+    History percakapan dengan ukuran terbatas (ring buffer)
+    - hanya max_entries giliran terakhir yang disimpan di memory
+    - giliran lama optional di spill ke file jsonl (spill_path)
+    - summary bisa di render per halaman, jadi waktu render tetap flat
+    """
+
+    def __init__(self, max_entries: int = 1000, spill_path: Optional[str] = None):
+        if max_entries < 1:
+            raise ValueError("max_entries minimal 1")
+        self.max_entries = max_entries
+        self.spill_path = spill_path
+        self.total_count = 0            # jumlah semua giliran sejak awal
+        self._entries: deque = deque()
+        self._lock = threading.Lock()
+
+    def add(self, timestamp: str, question: str, response: str, provider: str) -> ConversationEntry:
+        """tambah giliran baru, giliran paling lama dibuang/di spill kalau penuh"""
+        with self._lock:
+            self.total_count += 1
+            entry = ConversationEntry(self.total_count, timestamp, question, response, provider)
+            self._entries.append(entry)
+            if len(self._entries) > self.max_entries:
+                self._spill(self._entries.popleft())
+        return entry
+
+    def _spill(self, entry: ConversationEntry):
+        if self.spill_path is None:
+            return
+        with open(self.spill_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry.as_dict()) + "\n")
+
+    def load_spilled(self) -> Iterator[Dict]:
+        """baca giliran lama yang sudah di spill ke disk (paling lama dulu)"""
+        if self.spill_path is None or not os.path.exists(self.spill_path):
+            return
+        with open(self.spill_path, encoding="utf-8") as f:
+            for line in f:
+                yield json.loads(line)
+
+    def page(self, page: int = 1, page_size: int = 20) -> List[ConversationEntry]:
+        """ambil satu halaman entry, page 1 = giliran paling baru"""
+        if page < 1 or page_size < 1:
+            raise ValueError("page dan page_size minimal 1")
+        with self._lock:
+            end = len(self._entries) - (page - 1) * page_size
+            start = max(end - page_size, 0)
+            return [self._entries[i] for i in range(start, max(end, 0))]
+
+    def render(self, page: Optional[int] = None, page_size: int = 20) -> str:
+        """render summary, semua entry di memory atau satu halaman saja"""
+        with self._lock:
+            entries = list(self._entries) if page is None else None
+        if entries is None:
+            entries = self.page(page, page_size)
+        return "".join(entry.render() for entry in entries)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __iter__(self):
+        return iter(list(self._entries))
+
+    def __getitem__(self, index: int) -> ConversationEntry:
+        return self._entries[index]
+
+# ============================================
+# 9. EVENT BUS - Non-blocking Observer Dispatch
+# ============================================
+class EventBus:
+    """
+    Kirim event ke observer lewat queue + background worker thread
+    - request path hanya taruh event di queue (tidak menunggu observer)
+    - worker kirim event secara batch lewat Observer.update_batch
+    - drop_policy kalau queue penuh : 'block', 'drop_new', 'drop_oldest'
+    - flush() / close() memastikan semua event terkirim sebelum shutdown
+    """
+
+    DROP_POLICIES = ("block", "drop_new", "drop_oldest")
+
+    def __init__(self, observers: List[Observer], max_queue: int = 10000, batch_size: int = 100,
+                 flush_interval: float = 0.05, drop_policy: str = "drop_oldest"):
+        if drop_policy not in self.DROP_POLICIES:
+            raise ValueError(f"Unknow drop policy : {drop_policy}")
+        self.observers = observers          # list yang sama dengan milik manager
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.drop_policy = drop_policy
+
+        self.published = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.observer_errors = 0
+
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._pending = 0                   # event yang belum selesai dikirim
+        self._pending_cond = threading.Condition()
+        self._stop = threading.Event()
+        self._worker = threading.Thread(target=self._run, name="EventBusWorker", daemon=True)
+        self._worker.start()
+        atexit.register(self.close)
+
+    def publish(self, event: str, data: Dict) -> bool:
+        """taruh event di queue, return False kalau event di drop"""
+        if self._stop.is_set():
+            return False
+
+        with self._pending_cond:
+            self._pending += 1
+            self.published += 1
+
+        item = (event, data)
+        try:
+            if self.drop_policy == "block":
+                self._queue.put(item)
+            else:
+                self._queue.put_nowait(item)
+            return True
+        except queue.Full:
+            pass
+
+        if self.drop_policy == "drop_oldest":
+            # buang event paling lama supaya event baru tetap masuk
+            try:
+                self._queue.get_nowait()
+                self._mark_done(1, dropped=True)
+            except queue.Empty:
+                pass
+            try:
+                self._queue.put_nowait(item)
+                return True
+            except queue.Full:
+                pass
+
+        self._mark_done(1, dropped=True)
+        return False
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """tunggu sampai semua event di queue terkirim"""
+        with self._pending_cond:
+            return self._pending_cond.wait_for(lambda: self._pending == 0, timeout)
+
+    def close(self, timeout: Optional[float] = 5.0):
+        """flush lalu hentikan worker"""
+        if self._stop.is_set():
+            return
+        # lepas referensi dari atexit, bus yang sudah di close bisa di GC
+        atexit.unregister(self.close)
+        self.flush(timeout)
+        self._stop.set()
+        self._worker.join(timeout)
+
+    def stats(self) -> Dict:
+        return {
+            "published"       : self.published,
+            "delivered"       : self.delivered,
+            "dropped"         : self.dropped,
+            "observer_errors" : self.observer_errors,
+            "queued"          : self._queue.qsize(),
+        }
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                first = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+
+            # kumpulkan batch : ambil sebanyak mungkin yang sudah ada di queue
+            batch = [first]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            for observer in list(self.observers):
+                try:
+                    observer.update_batch(batch)
+                except Exception:
+                    # observer yang error tidak boleh mematikan worker
+                    self.observer_errors += 1
+
+            self.delivered += len(batch)
+            self._mark_done(len(batch))
+
+    def _mark_done(self, count: int, dropped: bool = False):
+        with self._pending_cond:
+            self._pending -= count
+            if dropped:
+                self.dropped += count
+            self._pending_cond.notify_all()
+
+# ============================================
+# 10. METRICS - Registry & Latency Histogram
+# ============================================
+class MetricsRegistry:
+    """
+    Registry counter + histogram yang murah untuk dinyalakan di production
+    - setiap thread menulis ke shard miliknya sendiri (tanpa lock di hot path)
+    - snapshot() menggabungkan semua shard saat dibaca
+    - histogram pakai bucket tetap (skala log), percentile diperkirakan dari bucket
+    - export ke text format Prometheus atau JSON
+    """
+
+    # 0.5ms sampai ~65 detik, kelipatan 2
+    DEFAULT_BUCKETS = tuple(0.0005 * 2 ** i for i in range(18))
+
+    def __init__(self, buckets: tuple = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._custom_buckets: Dict[str, tuple] = {}
+        self.started_at = time.time()
+        self._local = threading.local()
+        self._shards: List[Dict] = []
+        self._shards_lock = threading.Lock()   # hanya dipakai saat thread baru register shard
+
+    def set_buckets(self, name: str, buckets: tuple):
+        """pakai bucket khusus untuk histogram tertentu (mis. ukuran batch)"""
+        self._custom_buckets[name] = tuple(sorted(buckets))
+
+    def buckets_for(self, name: Optional[str]) -> tuple:
+        return self._custom_buckets.get(name, self.buckets)
+
+    def _shard(self) -> Dict:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = {"counters": {}, "histograms": {}}
+            with self._shards_lock:
+                self._shards.append(shard)
+            self._local.shard = shard
+        return shard
+
+    def inc(self, name: str, value: float = 1, **labels):
+        """tambah nilai counter"""
+        counters = self._shard()["counters"]
+        key = (name, tuple(sorted(labels.items())))
+        counters[key] = counters.get(key, 0) + value
+
+    def observe(self, name: str, value: float, **labels):
+        """catat satu nilai ke histogram"""
+        histograms = self._shard()["histograms"]
+        key = (name, tuple(sorted(labels.items())))
+        buckets = self.buckets_for(name)
+        hist = histograms.get(key)
+        if hist is None:
+            # [count per bucket (+inf di akhir), sum, count]
+            hist = histograms[key] = [[0] * (len(buckets) + 1), 0.0, 0]
+        hist[0][bisect.bisect_left(buckets, value)] += 1
+        hist[1] += value
+        hist[2] += 1
+
+    def snapshot(self) -> Dict:
+        """gabungkan semua shard : {'counters': {...}, 'histograms': {...}}"""
+        with self._shards_lock:
+            shards = list(self._shards)
+
+        counters: Dict[tuple, float] = {}
+        histograms: Dict[tuple, list] = {}
+        for shard in shards:
+            for key, value in list(shard["counters"].items()):
+                counters[key] = counters.get(key, 0) + value
+            for key, (bucket_counts, total, count) in list(shard["histograms"].items()):
+                merged = histograms.setdefault(key, [[0] * len(bucket_counts), 0.0, 0])
+                merged[0] = [a + b for a, b in zip(merged[0], bucket_counts)]
+                merged[1] += total
+                merged[2] += count
+        return {"counters": counters, "histograms": histograms}
+
+    def percentile(self, bucket_counts: List[int], count: int, q: float,
+                   name: Optional[str] = None) -> float:
+        """perkiraan percentile q (0..1) dengan interpolasi linear di dalam bucket"""
+        buckets = self.buckets_for(name)
+        if count == 0:
+            return 0.0
+        target = q * count
+        cumulative = 0
+        for i, bucket_count in enumerate(bucket_counts):
+            if bucket_count and cumulative + bucket_count >= target:
+                lower = buckets[i - 1] if i > 0 else 0.0
+                upper = buckets[i] if i < len(buckets) else buckets[-1]
+                return lower + (upper - lower) * (target - cumulative) / bucket_count
+            cumulative += bucket_count
+        return buckets[-1]
+
+    def to_json(self) -> str:
+        snap = self.snapshot()
+        result = {"uptime_seconds": time.time() - self.started_at, "counters": [], "histograms": []}
+        for (name, labels), value in sorted(snap["counters"].items()):
+            result["counters"].append({"name": name, "labels": dict(labels), "value": value})
+        for (name, labels), (bucket_counts, total, count) in sorted(snap["histograms"].items()):
+            result["histograms"].append({
+                "name"   : name,
+                "labels" : dict(labels),
+                "count"  : count,
+                "sum"    : total,
+                "p50"    : self.percentile(bucket_counts, count, 0.50, name),
+                "p95"    : self.percentile(bucket_counts, count, 0.95, name),
+                "p99"    : self.percentile(bucket_counts, count, 0.99, name),
+            })
+        return json.dumps(result, indent=2)
+
+    def to_prometheus(self) -> str:
+        snap = self.snapshot()
+        lines: List[str] = []
+        typed = set()
+
+        for (name, labels), value in sorted(snap["counters"].items()):
+            if name not in typed:
+                lines.append(f"# TYPE {name} counter")
+                typed.add(name)
+            lines.append(f"{name}{_prometheus_labels(labels)} {value}")
+
+        for (name, labels), (bucket_counts, total, count) in sorted(snap["histograms"].items()):
+            if name not in typed:
+                lines.append(f"# TYPE {name} histogram")
+                typed.add(name)
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets_for(name) + (float("inf"),), bucket_counts):
+                cumulative += bucket_count
+                le = "+Inf" if bound == float("inf") else f"{bound:g}"
+                lines.append(f"{name}_bucket{_prometheus_labels(labels + (('le', le),))} {cumulative}")
+            lines.append(f"{name}_sum{_prometheus_labels(labels)} {total}")
+            lines.append(f"{name}_count{_prometheus_labels(labels)} {count}")
+
+        return "\n".join(lines) + "\n"
+
+
+def _prometheus_label_value(value) -> str:
+    """escape label value sesuai text format Prometheus : backslash, double quote, newline"""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _prometheus_labels(labels: tuple) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_prometheus_label_value(value)}"' for key, value in labels) + "}"
+
+
+class AssistantMetrics(Observer):
+    """
+    Observer yang mengisi MetricsRegistry dari event AIAssistantManager
+    - request, error, dan token per provider
+    - histogram latency provider dan formatter
+    """
+
+    BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256)
+
+    # nama histogram -> key di summary()
+    HISTOGRAM_KEYS = {
+        "assistant_provider_latency_seconds"  : "provider_latency",
+        "assistant_formatter_latency_seconds" : "formatter_latency",
+        "assistant_batch_size"                : "batch_size",
+    }
+
+    def __init__(self, registry: Optional[MetricsRegistry] = None):
+        self.registry = registry or MetricsRegistry()
+        self.registry.set_buckets("assistant_batch_size", self.BATCH_SIZE_BUCKETS)
+
+    def update(self, event: str, data : Dict):
+        provider = data.get("provider", "unknown")
+        if event == "request_started":
+            self.registry.inc("assistant_requests_total", provider=provider)
+        elif event == "request_completed":
+            self.registry.inc("assistant_tokens_total", data.get("tokens", 0), provider=provider)
+            if "latency" in data:
+                self.registry.observe("assistant_provider_latency_seconds", data["latency"], provider=provider)
+            if "formatter_time" in data:
+                self.registry.observe("assistant_formatter_latency_seconds", data["formatter_time"], provider=provider)
+        elif event in ("request_failed", "request_timeout"):
+            self.registry.inc("assistant_errors_total", provider=provider, reason=data.get("reason", "timeout"))
+        elif event in ("cache_hit", "cache_miss"):
+            self.registry.inc(f"assistant_{event}s_total", provider=provider)
+        elif event == "batch_dispatched":
+            self.registry.inc("assistant_batches_total", provider=provider)
+            self.registry.observe("assistant_batch_size", data["batch_size"], provider=provider)
+
+    def summary(self) -> Dict:
+        """ringkasan per provider : requests, error rate, token throughput, p50/p95/p99"""
+        snap = self.registry.snapshot()
+        uptime = max(time.time() - self.registry.started_at, 1e-9)
+        result: Dict[str, Dict] = {}
+
+        def provider_stats(labels: tuple) -> Dict:
+            provider = dict(labels).get("provider", "unknown")
+            return result.setdefault(provider, {"requests": 0, "errors": 0, "tokens": 0})
+
+        for (name, labels), value in snap["counters"].items():
+            stats = provider_stats(labels)
+            if name == "assistant_requests_total":
+                stats["requests"] += value
+            elif name == "assistant_errors_total":
+                stats["errors"] += value
+            elif name == "assistant_tokens_total":
+                stats["tokens"] += value
+
+        for (name, labels), (bucket_counts, total, count) in snap["histograms"].items():
+            key = self.HISTOGRAM_KEYS.get(name, name)
+            provider_stats(labels)[key] = {
+                "p50" : self.registry.percentile(bucket_counts, count, 0.50, name),
+                "p95" : self.registry.percentile(bucket_counts, count, 0.95, name),
+                "p99" : self.registry.percentile(bucket_counts, count, 0.99, name),
+            }
+
+        for stats in result.values():
+            stats["error_rate"] = stats["errors"] / stats["requests"] if stats["requests"] else 0.0
+            stats["tokens_per_second"] = stats["tokens"] / uptime
+        return result
+
+# ============================================
+# 11. ROUTER - Multi Provider, Hedging & Failover
+# ============================================
+class CircuitBreaker:
+    """
+    Circuit breaker per provider
+    closed -> open (setelah failure_threshold gagal berturut-turut)
+    open -> half_open (setelah reset_timeout detik, request boleh dicoba lagi)
+    half_open -> closed kalau sukses, kembali open kalau gagal
+    saat half_open hanya satu request percobaan yang diizinkan
+    """
+
+    def __init__(self, failure_threshold: int = 3, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self.consecutive_failures = 0
+        self._opened_at = 0.0
+        self._trial_started = 0.0
+        self._lock = threading.Lock()
+
+    def available(self) -> bool:
+        """apakah allow() kemungkinan besar True, tanpa mengubah state / memakai slot percobaan
+        (untuk memilih kandidat ; allow() dipanggil tepat sebelum request dikirim)"""
+        with self._lock:
+            now = time.monotonic()
+            if self.state == "open":
+                return now - self._opened_at >= self.reset_timeout
+            if self.state == "half_open":
+                return now - self._trial_started >= self.reset_timeout
+            return True
+
+    def allow(self) -> bool:
+        with self._lock:
+            now = time.monotonic()
+            if self.state == "open":
+                if now - self._opened_at < self.reset_timeout:
+                    return False
+                self.state = "half_open"
+                self._trial_started = 0.0
+
+            if self.state == "half_open":
+                # percobaan yang hasilnya tidak pernah datang boleh diulang setelah reset_timeout
+                if now - self._trial_started < self.reset_timeout:
+                    return False
+                self._trial_started = now
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self.consecutive_failures = 0
+            self.state = "closed"
+
+    def record_failure(self):
+        with self._lock:
+            self.consecutive_failures += 1
+            if self.state == "half_open" or self.consecutive_failures >= self.failure_threshold:
+                self.state = "open"
+                self._opened_at = time.monotonic()
+
+
+class _RouteState:
+    """statistik satu provider di dalam RouterProvider"""
+
+    def __init__(self, provider: AIProviderInterface, breaker: CircuitBreaker, window: int):
+        self.provider = provider
+        self.breaker = breaker
+        self.ewma_latency: Optional[float] = None
+        self.latencies: deque = deque(maxlen=window)
+        self.successes = 0
+        self.failures = 0
+
+
+class RouterProvider(AsyncAIProviderInterface):
+    """
+    Provider yang membungkus beberapa AIProviderInterface sekaligus
+    - pilih provider dengan EWMA latency paling kecil
+    - hedged request : kalau provider pertama lewat deadline (percentile latency),
+      kirim request yang sama ke provider berikutnya, ambil yang selesai duluan
+    - failover ke provider berikutnya kalau gagal
+    - circuit breaker untuk provider yang terus gagal
+    """
+
+    def __init__(self, providers: List[AIProviderInterface], ewma_alpha: float = 0.2,
+                 hedge: bool = True, hedge_percentile: float = 0.95, min_hedge_delay: float = 0.05,
+                 initial_hedge_delay: float = 1.0, latency_window: int = 100,
+                 failure_threshold: int = 3, reset_timeout: float = 30.0):
+        if not providers:
+            raise ValueError("RouterProvider butuh minimal satu provider")
+        self.ewma_alpha = ewma_alpha
+        self.hedge = hedge
+        self.hedge_percentile = hedge_percentile
+        self.min_hedge_delay = min_hedge_delay
+        self.initial_hedge_delay = initial_hedge_delay
+        self.hedges_fired = 0
+        self.hedge_wins = 0
+
+        self._routes = [
+            _RouteState(p, CircuitBreaker(failure_threshold, reset_timeout), latency_window)
+            for p in providers
+        ]
+        self._lock = threading.Lock()
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=4 * len(providers), thread_name_prefix="router"
+        )
+
+    # interface AIProviderInterface
+    def generate_response(self, prompt: str) -> str:
+        backups = self._ranked()
+        primary = self._take(backups)
+        if primary is None:
+            return "[Router error] no provider available"
+
+        futures = {self._executor.submit(self._call, primary, prompt): primary}
+        deadline = self._hedge_deadline(primary)
+        hedged = False
+        last_error = "[Router error] all providers failed"
+
+        while futures:
+            timeout = deadline if (self.hedge and not hedged and backups) else None
+            done, _ = concurrent.futures.wait(
+                futures, timeout=timeout, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            if not done:
+                # provider pertama lewat deadline -> hedge ke provider berikutnya
+                hedged = True
+                backup = self._take(backups)
+                if backup is not None:
+                    self.hedges_fired += 1
+                    futures[self._executor.submit(self._call, backup, prompt)] = backup
+                continue
+
+            for future in done:
+                route = futures.pop(future)
+                ok, response = future.result()
+                if ok:
+                    if route is not primary and hedged:
+                        self.hedge_wins += 1
+                    return response
+                last_error = response
+
+            # failover : semua request yang jalan gagal, coba provider berikutnya
+            if not futures:
+                backup = self._take(backups)
+                if backup is not None:
+                    futures[self._executor.submit(self._call, backup, prompt)] = backup
+
+        return last_error
+
+    async def generate_response_async(self, prompt: str) -> str:
+        backups = self._ranked()
+        primary = self._take(backups)
+        if primary is None:
+            return "[Router error] no provider available"
+
+        tasks = {asyncio.ensure_future(self._call_async(primary, prompt)): primary}
+        deadline = self._hedge_deadline(primary)
+        hedged = False
+        last_error = "[Router error] all providers failed"
+
+        try:
+            while tasks:
+                timeout = deadline if (self.hedge and not hedged and backups) else None
+                done, _ = await asyncio.wait(tasks, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    hedged = True
+                    backup = self._take(backups)
+                    if backup is not None:
+                        self.hedges_fired += 1
+                        tasks[asyncio.ensure_future(self._call_async(backup, prompt))] = backup
+                    continue
+
+                for task in done:
+                    route = tasks.pop(task)
+                    ok, response = task.result()
+                    if ok:
+                        if route is not primary and hedged:
+                            self.hedge_wins += 1
+                        return response
+                    last_error = response
+
+                if not tasks:
+                    backup = self._take(backups)
+                    if backup is not None:
+                        tasks[asyncio.ensure_future(self._call_async(backup, prompt))] = backup
+        finally:
+            # request yang kalah tidak perlu ditunggu
+            for task in tasks:
+                task.cancel()
+
+        return last_error
+
+    def stream_response(self, prompt: str) -> Iterator[str]:
+        """streaming tanpa hedging, failover hanya sebelum chunk pertama terkirim"""
+        last_error = "[Router error] no provider available"
+        for route in self._ranked():
+            if not route.breaker.allow():
+                continue
+            start = time.perf_counter()
+            try:
+                stream = route.provider.stream_response(prompt)
+                first = next(stream, "")
+            except Exception as e:
+                self._record(route, time.perf_counter() - start, False)
+                last_error = f"[Router error] {str(e)}"
+                continue
+
+            if _is_error_response(first):
+                self._record(route, time.perf_counter() - start, False)
+                last_error = first
+                continue
+
+            self._record(route, time.perf_counter() - start, True)
+            yield first
+            yield from stream
+            return
+
+        yield last_error
+
+    def get_provider_name(self) -> str:
+        return "Router(" + ", ".join(r.provider.get_provider_name() for r in self._routes) + ")"
+
+    def is_available(self) -> bool:
+        return any(r.provider.is_available() for r in self._routes)
+
+    def warm_up(self):
+        for route in self._routes:
+            route.provider.warm_up()
+
+    def health_check(self) -> bool:
+        return any(route.provider.health_check() for route in self._routes)
+
+    def stats(self) -> Dict:
+        return {
+            "hedges_fired" : self.hedges_fired,
+            "hedge_wins"   : self.hedge_wins,
+            "providers"    : [
+                {
+                    "provider"     : r.provider.get_provider_name(),
+                    "state"        : r.breaker.state,
+                    "ewma_latency" : r.ewma_latency,
+                    "successes"    : r.successes,
+                    "failures"     : r.failures,
+                }
+                for r in self._routes
+            ],
+        }
+
+    # helper internal
+    def _ranked(self) -> List[_RouteState]:
+        """provider yang boleh dipakai, urut dari EWMA latency paling kecil
+        provider yang belum punya data latency dicoba duluan
+        breaker hanya dicek (available), slot half_open baru dipakai di _take saat dispatch"""
+        candidates = [r for r in self._routes if r.breaker.available() and r.provider.is_available()]
+        return sorted(candidates, key=lambda r: -1.0 if r.ewma_latency is None else r.ewma_latency)
+
+    @staticmethod
+    def _take(routes: List[_RouteState]) -> Optional[_RouteState]:
+        """ambil (pop) route berikutnya yang breaker-nya mengizinkan request, tepat sebelum dispatch"""
+        while routes:
+            route = routes.pop(0)
+            if route.breaker.allow():
+                return route
+        return None
+
+    def _hedge_deadline(self, route: _RouteState) -> float:
+        with self._lock:
+            samples = sorted(route.latencies)
+        if len(samples) < 5:
+            return self.initial_hedge_delay
+        index = min(int(self.hedge_percentile * len(samples)), len(samples) - 1)
+        return max(self.min_hedge_delay, samples[index])
+
+    def _record(self, route: _RouteState, latency: float, ok: bool):
+        with self._lock:
+            if ok:
+                route.successes += 1
+                route.latencies.append(latency)
+                if route.ewma_latency is None:
+                    route.ewma_latency = latency
+                else:
+                    route.ewma_latency += self.ewma_alpha * (latency - route.ewma_latency)
+            else:
+                route.failures += 1
+        if ok:
+            route.breaker.record_success()
+        else:
+            route.breaker.record_failure()
+
+    def _call(self, route: _RouteState, prompt: str) -> tuple:
+        """panggil satu provider, return (sukses, response)"""
+        start = time.perf_counter()
+        try:
+            response = route.provider.generate_response(prompt)
+            ok = not _is_error_response(response)
+        except Exception as e:
+            response, ok = f"[Router error] {str(e)}", False
+        self._record(route, time.perf_counter() - start, ok)
+        return ok, response
+
+    async def _call_async(self, route: _RouteState, prompt: str) -> tuple:
+        start = time.perf_counter()
+        try:
+            if isinstance(route.provider, AsyncAIProviderInterface):
+                response = await route.provider.generate_response_async(prompt)
+            else:
+                response = await asyncio.to_thread(route.provider.generate_response, prompt)
+            ok = not _is_error_response(response)
+        except Exception as e:
+            response, ok = f"[Router error] {str(e)}", False
+        self._record(route, time.perf_counter() - start, ok)
+        return ok, response
+
+# ============================================
+# 12. MICRO-BATCHING - Gabungkan Prompt Jadi Satu Batch
+# ============================================
+class MicroBatchingProvider(AsyncAIProviderInterface):
+    """
+    Kumpulkan prompt yang datang hampir bersamaan lalu kirim sebagai satu batch
+    - batch dikirim setelah max_wait_ms sejak prompt pertama, atau saat max_batch_size tercapai
+    - provider dipanggil lewat generate_batch (fallback loop kalau provider tidak punya batch api)
+    - hasil dikembalikan ke masing-masing pemanggil
+    - ukuran batch dilaporkan ke observer (event batch_dispatched)
+    """
+
+    def __init__(self, provider: AIProviderInterface, max_batch_size: int = 16,
+                 max_wait_ms: float = 10.0, max_in_flight: int = 4):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size minimal 1")
+        self.provider = provider
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.observer: List[Observer] = []
+        self.batches_dispatched = 0
+        self.prompts_dispatched = 0
+
+        # item : (prompt, future, waktu masuk)
+        self._pending: List[tuple] = []
+        self._cond = threading.Condition()
+        self._stopped = False
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_in_flight, thread_name_prefix="microbatch"
+        )
+        self._dispatcher = threading.Thread(target=self._run, name="MicroBatchDispatcher", daemon=True)
+        self._dispatcher.start()
+        atexit.register(self.close)
+
+    # Observer pattern (sama seperti AIAssistantManager)
+    def attach_observer(self, observer: Observer):
+        self.observer.append(observer)
+
+    def notify_observers(self, event: str, data: Dict):
+        for observer in self.observer:
+            observer.update(event, data)
+
+    # interface AIProviderInterface
+    def submit(self, prompt: str) -> concurrent.futures.Future:
+        """masukkan prompt ke antrian batch, return future berisi response"""
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        with self._cond:
+            if self._stopped:
+                future.set_result("[Batch error] provider is closed")
+                return future
+            self._pending.append((prompt, future, time.monotonic()))
+            self._cond.notify()
+        return future
+
+    def generate_response(self, prompt: str) -> str:
+        return self.submit(prompt).result()
+
+    async def generate_response_async(self, prompt: str) -> str:
+        return await asyncio.wrap_future(self.submit(prompt))
+
+    def generate_batch(self, prompts: List[str]) -> List[str]:
+        futures = [self.submit(prompt) for prompt in prompts]
+        return [future.result() for future in futures]
+
+    def get_provider_name(self) -> str:
+        return self.provider.get_provider_name()
+
+    def is_available(self) -> bool:
+        return self.provider.is_available()
+
+    def warm_up(self):
+        self.provider.warm_up()
+
+    def health_check(self) -> bool:
+        return self.provider.health_check()
+
+    def stats(self) -> Dict:
+        return {
+            "batches"        : self.batches_dispatched,
+            "prompts"        : self.prompts_dispatched,
+            "avg_batch_size" : self.prompts_dispatched / self.batches_dispatched if self.batches_dispatched else 0.0,
+        }
+
+    def close(self):
+        """kirim sisa prompt di antrian lalu hentikan dispatcher"""
+        with self._cond:
+            if self._stopped:
+                return
+            self._stopped = True
+            self._cond.notify_all()
+        # lepas referensi dari atexit, provider yang sudah di close bisa di GC
+        atexit.unregister(self.close)
+        self._dispatcher.join()
+        self._executor.shutdown(wait=True)
+
+    # helper internal
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._pending and not self._stopped:
+                    self._cond.wait()
+                if not self._pending:
+                    return      # stopped dan antrian kosong
+
+                # tunggu sampai batch penuh atau max_wait sejak prompt pertama
+                deadline = self._pending[0][2] + self.max_wait
+                while len(self._pending) < self.max_batch_size and not self._stopped:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+
+                batch = self._pending[:self.max_batch_size]
+                del self._pending[:self.max_batch_size]
+
+            self._executor.submit(self._dispatch, batch)
+
+    def _dispatch(self, batch: List[tuple]):
+        prompts = [prompt for prompt, _, _ in batch]
+        start = time.perf_counter()
+        try:
+            responses = self.provider.generate_batch(prompts)
+            if len(responses) != len(prompts):
+                raise ValueError(f"generate_batch return {len(responses)} response untuk {len(prompts)} prompt")
+        except Exception as e:
+            responses = [f"[Batch error] {str(e)}"] * len(prompts)
+
+        with self._cond:
+            self.batches_dispatched += 1
+            self.prompts_dispatched += len(prompts)
+
+        for (_, future, _), response in zip(batch, responses):
+            future.set_result(response)
+
+        self.notify_observers("batch_dispatched", {
+            "provider"   : self.get_provider_name(),
+            "batch_size" : len(prompts),
+            "latency"    : time.perf_counter() - start,
+            "queue_wait" : time.monotonic() - batch[0][2],
+        })
+
+# ============================================
+# 13. DEMO APPLICATION
 # ============================================
 
 
@@ -315,6 +1858,115 @@ def demo_gemini():
     question = input("INPUT QUESTION : ")
     print(assistant.ask(question))
 
+class _StandInClient:
+    """client lokal pengganti GenerativeModel, constructor sengaja mahal (auth, channel, dll)"""
+
+    def __init__(self, setup_cost: float):
+        time.sleep(setup_cost)
+
+    def generate_content(self, prompt: str) -> str:
+        return f"[Stand-in] {prompt}"
+
+
+class StandInProvider(AIProviderInterface):
+    """Provider lokal untuk benchmark overhead client, tanpa network"""
+
+    def __init__(self, setup_cost: float = 0.002, pooled: bool = True, pool_size: int = 4):
+        self.setup_cost = setup_cost
+        self.pooled = pooled
+        self._pool = ClientPool(lambda: _StandInClient(setup_cost), size=pool_size)
+
+    def generate_response(self, prompt: str) -> str:
+        # pooled = reuse client, tidak pooled = perilaku lama (client baru tiap request)
+        client = self._pool.get() if self.pooled else _StandInClient(self.setup_cost)
+        return client.generate_content(prompt)
+
+    def get_provider_name(self) -> str:
+        return "Stand-in"
+
+    def is_available(self) -> bool:
+        return True
+
+    def warm_up(self):
+        self._pool.warm_up()
+
+
+def demo_client_pool_overhead(n_requests: int = 200, setup_cost: float = 0.002):
+    """Benchmark overhead per request: client baru tiap request vs ClientPool"""
+
+    print("\n" + "=" * 60)
+    print("DEMO CLIENT POOL OVERHEAD (STAND-IN PROVIDER)")
+    print("=" * 60)
+
+    for label, pooled in [("client per request", False), ("client pool", True)]:
+        provider = StandInProvider(setup_cost=setup_cost, pooled=pooled)
+        provider.warm_up()
+        assistant = AIAssistantManager(provider)
+
+        start = time.perf_counter()
+        for i in range(n_requests):
+            assistant.ask(f"pertanyaan ke-{i}")
+        per_request = (time.perf_counter() - start) / n_requests
+
+        print(f"{label:<20}: {per_request * 1e6:10.1f} us/request")
+
+
+def demo_router_tail_latency(n_requests: int = 50):
+    """Bandingkan tail latency satu provider vs RouterProvider dengan hedging"""
+
+    print("\n" + "=" * 60)
+    print("DEMO ROUTER : HEDGING & FAILOVER (MOCK PROVIDER)")
+    print("=" * 60)
+
+    def build_providers():
+        # provider A kadang sangat lambat, B stabil, C selalu gagal
+        return [
+            MockAIProvider(latency=0.01, jitter=0.2, name="Mock-A", seed=1),
+            MockAIProvider(latency=0.03, jitter=0.01, name="Mock-B", seed=2),
+            MockAIProvider(failure_rate=1.0, name="Mock-C"),
+        ]
+
+    single = build_providers()[0]
+    router = RouterProvider(build_providers(), min_hedge_delay=0.03)
+
+    for label, provider in [("single provider", single), ("router", router)]:
+        latencies = []
+        for i in range(n_requests):
+            start = time.perf_counter()
+            provider.generate_response(f"pertanyaan ke-{i}")
+            latencies.append(time.perf_counter() - start)
+        latencies.sort()
+        p50 = latencies[len(latencies) // 2]
+        p99 = latencies[min(int(0.99 * len(latencies)), len(latencies) - 1)]
+        print(f"{label:<16}: p50 {p50 * 1000:7.1f} ms | p99 {p99 * 1000:7.1f} ms")
+
+    print(json.dumps(router.stats(), indent=2))
+
+
+def demo_async_throughput(n_requests: int = 20, latency: float = 0.2, max_concurrency: int = 8):
+    """Benchmark offline: ask serial vs ask_many pakai MockAIProvider dengan latency"""
+
+    print("\n" + "=" * 60)
+    print("DEMO ASYNC THROUGHPUT (MOCK PROVIDER)")
+    print("=" * 60)
+
+    provider = AIProviderFactory.create_provider("mock", latency=latency)
+    assistant = AIAssistantManager(provider, max_concurrency=max_concurrency)
+    questions = [f"pertanyaan ke-{i}" for i in range(n_requests)]
+
+    start = time.perf_counter()
+    for q in questions:
+        assistant.ask(q)
+    serial_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    results = asyncio.run(assistant.ask_many(questions))
+    async_time = time.perf_counter() - start
+
+    print(f"Serial    : {serial_time:.2f}s ({n_requests / serial_time:.1f} req/s)")
+    print(f"ask_many  : {async_time:.2f}s ({n_requests / async_time:.1f} req/s)")
+    print(f"Urutan hasil sesuai input: {results == [f'[Mock AI] Echo: {q}' for q in questions]}")
+
 if __name__ == "__main__":
     print("\n" + "=" * 60)
     api_key = os.getenv("GEMINI_API_KEY")
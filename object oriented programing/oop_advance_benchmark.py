@@ -0,0 +1,348 @@
+"""
+===========================================
+LOAD TEST - AI ASSISTANT MANAGER (OFFLINE)
+===========================================
+
+benchmark cli untuk AIAssistantManager + formatter + observer
+tanpa api asli, provider yang dipakai :
+1. MockAIProvider (latency / jitter / failure di inject)
+2. stub HTTP server lokal (request benar2 lewat socket)
+
+hasil (req/s, latency percentile, memory growth) di print sebagai JSON
+supaya bisa dibandingkan antar versi
+- req/s dan latency dari pass yang tidak di trace (RSS saat ini sebelum/sesudah pass itu)
+- traced memory dari pass kedua (workload sama) dengan tracemalloc aktif
+
+contoh :
+    python oop_advance_benchmark.py --requests 500 --concurrency 32 --mode async
+    python oop_advance_benchmark.py --provider http --latency 0.02 --formatter json
+"""
+import argparse
+import asyncio
+import concurrent.futures
+import json
+import platform
+import random
+import resource
+import statistics
+import threading
+import time
+import tracemalloc
+import urllib.request
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+
+from oop_advance import (
+    AIAssistantManager,
+    AIProviderInterface,
+    AssistantMetrics,
+    DetailedFormatter,
+    JSONFormatter,
+    LoggerObserver,
+    MetricCollector,
+    MockAIProvider,
+    PlainTextFormatter,
+)
+
+
+# ============================================
+# 1. STUB HTTP SERVER - pengganti api asli
+# ============================================
+class _StubHandler(BaseHTTPRequestHandler):
+    """echo prompt dengan latency yang di inject (diatur lewat atribut server)"""
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        prompt = json.loads(self.rfile.read(length) or b"{}").get("prompt", "")
+
+        server = self.server
+        delay = server.latency + (server.rng.uniform(0, server.jitter) if server.jitter > 0 else 0.0)
+        if delay > 0:
+            time.sleep(delay)
+
+        if server.failure_rate > 0 and server.rng.random() < server.failure_rate:
+            status, body = 500, {"error": "simulated failure"}
+        else:
+            status, body = 200, {"text": f"[Stub HTTP] Echo: {prompt}"}
+
+        payload = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        # jangan print access log, output harus JSON bersih
+        pass
+
+
+class _StubServer(ThreadingHTTPServer):
+    # backlog default (5) terlalu kecil untuk concurrency tinggi -> koneksi di retry 1 detik
+    request_queue_size = 1024
+    daemon_threads = True
+
+
+def start_stub_server(latency: float = 0.0, jitter: float = 0.0, failure_rate: float = 0.0,
+                      seed: Optional[int] = None) -> ThreadingHTTPServer:
+    """jalankan stub server di port acak (thread background)"""
+    server = _StubServer(("127.0.0.1", 0), _StubHandler)
+    server.latency = latency
+    server.jitter = jitter
+    server.failure_rate = failure_rate
+    server.rng = random.Random(seed)
+    threading.Thread(target=server.serve_forever, name="StubHTTPServer", daemon=True).start()
+    return server
+
+
+class HTTPStubProvider(AIProviderInterface):
+    """Provider yang memanggil stub HTTP server lokal"""
+
+    def __init__(self, url: str, timeout: float = 30.0):
+        self.url = url
+        self.timeout = timeout
+
+    def generate_response(self, prompt: str) -> str:
+        request = urllib.request.Request(
+            self.url,
+            data=json.dumps({"prompt": prompt}).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                return json.loads(response.read())["text"]
+        except Exception as e:
+            return f"[HTTP error] {str(e)}"
+
+    def get_provider_name(self) -> str:
+        return "Stub HTTP"
+
+    def is_available(self) -> bool:
+        return True
+
+
+# ============================================
+# 2. WORKLOAD - prompt sintetis
+# ============================================
+WORDS = ("data", "model", "python", "latency", "cache", "token", "observer",
+         "pattern", "async", "request", "gemini", "numpy", "vector", "batch")
+
+
+def prompt_sizes(n: int, distribution: str, mean_words: int, max_words: int, rng: random.Random) -> List[int]:
+    """
+    ukuran prompt (jumlah kata) per request
+    - fixed     : semua mean_words
+    - uniform   : acak 1..max_words
+    - lognormal : ekor panjang di sekitar mean_words, dipotong di max_words
+    """
+    if distribution == "fixed":
+        return [mean_words] * n
+    if distribution == "uniform":
+        return [rng.randint(1, max_words) for _ in range(n)]
+    if distribution == "lognormal":
+        return [min(max_words, max(1, int(rng.lognormvariate(0, 0.75) * mean_words))) for _ in range(n)]
+    raise ValueError(f"Unknow distribution : {distribution}")
+
+
+def build_prompts(sizes: List[int], rng: random.Random) -> List[str]:
+    return [" ".join(rng.choice(WORDS) for _ in range(size)) for size in sizes]
+
+
+# ============================================
+# 3. RUNNER - sync (thread pool) dan async (asyncio)
+# ============================================
+def run_sync(assistant: AIAssistantManager, prompts: List[str], concurrency: int) -> List[float]:
+    """jalankan ask dari banyak thread, return latency per request"""
+
+    def timed_ask(prompt: str) -> float:
+        start = time.perf_counter()
+        assistant.ask(prompt)
+        return time.perf_counter() - start
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=concurrency) as executor:
+        return list(executor.map(timed_ask, prompts))
+
+
+def run_async(assistant: AIAssistantManager, prompts: List[str], concurrency: int) -> List[float]:
+    """jalankan ask_async dengan batas concurrency, return latency per request"""
+
+    async def main() -> List[float]:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def timed_ask(prompt: str) -> float:
+            async with semaphore:
+                start = time.perf_counter()
+                await assistant.ask_async(prompt)
+                return time.perf_counter() - start
+
+        return list(await asyncio.gather(*(timed_ask(p) for p in prompts)))
+
+    return asyncio.run(main())
+
+
+def _percentile(sorted_values: List[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(int(q * len(sorted_values)), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+def _current_rss_kb() -> int:
+    """RSS proses saat ini (bukan peak), supaya varian berikutnya tidak mewarisi peak varian sebelumnya
+    fallback ke ru_maxrss (peak) kalau /proc tidak ada (macOS / windows)"""
+    try:
+        with open("/proc/self/statm") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * resource.getpagesize() // 1024
+    except (OSError, ValueError, IndexError):
+        # linux : kilobytes, macOS : bytes
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return rss // 1024 if platform.system() == "Darwin" else rss
+
+
+def _drain_events(assistant: AIAssistantManager):
+    """tunggu event observer yang masih di queue EventBus (--event-bus) sampai terkirim,
+    supaya metrics yang dibaca setelah runner tidak kehilangan event"""
+    if assistant.event_bus is not None:
+        assistant.event_bus.flush()
+
+
+# ============================================
+# 4. BENCHMARK
+# ============================================
+FORMATTERS = {
+    "plain"    : PlainTextFormatter,
+    "detailed" : DetailedFormatter,
+    "json"     : JSONFormatter,
+}
+
+
+def run_benchmark(args: argparse.Namespace) -> Dict:
+    """jalankan satu benchmark sesuai argumen cli, return report dict"""
+    rng = random.Random(args.seed)
+
+    server = None
+    if args.provider == "http":
+        server = start_stub_server(args.latency, args.jitter, args.failure_rate, args.seed)
+        provider = HTTPStubProvider(f"http://127.0.0.1:{server.server_address[1]}/generate")
+    else:
+        provider = MockAIProvider(latency=args.latency, jitter=args.jitter,
+                                  failure_rate=args.failure_rate, seed=args.seed)
+
+    assistant = AIAssistantManager(provider, max_concurrency=args.concurrency,
+                                   history_size=args.history_size)
+    assistant.set_formatter(FORMATTERS[args.formatter]())
+
+    if "collector" in args.observers:
+        assistant.attach_observer(MetricCollector())
+    if "logger" in args.observers:
+        assistant.attach_observer(LoggerObserver())
+    if args.event_bus:
+        assistant.enable_event_bus()
+
+    sizes = prompt_sizes(args.requests, args.prompt_dist, args.prompt_words, args.prompt_max_words, rng)
+    prompts = build_prompts(sizes, rng)
+    runner = run_async if args.mode == "async" else run_sync
+
+    if args.warmup > 0:
+        runner(assistant, prompts[:args.warmup], args.concurrency)
+
+    # metrics dipasang setelah warmup supaya error rate hanya dari run utama
+    metrics = AssistantMetrics()
+    assistant.attach_observer(metrics)
+
+    # pass 1 (di ukur waktunya) : tanpa tracemalloc, karena tracing memperlambat sync dan async
+    # dengan kadar berbeda -> req/s dan latency jadi tidak bisa dibandingkan
+    rss_before = _current_rss_kb()
+    start = time.perf_counter()
+    latencies = runner(assistant, prompts, args.concurrency)
+    elapsed = time.perf_counter() - start
+    _drain_events(assistant)
+    rss_after = _current_rss_kb()
+    summary = metrics.summary().get(provider.get_provider_name(), {})
+
+    # pass 2 (tidak di ukur waktunya) : workload yang sama dengan tracemalloc untuk memory growth
+    memory_growth = memory_peak = None
+    if not args.skip_memory:
+        tracemalloc.start()
+        memory_before, _ = tracemalloc.get_traced_memory()
+        runner(assistant, prompts, args.concurrency)
+        _drain_events(assistant)
+        memory_after, memory_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        memory_growth = memory_after - memory_before
+
+    assistant.shutdown()
+    if server is not None:
+        server.shutdown()
+
+    latencies.sort()
+    return {
+        "timestamp" : datetime.now().isoformat(),
+        "python"    : platform.python_version(),
+        "config"    : vars(args),
+        "throughput": {
+            "requests"        : len(latencies),
+            "elapsed_seconds" : elapsed,
+            "requests_per_sec": len(latencies) / elapsed if elapsed > 0 else 0.0,
+            "error_rate"      : summary.get("error_rate", 0.0),
+        },
+        "latency_seconds": {
+            "mean" : statistics.fmean(latencies) if latencies else 0.0,
+            "p50"  : _percentile(latencies, 0.50),
+            "p95"  : _percentile(latencies, 0.95),
+            "p99"  : _percentile(latencies, 0.99),
+            "max"  : latencies[-1] if latencies else 0.0,
+        },
+        "memory": {
+            "traced_growth_bytes" : memory_growth,
+            "traced_peak_bytes"   : memory_peak,
+            "rss_before_kb"       : rss_before,
+            "rss_growth_kb"       : rss_after - rss_before,
+        },
+        "prompt_words": {
+            "mean" : statistics.fmean(sizes) if sizes else 0.0,
+            "max"  : max(sizes) if sizes else 0,
+        },
+    }
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Load test offline untuk AIAssistantManager")
+    parser.add_argument("--provider", choices=["mock", "http"], default="mock")
+    parser.add_argument("--mode", choices=["sync", "async"], default="async")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.01, help="latency dasar provider (detik)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="tambahan latency acak 0..jitter (detik)")
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--prompt-dist", choices=["fixed", "uniform", "lognormal"], default="lognormal")
+    parser.add_argument("--prompt-words", type=int, default=30, help="rata2 jumlah kata per prompt")
+    parser.add_argument("--prompt-max-words", type=int, default=500)
+    parser.add_argument("--formatter", choices=sorted(FORMATTERS), default="detailed")
+    parser.add_argument("--observers", nargs="*", choices=["collector", "logger"], default=[],
+                        help="observer tambahan (keduanya print, pakai --output supaya JSON tetap bersih)")
+    parser.add_argument("--event-bus", action="store_true", help="kirim event observer lewat EventBus")
+    parser.add_argument("--history-size", type=int, default=1000)
+    parser.add_argument("--skip-memory", action="store_true",
+                        help="lewati pass kedua (tracemalloc) untuk traced memory growth")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="simpan report JSON ke file (default : stdout)")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None):
+    args = parse_args(argv)
+    report = json.dumps(run_benchmark(args), indent=2)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(report + "\n")
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -14,9 +14,81 @@ from sklearn.linear_model import LogisticRegression
 from sklearn.tree import DecisionTreeClassifier
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.svm import SVC
-from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_score
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
+from collections import deque
+from multiprocessing import shared_memory
+import bisect
+import concurrent.futures
+import hashlib
+import itertools
+import joblib
+import json
+import math
+import os
+import random
+import threading
 import time
+# ========================================
+# LATENCY HISTOGRAM
+# ========================================
+
+class LatencyHistogram:
+    """
+    histogram latency dengan bucket tetap (skala log, 50us sampai ~52 detik)
+    murah untuk di update per batch, percentile diperkirakan dari bucket
+    """
+
+    BUCKETS = tuple(0.00005 * 2 ** i for i in range(21))
+
+    def __init__(self):
+        self.counts = [0] * (len(self.BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds):
+        with self._lock:
+            self.counts[bisect.bisect_left(self.BUCKETS, seconds)] += 1
+            self.count += 1
+            self.total += seconds
+            self.max = max(self.max, seconds)
+
+    def percentile(self, q):
+        """perkiraan percentile q (0..1), interpolasi linear di dalam bucket"""
+        if self.count == 0:
+            return 0.0
+        target = q * self.count
+        cumulative = 0
+        for i, bucket_count in enumerate(self.counts):
+            if bucket_count and cumulative + bucket_count >= target:
+                lower = self.BUCKETS[i - 1] if i > 0 else 0.0
+                upper = self.BUCKETS[i] if i < len(self.BUCKETS) else self.max
+                return min(lower + (upper - lower) * (target - cumulative) / bucket_count, self.max)
+            cumulative += bucket_count
+        return self.max
+
+    def summary(self):
+        return {
+            'count' : self.count,
+            'mean'  : self.total / self.count if self.count else 0.0,
+            'p50'   : self.percentile(0.50),
+            'p95'   : self.percentile(0.95),
+            'p99'   : self.percentile(0.99),
+            'max'   : self.max,
+        }
+
+    def __getstate__(self):
+        # lock tidak bisa di pickle (model dikirim ke process pool / disimpan joblib)
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+
 # ========================================
 # BASE MODEL CLASS (Abstract)
 # ========================================
@@ -38,6 +110,7 @@ class BaseModel(ABC):
         self.is_trained = False #flag training status
         self.training_time = 0  # waktu training
         self.config = kwargs    # simpan configurasi
+        self.inference_latency = LatencyHistogram()  # latency per batch dari predict_batches
 
     @abstractmethod
     def build_models(self):
@@ -48,19 +121,27 @@ class BaseModel(ABC):
         """
         pass
 
-    def train(self, X_train, y_train):
+    def train(self, X_train, y_train, cache: Optional["ModelCache"] = None):
         """
         train model pada data
         method concrete yang bisa dipakai semua child class
         args :
             X_train : training features
             y_train : training target
+            cache : ModelCache opsional, kalau model identik sudah ada fit di skip
             returns : self (untuk method chaining )
         :param X_train:
         :param y_train:
         :return:
         """
 
+        # cek cache dulu : config + data sama -> load, tidak perlu fit ulang
+        if cache is not None:
+            key = cache.make_key(self, X_train, y_train)
+            if cache.load_into(self, key):
+                print(f"\n Loaded {self.name} from cache ({key[:12]})")
+                return self
+
         #build model jika belum ada
         if self.model is None:
             self.build_models()
@@ -78,8 +159,31 @@ class BaseModel(ABC):
         self.is_trained = True
 
         print(f" Training comepleted in {self.training_time:.2f}s")
+
+        if cache is not None:
+            cache.store(self, key)
         return self # return self untuk chaining
 
+    def save(self, path):
+        """
+        simpan seluruh object model (wrapper + model sklearn) ke file
+        args :
+            path : lokasi file (.joblib)
+        """
+        joblib.dump(self, path)
+        return path
+
+    @classmethod
+    def load(cls, path, mmap_mode='r'):
+        """
+        load model dari file hasil save()
+        mmap_mode='r' : array besar (mis. tree di random forest) di memory-map, dibaca lazy
+        """
+        model = joblib.load(path, mmap_mode=mmap_mode)
+        if not isinstance(model, cls):
+            raise TypeError(f"{path} berisi {type(model).__name__}, bukan {cls.__name__}")
+        return model
+
     def predict(self, X):
         """
         make prediction
@@ -94,6 +198,55 @@ class BaseModel(ABC):
 
         return self.model.predict(X)
 
+    def predict_batches(self, X_iter, batch_size=1024, n_jobs=1, method="predict"):
+        """
+        prediksi per batch (generator), peak memory dibatasi ukuran batch
+        args :
+        X_iter : array besar (dipotong per batch_size) atau iterator chunk array
+        batch_size : jumlah baris maksimum per batch
+        n_jobs : > 1 = batch dijalankan di thread pool (urutan hasil tetap)
+        method : "predict" atau "predict_proba"
+        yields : hasil prediksi per batch
+        latency tiap batch dicatat di self.inference_latency
+        """
+        if not self.is_trained:
+            raise ValueError(f"{self.name} is not trained")
+        if method not in ("predict", "predict_proba"):
+            raise ValueError(f"Unknow method : {method}")
+        predict_fn = getattr(self, method)
+
+        def run_batch(batch):
+            start = time.perf_counter()
+            result = predict_fn(batch)
+            self.inference_latency.observe(time.perf_counter() - start)
+            return result
+
+        batches = self._iter_batches(X_iter, batch_size)
+        if n_jobs <= 1:
+            for batch in batches:
+                yield run_batch(batch)
+            return
+
+        # thread pool dengan jumlah batch in-flight terbatas supaya memory tetap kecil
+        with concurrent.futures.ThreadPoolExecutor(max_workers=n_jobs) as executor:
+            pending = deque()
+            for batch in batches:
+                pending.append(executor.submit(run_batch, batch))
+                if len(pending) >= 2 * n_jobs:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    @staticmethod
+    def _iter_batches(X_iter, batch_size):
+        """potong array / iterator chunk menjadi batch dengan ukuran maksimum batch_size"""
+        if batch_size < 1:
+            raise ValueError("batch_size minimal 1")
+        chunks = [X_iter] if hasattr(X_iter, "shape") else X_iter
+        for chunk in chunks:
+            for start in range(0, len(chunk), batch_size):
+                yield chunk[start:start + batch_size]
+
     def predict_proba(self, X):
         """
         predict probabilities ( untuk model yang support )
@@ -160,6 +313,7 @@ class LogisticRegressionModel(BaseModel):
                Buat instance LogisticRegression dari sklearn
         """
         self.model = LogisticRegression(
+            C=self.config.get('C',1.0),
             max_iter= self.config.get('max_iter',1000),
             random_state=self.config.get('random_state',42),
         )
@@ -167,16 +321,19 @@ class LogisticRegressionModel(BaseModel):
 class DecisionTreeModel(BaseModel):
     """Decision Tree Model wrapper"""
 
-    def __init__(self,max_dept=None,random_state = 42,**kwargs):
+    def __init__(self,max_depth=None,random_state = 42,**kwargs):
         """
         Constructor DecisionTreeModel
         Args:
             max_depth: kedalaman maksimum tree (None = unlimited)
             random_state: seed
         """
+        # nama lama (typo) tetap diterima
+        if 'max_dept' in kwargs:
+            max_depth = kwargs.pop('max_dept')
         super().__init__(
             name = "Decision Tree",
-            max_dept= max_dept,
+            max_depth= max_depth,
             random_state=random_state,
             **kwargs
         )
@@ -237,11 +394,174 @@ class SVMModel(BaseModel):
     def build_models(self):
         self.model = SVC(
             kernel=self.config.get('kernel','rbf'),
-            C=self.cofig.get('C',1.0),
+            C=self.config.get('C',1.0),
             random_state=self.config.get('random_state',42),
             probability=True        #enable predict_proba
         )
 
+# ========================================
+# MODEL ARTIFACT CACHE
+# ========================================
+
+class ModelCache:
+    """
+    cache model yang sudah di train di disk (content addressed)
+    key = hash(class model + config + fingerprint data training)
+    - model identik tidak perlu di fit ulang di process berikutnya
+    - artifact disimpan pakai joblib, di load dengan memory-map (lazy)
+    - catat hit/miss dan waktu load
+    """
+
+    def __init__(self, cache_dir="model_cache", mmap_mode='r'):
+        """
+        Args:
+            cache_dir: folder penyimpanan artifact
+            mmap_mode: mode memory-map saat load (None = load penuh ke memory)
+        """
+        self.cache_dir = cache_dir
+        self.mmap_mode = mmap_mode
+        self.hits = 0
+        self.misses = 0
+        self.load_times = []    # detik per load yang berhasil
+        os.makedirs(cache_dir, exist_ok=True)
+
+    @staticmethod
+    def data_fingerprint(X, y):
+        """hash isi data training (joblib.hash menghash buffer numpy secara langsung)"""
+        return joblib.hash((np.asarray(X), np.asarray(y)))
+
+    def make_key(self, model : BaseModel, X, y):
+        config = json.dumps(model.config, sort_keys=True, default=str)
+        raw = f"{type(model).__module__}.{type(model).__qualname__}|{config}|{self.data_fingerprint(X, y)}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _paths(self, key):
+        base = os.path.join(self.cache_dir, key)
+        return base + ".joblib", base + ".json"
+
+    def load_into(self, model : BaseModel, key):
+        """isi model dari cache, return True kalau hit"""
+        artifact_path, meta_path = self._paths(key)
+        if not (os.path.exists(artifact_path) and os.path.exists(meta_path)):
+            self.misses += 1
+            return False
+
+        start = time.perf_counter()
+        with open(meta_path, encoding="utf-8") as f:
+            meta = json.load(f)
+        model.model = joblib.load(artifact_path, mmap_mode=self.mmap_mode)
+        model.training_time = meta.get("training_time", 0)
+        model.is_trained = True
+        self.load_times.append(time.perf_counter() - start)
+        self.hits += 1
+        return True
+
+    def store(self, model : BaseModel, key):
+        """simpan model sklearn + metadata, tulis ke file sementara dulu supaya atomic"""
+        artifact_path, meta_path = self._paths(key)
+        tmp_artifact = f"{artifact_path}.{os.getpid()}.tmp"
+        joblib.dump(model.model, tmp_artifact)
+        os.replace(tmp_artifact, artifact_path)
+
+        meta = {
+            "name"          : model.name,
+            "class"         : type(model).__name__,
+            "config"        : model.config,
+            "training_time" : model.training_time,
+            "created_at"    : time.time(),
+        }
+        tmp_meta = f"{meta_path}.{os.getpid()}.tmp"
+        with open(tmp_meta, "w", encoding="utf-8") as f:
+            json.dump(meta, f, default=str)
+        os.replace(tmp_meta, meta_path)
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            'hits'          : self.hits,
+            'misses'        : self.misses,
+            'hit_rate'      : self.hits / total if total else 0.0,
+            'avg_load_time' : sum(self.load_times) / len(self.load_times) if self.load_times else 0.0,
+        }
+
+
+# ========================================
+# CONFUSION MATRIX ENGINE
+# ========================================
+
+class ConfusionMatrixAccumulator:
+    """
+    hitung semua metrics dari satu confusion matrix
+    - confusion matrix dibangun dengan satu kali np.bincount (vectorized)
+    - bisa di update per chunk (streaming) untuk test set yang tidak muat di memory
+    - accuracy, precision, recall, f1 (weighted) diturunkan dari matrix yang sama
+    """
+
+    def __init__(self, labels=None):
+        """
+        Args:
+            labels: daftar label kalau sudah diketahui (None = dicari otomatis dari data)
+        """
+        self.labels = np.array([]) if labels is None else np.unique(np.asarray(labels))
+        k = len(self.labels)
+        self.matrix = np.zeros((k, k), dtype=np.int64)  # baris = true, kolom = pred
+
+    def update(self, y_true, y_pred):
+        """tambah satu chunk prediksi ke confusion matrix"""
+        y_true = np.asarray(y_true).ravel()
+        y_pred = np.asarray(y_pred).ravel()
+        if y_true.shape != y_pred.shape:
+            raise ValueError("y_true dan y_pred harus punya panjang yang sama")
+        if y_true.size == 0:
+            return self
+
+        # label baru di chunk ini -> perbesar matrix
+        chunk_labels = np.unique(np.concatenate([y_true, y_pred]))
+        if self.labels.size == 0 or not np.isin(chunk_labels, self.labels).all():
+            self._grow(chunk_labels)
+
+        k = len(self.labels)
+        true_idx = np.searchsorted(self.labels, y_true)
+        pred_idx = np.searchsorted(self.labels, y_pred)
+        self.matrix += np.bincount(true_idx * k + pred_idx, minlength=k * k).reshape(k, k)
+        return self
+
+    def _grow(self, new_labels):
+        labels = np.union1d(self.labels, new_labels) if self.labels.size else np.asarray(new_labels)
+        matrix = np.zeros((len(labels), len(labels)), dtype=np.int64)
+        if self.labels.size:
+            idx = np.searchsorted(labels, self.labels)
+            matrix[np.ix_(idx, idx)] = self.matrix
+        self.labels, self.matrix = labels, matrix
+
+    def compute(self):
+        """
+        turunkan metrics dari confusion matrix
+        weighted average + zero_division=0 (sama seperti sklearn average='weighted')
+        """
+        total = self.matrix.sum()
+        if total == 0:
+            return {'accuracy': 0.0, 'precision': 0.0, 'recall': 0.0, 'f1': 0.0, 'n_samples': 0}
+
+        tp = np.diag(self.matrix).astype(float)
+        support = self.matrix.sum(axis=1)       # jumlah true per label
+        predicted = self.matrix.sum(axis=0)     # jumlah prediksi per label
+
+        precision = np.divide(tp, predicted, out=np.zeros_like(tp), where=predicted > 0)
+        recall = np.divide(tp, support, out=np.zeros_like(tp), where=support > 0)
+        denom = precision + recall
+        f1 = np.divide(2 * precision * recall, denom, out=np.zeros_like(tp), where=denom > 0)
+        weights = support / total
+
+        return {
+            'accuracy'  : float(tp.sum() / total),
+            'precision' : float(weights @ precision),
+            'recall'    : float(weights @ recall),
+            'f1'        : float(weights @ f1),
+            'n_samples' : int(total),
+        }
+
+
 # ========================================
 # MODEL EVALUATOR
 # ========================================
@@ -254,9 +574,10 @@ class ModelEvaluator:
 
     def __init__(self):
         """constructor - initialize result storage"""
-        self.results = {} # dictionaey untuk simpan hasil evaluasi
+        self.results = {} # dictionaey untuk simpan hasil evaluasi, key = result_key(model, dataset)
+        self._fold_cache = {} # fold assignment yang sudah dihitung (dipakai ulang semua model)
 
-    def evaluate(self,model : BaseModel, X_test, y_test, dataset_name: str = "Test"):
+    def evaluate(self,model : BaseModel, X_test, y_test, dataset_name: str = "Test", chunk_size: Optional[int] = None):
         """
         evaluate model performance
         :args:
@@ -264,7 +585,13 @@ class ModelEvaluator:
         X_test: test features
         y_test: test target
         dataset_name: dataset name ( display)
+        chunk_size: kalau di isi, predict + hitung metrics per chunk (hemat memory)
         """
+        if chunk_size is not None:
+            batches = ((X_test[i:i + chunk_size], y_test[i:i + chunk_size])
+                       for i in range(0, len(y_test), chunk_size))
+            return self.evaluate_stream(model, batches, dataset_name)
+
         print(f"\n Evaluating {model.name} on {dataset_name} set...")
         print("=" * 60)
 
@@ -272,46 +599,601 @@ class ModelEvaluator:
         y_pred = model.predict(X_test)
 
         #calculate berbagai metrics
-        metrics ={
-        'model_name'    : model.name,
-        'accuracy'      : accuracy_score(y_test,y_pred),
-        'precision'     : precision_score(y_test,y_pred,average='weighted', zero_division=0),
-        'recall'        : recall_score(y_test,y_pred, average='weighted', zero_division=0),
-        'f1'            : f1_score(y_test,y_pred, average='weighted', zero_division=0),
-        'training_time' : model.training_time
-        }
+        metrics = self.compute_metrics(model, y_test, y_pred)
 
         # store result untuk comparsion
-        self.results[dataset_name] = metrics
+        self.results[self.result_key(model, dataset_name)] = metrics
 
         #output
+        self.print_metrics(metrics)
+
+        return metrics
+
+    def evaluate_stream(self, model : BaseModel, batches, dataset_name: str = "Test", labels=None):
+        """
+        evaluate model dari iterator (X_chunk, y_chunk)
+        untuk test set yang tidak muat di memory, hanya confusion matrix yang disimpan
+        """
+        print(f"\n Evaluating {model.name} on {dataset_name} set (streaming)...")
+        print("=" * 60)
+
+        accumulator = ConfusionMatrixAccumulator(labels)
+        for X_chunk, y_chunk in batches:
+            accumulator.update(y_chunk, model.predict(X_chunk))
+
+        metrics = {'model_name': model.name, **accumulator.compute(), 'training_time': model.training_time}
+        self.results[self.result_key(model, dataset_name)] = metrics
+        self.print_metrics(metrics)
+        return metrics
+
+    @staticmethod
+    def result_key(model : BaseModel, dataset_name: str):
+        """
+        key self.results : (nama model, dataset, config)
+        config ikut supaya model sama dengan parameter beda (mis. max_depth lain, hasil refit
+        hyperparameter search) tidak saling timpa
+        """
+        return (model.name, dataset_name, json.dumps(model.config, sort_keys=True, default=str))
+
+    @staticmethod
+    def compute_metrics(model : BaseModel, y_test, y_pred):
+        """
+        hitung metrics dari hasil prediksi (tanpa print / simpan)
+        semua metrics dari satu confusion matrix (ConfusionMatrixAccumulator)
+        """
+        return {
+        'model_name'    : model.name,
+        **ConfusionMatrixAccumulator().update(y_test, y_pred).compute(),
+        'training_time' : model.training_time
+        }
+
+    @staticmethod
+    def print_metrics(metrics):
         print(f"Accuracy:  {metrics['accuracy']:.4f}")
         print(f"Precision: {metrics['precision']:.4f}")
         print(f"Recall:    {metrics['recall']:.4f}")
         print(f"F1-Score:  {metrics['f1']:.4f}")
         print(f"Training time: {metrics['training_time']:.2f}s")
 
-        return metrics
-
     def comapare_models(self):
         """
             Compare semua model yang sudah dievaluasi
-            Print comparison table
+            Print comparison table, dikelompokkan per dataset
+            kolom Protocol : 'holdout' (evaluate / runner) atau 'k-fold CV' (cross_validate, ada ± std)
         """
         if not self.results:
             print("no models to compare")
             return
 
-        print("\n" + "=" * 80)
+        print("\n" + "=" * 150)
         print("MODEL COMPARSION")
-        print("\n" + "=" * 80)
+        print("\n" + "=" * 150)
 
         # HEADER TABLE
-        print(f"{'Model':<30} {'Acciracy':>10} {'F1-score':>10} {'Time (s)':>10}")
+        print(f"{'Model':<30} {'Config':<40} {'Dataset':<14} {'Protocol':<20} {'Acciracy':>10} {'± std':>8} "
+              f"{'F1-score':>10} {'± std':>8} {'Time (s)':>10}")
 
-        # sort models by accuracy (ascending)
+        # urut per dataset, di dalam dataset yang sama dari accuracy tertinggi
+        # (hasil holdout dan CV tidak di ranking jadi satu)
         sorted_models = sorted(
             self.results.items(),
-            key=lambda x: x[1] ['accuracy'],
-            reverse=True
-        )
\ No newline at end of file
+            key=lambda x: (x[0][1], -x[1]['accuracy'])
+        )
+
+        for (_, dataset_name, config), metrics in sorted_models:
+            # std hanya ada untuk hasil cross validation
+            acc_std = f"{metrics['accuracy_std']:.4f}" if 'accuracy_std' in metrics else "-"
+            f1_std = f"{metrics['f1_std']:.4f}" if 'f1_std' in metrics else "-"
+            protocol = metrics.get('protocol', 'holdout')
+            config = config if len(config) <= 40 else config[:37] + "..."
+            print(f"{metrics['model_name']:<30} {config:<40} {dataset_name:<14} {protocol:<20} {metrics['accuracy']:>10.4f} {acc_std:>8} "
+                  f"{metrics['f1']:>10.4f} {f1_std:>8} {metrics['training_time']:>10.2f}")
+
+        return sorted_models
+
+    # ---------- cross validation ----------
+    def make_folds(self, y, n_splits=5, stratified=True, shuffle=True, random_state=42):
+        """
+        hitung fold assignment sekali : array fold_ids (fold ke berapa setiap sampel masuk test)
+        hasil di cache, jadi semua model memakai fold yang sama
+        stratified=True : proporsi label di setiap fold sama (round-robin per label)
+        """
+        y = np.asarray(y)
+        key = (joblib.hash(y), n_splits, stratified, shuffle, random_state)
+        if key in self._fold_cache:
+            return self._fold_cache[key]
+
+        if n_splits < 2 or n_splits > len(y):
+            raise ValueError(f"n_splits harus antara 2 dan {len(y)}")
+
+        rng = np.random.default_rng(random_state)
+        fold_ids = np.empty(len(y), dtype=np.int32)
+        if stratified:
+            offset = 0
+            for label in np.unique(y):
+                idx = np.flatnonzero(y == label)
+                if shuffle:
+                    rng.shuffle(idx)
+                # lanjutkan round-robin antar label supaya ukuran fold tetap seimbang
+                fold_ids[idx] = (np.arange(len(idx)) + offset) % n_splits
+                offset += len(idx)
+        else:
+            order = rng.permutation(len(y)) if shuffle else np.arange(len(y))
+            fold_ids[order] = np.arange(len(y)) * n_splits // len(y)
+
+        self._fold_cache[key] = fold_ids
+        return fold_ids
+
+    def cross_validate(self, models, X, y, n_splits=5, stratified=True, random_state=42,
+                       n_jobs: Optional[int] = None, dataset_name: str = "CV"):
+        """
+        k-fold / stratified k-fold cross validation untuk list BaseModel
+        - fold dihitung sekali (make_folds) dan dipakai semua model
+        - X, y di share lewat shared memory, baris di urutkan per fold sekali di parent :
+          test set = slice (view, tanpa copy), train set = gabungan 2 slice -> satu copy per fold
+          di worker (estimator butuh satu matrix contiguous, mask boolean juga copy)
+        - setiap (model, fold) jalan paralel di process pool
+        - hasil : mean/std metrics + timing per fold di self.results
+        """
+        X, y = np.asarray(X), np.asarray(y)
+        fold_ids = self.make_folds(y, n_splits, stratified, True, random_state)
+        n_jobs = n_jobs or os.cpu_count() or 1
+
+        print(f"\n Cross validation : {len(models)} models x {n_splits} folds "
+              f"({'stratified' if stratified else 'k-fold'}, {n_jobs} workers)")
+
+        # baris fold yang sama jadi berurutan, fold k = baris bounds[k]:bounds[k+1]
+        order = np.argsort(fold_ids, kind="stable")
+        bounds = np.searchsorted(fold_ids[order], np.arange(n_splits + 1))
+
+        shared = [SharedArray.create(data) for data in (X[order], y[order])]
+        specs = [s.spec for s in shared]
+        try:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=n_jobs) as executor:
+                futures = {
+                    (i, fold): executor.submit(_run_fold, model, specs, fold,
+                                               int(bounds[fold]), int(bounds[fold + 1]))
+                    for i, model in enumerate(models)
+                    for fold in range(n_splits)
+                }
+                fold_results = {key: future.result() for key, future in futures.items()}
+        finally:
+            for s in shared:
+                s.unlink()
+
+        for i, model in enumerate(models):
+            folds = [fold_results[(i, fold)] for fold in range(n_splits)]
+            metrics = {'model_name': model.name,
+                       'protocol': f"{'stratified ' if stratified else ''}{n_splits}-fold CV"}
+            for name in ('accuracy', 'precision', 'recall', 'f1'):
+                values = np.array([f[name] for f in folds])
+                metrics[name] = float(values.mean())
+                metrics[f'{name}_std'] = float(values.std())
+            metrics['training_time'] = float(np.mean([f['fit_time'] for f in folds]))
+            metrics['predict_time'] = float(np.mean([f['predict_time'] for f in folds]))
+            metrics['folds'] = folds
+            self.results[self.result_key(model, dataset_name)] = metrics
+
+            print(f" {model.name:<28} accuracy {metrics['accuracy']:.4f} ± {metrics['accuracy_std']:.4f} | "
+                  f"f1 {metrics['f1']:.4f} ± {metrics['f1_std']:.4f}")
+
+        return {key: value for key, value in self.results.items() if key[1] == dataset_name}
+
+
+# ========================================
+# MODEL COMPARISON RUNNER (PARALLEL)
+# ========================================
+# training + evaluasi banyak model sekaligus di process pool
+# data di share lewat shared memory, tidak di pickle ulang per worker
+
+class SharedArray:
+    """
+    numpy array yang disimpan di shared memory
+    parent process create(), worker attach() lewat spec (nama, shape, dtype)
+    hanya untuk dtype tanpa python object (object array isinya pointer, tidak valid di process lain)
+    """
+
+    def __init__(self, shm, array):
+        self.shm = shm          # object SharedMemory
+        self.array = array      # numpy view ke buffer shared memory
+
+    @classmethod
+    def create(cls, data):
+        """copy data ke shared memory baru (sekali di parent)"""
+        data = np.ascontiguousarray(data)
+        if data.dtype.hasobject:
+            raise ValueError(f"SharedArray tidak bisa menyimpan dtype {data.dtype} (berisi pointer python object) ; "
+                             "ubah dulu ke dtype numerik / string, misal label encoding atau .astype(str)")
+        shm = shared_memory.SharedMemory(create=True, size=max(data.nbytes, 1))
+        array = np.ndarray(data.shape, dtype=data.dtype, buffer=shm.buf)
+        array[...] = data
+        return cls(shm, array)
+
+    @classmethod
+    def attach(cls, spec):
+        """buka shared memory yang sudah ada di worker"""
+        name, shape, dtype = spec
+        shm = shared_memory.SharedMemory(name=name)
+        return cls(shm, np.ndarray(shape, dtype=dtype, buffer=shm.buf))
+
+    @property
+    def spec(self):
+        """info kecil yang dikirim ke worker (bukan datanya)"""
+        return (self.shm.name, self.array.shape, self.array.dtype.str)
+
+    def close(self):
+        self.array = None
+        try:
+            self.shm.close()
+        except BufferError:
+            # masih ada view yang dipakai (mis. disimpan di dalam model), biarkan GC yang tutup
+            pass
+
+    def unlink(self):
+        self.close()
+        self.shm.unlink()
+
+
+def _train_and_evaluate_worker(model : BaseModel, specs, return_model: bool):
+    """
+    jalan di worker process : attach data, train, predict, hitung metrics
+    return dict metrics + wall/cpu time (dan model yang sudah di train)
+    """
+    shared = [SharedArray.attach(spec) for spec in specs]
+    try:
+        X_train, y_train, X_test, y_test = (s.array for s in shared)
+
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+
+        model.train(X_train, y_train)
+        y_pred = model.predict(X_test)
+        metrics = ModelEvaluator.compute_metrics(model, y_test, y_pred)
+
+        metrics['wall_time'] = time.perf_counter() - wall_start
+        metrics['cpu_time'] = time.process_time() - cpu_start
+        metrics['worker_pid'] = os.getpid()
+        return metrics, (model if return_model else None)
+    finally:
+        X_train = y_train = X_test = y_test = None
+        for s in shared:
+            s.close()
+
+
+def _run_fold(model : BaseModel, specs, fold, start, end):
+    """
+    jalan di worker process : satu fold cross validation
+    data di shared memory sudah di urutkan per fold, baris start:end = test set fold ini
+    - test set : view langsung ke shared memory (tanpa copy)
+    - train set : baris sebelum + sesudah fold -> satu copy (estimator butuh matrix contiguous)
+    """
+    shared = [SharedArray.attach(spec) for spec in specs]
+    try:
+        X, y = (s.array for s in shared)
+        X_test, y_test = X[start:end], y[start:end]
+
+        model.train(np.concatenate((X[:start], X[end:])), np.concatenate((y[:start], y[end:])))
+
+        predict_start = time.perf_counter()
+        y_pred = model.predict(X_test)
+        predict_time = time.perf_counter() - predict_start
+
+        metrics = ModelEvaluator.compute_metrics(model, y_test, y_pred)
+        metrics['fold'] = fold
+        metrics['fit_time'] = model.training_time
+        metrics['predict_time'] = predict_time
+        return metrics
+    finally:
+        X = y = X_test = y_test = None
+        for s in shared:
+            s.close()
+
+
+class ModelComparisonRunner:
+    """
+    train dan evaluate list BaseModel secara concurrent (process pool)
+    - X/y di copy ke shared memory sekali, worker hanya terima nama buffer
+    - hasil masuk ke ModelEvaluator.results
+    - catat wall-clock total dan cpu time per model
+    """
+
+    def __init__(self, models : List[BaseModel], evaluator : Optional[ModelEvaluator] = None,
+                 n_jobs : Optional[int] = None):
+        """
+        Args:
+            models: list object BaseModel yang mau dibandingkan
+            evaluator: ModelEvaluator tujuan hasil (default buat baru)
+            n_jobs: jumlah worker process (default = jumlah model / cpu)
+        """
+        self.models = models
+        self.evaluator = evaluator or ModelEvaluator()
+        self.n_jobs = n_jobs or min(len(models), os.cpu_count() or 1)
+        self.timing = {}    # ringkasan wall-clock vs cpu time run terakhir
+
+    def run(self, X_train, y_train, X_test, y_test, dataset_name: str = "Test", return_models: bool = True):
+        """
+        jalankan training + evaluasi semua model secara paralel
+        return_models: True = model di parent ikut diganti versi yang sudah di train
+        returns : dictionary results evaluator
+        """
+        print(f"\n Training {len(self.models)} models in parallel ({self.n_jobs} workers)...")
+
+        shared = [SharedArray.create(data) for data in (X_train, y_train, X_test, y_test)]
+        specs = [s.spec for s in shared]
+        wall_start = time.perf_counter()
+
+        try:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=self.n_jobs) as executor:
+                futures = [
+                    executor.submit(_train_and_evaluate_worker, model, specs, return_models)
+                    for model in self.models
+                ]
+                outputs = [future.result() for future in futures]
+        finally:
+            for s in shared:
+                s.unlink()
+
+        wall_time = time.perf_counter() - wall_start
+
+        for index, (metrics, trained) in enumerate(outputs):
+            if trained is not None:
+                self.models[index] = trained
+            self.evaluator.results[ModelEvaluator.result_key(self.models[index], dataset_name)] = metrics
+
+        cpu_total = sum(metrics['cpu_time'] for metrics, _ in outputs)
+        serial_total = sum(metrics['wall_time'] for metrics, _ in outputs)
+        self.timing = {
+            'wall_time'       : wall_time,
+            'cpu_time'        : cpu_total,
+            'serial_estimate' : serial_total,
+            'speedup'         : serial_total / wall_time if wall_time > 0 else 0.0,
+        }
+
+        print(f" Wall-clock: {wall_time:.2f}s | CPU time: {cpu_total:.2f}s | "
+              f"Serial estimate: {serial_total:.2f}s | Speedup: {self.timing['speedup']:.2f}x")
+        return self.evaluator.results
+
+
+# ========================================
+# HYPERPARAMETER SEARCH
+# ========================================
+# grid search, random search, dan successive halving di atas BaseModel
+# trial jalan paralel di process pool, hasil dicatat di journal (jsonl)
+# supaya search yang terputus bisa dilanjutkan tanpa hitung ulang
+
+def _run_trial(model_class, params, specs, n_samples):
+    """
+    jalan di worker process : train model_class(**params) pada n_samples baris pertama
+    data training (sudah di shuffle di parent), evaluasi di validation set
+    """
+    shared = [SharedArray.attach(spec) for spec in specs]
+    try:
+        X_train, y_train, X_val, y_val = (s.array for s in shared)
+        model = model_class(**params)
+
+        cpu_start = time.process_time()
+        model.train(X_train[:n_samples], y_train[:n_samples])
+        metrics = ModelEvaluator.compute_metrics(model, y_val, model.predict(X_val))
+        metrics['cpu_time'] = time.process_time() - cpu_start
+        return metrics
+    finally:
+        X_train = y_train = X_val = y_val = None
+        for s in shared:
+            s.close()
+
+
+class HyperparameterSearch:
+    """
+    search hyperparameter untuk satu class BaseModel
+    strategy :
+        'grid'    : semua kombinasi param_grid
+        'random'  : n_iter kombinasi acak dari param_grid
+        'halving' : successive halving, semua kandidat mulai dari subset data kecil,
+                    hanya 1/factor terbaik yang naik ke data lebih besar
+    nilai param_grid boleh list (dipilih) atau callable(rng) (untuk random / halving)
+    """
+
+    STRATEGIES = ('grid', 'random', 'halving')
+
+    def __init__(self, model_class, param_grid, strategy='grid', n_iter=10, scoring='accuracy',
+                 factor=3, min_resources=None, n_jobs=None, journal_path=None, random_state=42,
+                 evaluator: Optional[ModelEvaluator] = None):
+        """
+        Args:
+            model_class: subclass BaseModel (mis. RandomForestModel)
+            param_grid: dict nama param -> list nilai / callable(rng)
+            strategy: 'grid', 'random', atau 'halving'
+            n_iter: jumlah kandidat untuk random (dan halving kalau param_grid berisi callable)
+            scoring: metric untuk memilih config terbaik ('accuracy', 'f1', ...)
+            factor: faktor eliminasi successive halving
+            min_resources: jumlah sampel di rung pertama halving (default otomatis)
+            n_jobs: jumlah worker process
+            journal_path: file jsonl untuk resume (None = tanpa journal)
+            evaluator: ModelEvaluator tujuan hasil model terbaik
+        """
+        if strategy not in self.STRATEGIES:
+            raise ValueError(f"Unknow strategy : {strategy}")
+        self.model_class = model_class
+        self.param_grid = param_grid
+        self.strategy = strategy
+        self.n_iter = n_iter
+        self.scoring = scoring
+        self.factor = factor
+        self.min_resources = min_resources
+        self.n_jobs = n_jobs or os.cpu_count() or 1
+        self.journal_path = journal_path
+        self.random_state = random_state
+        self.evaluator = evaluator or ModelEvaluator()
+
+        self.trials = []            # semua trial (termasuk yang di load dari journal)
+        self.best_params_ = None
+        self.best_score_ = None
+        self.best_model_ = None
+
+    # ---------- kandidat ----------
+    def candidates(self):
+        """daftar dict params yang akan dicoba"""
+        rng = random.Random(self.random_state)
+        names = list(self.param_grid)
+        samplable = all(isinstance(v, (list, tuple)) for v in self.param_grid.values())
+
+        if self.strategy == 'grid' and not samplable:
+            raise ValueError("grid search butuh list nilai untuk setiap param")
+
+        if samplable:
+            combos = [dict(zip(names, values)) for values in itertools.product(*self.param_grid.values())]
+            # grid & halving pakai semua kombinasi, random hanya kalau kombinasinya sedikit
+            if self.strategy != 'random' or len(combos) <= self.n_iter:
+                return combos
+
+        # random : sampling tanpa duplikat (sebisa mungkin)
+        result, seen = [], set()
+        for _ in range(self.n_iter * 10):
+            params = {name: self._sample(value, rng) for name, value in self.param_grid.items()}
+            key = json.dumps(params, sort_keys=True, default=str)
+            if key not in seen:
+                seen.add(key)
+                result.append(params)
+            if len(result) == self.n_iter:
+                break
+        return result
+
+    @staticmethod
+    def _sample(value, rng):
+        if callable(value):
+            return value(rng)
+        return rng.choice(list(value))
+
+    # ---------- journal ----------
+    # protokol evaluasi satu trial : train di n_samples baris pertama data training yang di shuffle
+    # dengan random_state, evaluasi di validation set. kalau protokol berubah, ganti string ini
+    # supaya trial lama di journal tidak ikut dipakai
+    TRIAL_PROTOCOL = 'holdout/shuffled-prefix'
+
+    def _trial_key(self, params, n_samples, data_key):
+        """
+        key journal : semua yang mempengaruhi skor trial
+        random_state ikut (menentukan baris mana yang masuk subset n_samples),
+        resume dengan seed lain tidak memakai skor lama
+        """
+        raw = json.dumps({
+            'model'        : self.model_class.__qualname__,
+            'params'       : params,
+            'n_samples'    : n_samples,
+            'data'         : data_key,
+            'scoring'      : self.scoring,
+            'random_state' : self.random_state,
+            'protocol'     : self.TRIAL_PROTOCOL,
+        }, sort_keys=True, default=str)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _load_journal(self):
+        done = {}
+        if self.journal_path and os.path.exists(self.journal_path):
+            with open(self.journal_path, encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue    # baris terakhir terpotong saat proses dimatikan
+                    done[record['key']] = record
+        return done
+
+    def _append_journal(self, record):
+        if not self.journal_path:
+            return
+        with open(self.journal_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, default=str) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    # ---------- eksekusi ----------
+    def fit(self, X_train, y_train, X_val, y_val, dataset_name: str = "Validation", refit: bool = True):
+        """
+        jalankan search
+        refit: True = config terbaik di train ulang di seluruh data training (di parent)
+        returns : self
+        """
+        X_train, y_train = np.asarray(X_train), np.asarray(y_train)
+        n_total = len(y_train)
+        self.trials = []            # hanya trial dari fit ini (fit sebelumnya bisa pakai data lain)
+
+        # shuffle sekali, jadi prefix n baris = subset acak untuk halving
+        order = np.random.default_rng(self.random_state).permutation(n_total)
+        data_key = ModelCache.data_fingerprint(X_train, y_train) + ModelCache.data_fingerprint(X_val, y_val)
+        journal = self._load_journal()
+
+        candidates = self.candidates()
+        rungs = self._schedule(len(candidates), n_total)
+        print(f"\n Hyperparameter search ({self.strategy}) : {len(candidates)} candidates, "
+              f"{len(rungs)} rung(s), {self.n_jobs} workers")
+
+        shared = [SharedArray.create(data) for data in (X_train[order], y_train[order], X_val, y_val)]
+        specs = [s.spec for s in shared]
+        try:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=self.n_jobs) as executor:
+                for rung, n_samples in enumerate(rungs):
+                    results = self._run_rung(executor, candidates, n_samples, rung, specs, data_key, journal)
+                    if rung < len(rungs) - 1:
+                        keep = max(1, math.ceil(len(candidates) / self.factor))
+                        ranked = sorted(results, key=lambda r: r['metrics'][self.scoring], reverse=True)
+                        candidates = [r['params'] for r in ranked[:keep]]
+        finally:
+            for s in shared:
+                s.unlink()
+
+        # kandidat yang benar-benar sampai rung terakhir (bukan semua trial dengan n_samples sama,
+        # rung yang di cap n_total bisa berisi kandidat yang sudah gugur)
+        best = max(results, key=lambda r: r['metrics'][self.scoring])
+        self.best_params_ = best['params']
+        self.best_score_ = best['metrics'][self.scoring]
+        print(f" Best {self.scoring}: {self.best_score_:.4f} with {self.best_params_}")
+
+        if refit:
+            self.best_model_ = self.model_class(**self.best_params_).train(X_train, y_train)
+            metrics = ModelEvaluator.compute_metrics(self.best_model_, y_val, self.best_model_.predict(X_val))
+            metrics['params'] = self.best_params_
+            self.evaluator.results[self.evaluator.result_key(self.best_model_, dataset_name)] = metrics
+        return self
+
+    def _schedule(self, n_candidates, n_total):
+        """jumlah sampel per rung; grid/random hanya satu rung dengan seluruh data"""
+        if self.strategy != 'halving' or n_candidates <= 1:
+            return [n_total]
+        n_rungs = 1 + math.ceil(math.log(n_candidates) / math.log(self.factor))
+        min_resources = self.min_resources or max(20, n_total // self.factor ** (n_rungs - 1))
+        return [min(n_total, min_resources * self.factor ** i) for i in range(n_rungs - 1)] + [n_total]
+
+    def _run_rung(self, executor, candidates, n_samples, rung, specs, data_key, journal):
+        results, futures = [], {}
+        for params in candidates:
+            key = self._trial_key(params, n_samples, data_key)
+            if key in journal:
+                # trial sudah selesai di run sebelumnya -> pakai hasil dari journal
+                record = journal[key]
+                results.append(record)
+                self.trials.append(record)
+                continue
+            future = executor.submit(_run_trial, self.model_class, params, specs, n_samples)
+            futures[future] = (key, params)
+
+        for future in concurrent.futures.as_completed(futures):
+            key, params = futures[future]
+            record = {
+                'key'       : key,
+                'params'    : params,
+                'n_samples' : n_samples,
+                'rung'      : rung,
+                'metrics'   : future.result(),
+            }
+            self._append_journal(record)    # langsung ditulis, aman kalau search terputus
+            journal[key] = record
+            results.append(record)
+            self.trials.append(record)
+
+        print(f"  rung {rung}: {len(candidates)} candidates x {n_samples} samples "
+              f"({len(futures)} run, {len(candidates) - len(futures)} from journal)")
+        return results
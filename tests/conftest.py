@@ -0,0 +1,12 @@
+import os
+import sys
+
+# ========================================
+# module ML ada di folder biasa (bukan package, nama folder ada spasi)
+# -> tambahkan foldernya ke sys.path supaya test bisa `import knn`, `import linear_solver`, dst
+# ========================================
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for folder in ("Machine_learning", os.path.join("Machine Learning", "Supervised_learning")):
+    path = os.path.join(ROOT, folder)
+    if path not in sys.path:
+        sys.path.insert(0, path)
@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from dbscan import DBSCAN, dbscan_sweep, generate_sample_data
+
+sklearn_cluster = pytest.importorskip("sklearn.cluster")
+
+
+def same_partition(a, b):
+    """label sama sampai permutasi nomor cluster"""
+    pairs = set(zip(a.tolist(), b.tolist()))
+    return len(pairs) == len(set(a.tolist())) == len(set(b.tolist()))
+
+
+def assert_matches_reference(X, labels, core_indices, eps, min_samples):
+    """
+    core point + noise harus identik dengan sklearn ; border point boleh beda cluster
+    (border di antara 2 cluster di assign ke core tetangga lain, keduanya valid DBSCAN)
+    """
+    reference = sklearn_cluster.DBSCAN(eps=eps, min_samples=min_samples).fit(X)
+    np.testing.assert_array_equal(np.sort(core_indices), reference.core_sample_indices_)
+    np.testing.assert_array_equal(labels == -1, reference.labels_ == -1)
+    core = reference.core_sample_indices_
+    assert same_partition(labels[core], reference.labels_[core])
+
+
+@pytest.mark.parametrize("data_type, eps", [("moons", 0.3), ("circles", 0.2), ("blobs", 0.5), ("mixed", 0.4)])
+@pytest.mark.parametrize("memory_bounded", [False, True])
+def test_dbscan_matches_sklearn(data_type, eps, memory_bounded):
+    X = generate_sample_data(data_type, n_samples=500)
+    model = DBSCAN(eps=eps, min_samples=5, chunk_size=97, n_jobs=2, memory_bounded=memory_bounded).fit(X)
+    assert_matches_reference(X, model.labels_, model.core_sample_indices_, eps, 5)
+
+
+def test_dbscan_all_noise_and_duplicates():
+    X = np.repeat([[0.0, 0.0], [10.0, 10.0]], [3, 1], axis=0)
+    labels = DBSCAN(eps=0.1, min_samples=3).fit_predict(X)
+    np.testing.assert_array_equal(labels, [0, 0, 0, -1])
+    assert (DBSCAN(eps=0.1, min_samples=5).fit_predict(X) == -1).all()
+
+
+def test_sweep_matches_single_fits():
+    X = generate_sample_data("mixed", n_samples=400)
+    eps_values = [0.1, 0.25, 0.4]
+    min_samples_values = [3, 8]
+    results = dbscan_sweep(X, eps_values, min_samples_values, chunk_size=50)
+    assert set(results) == {(eps, m) for eps in eps_values for m in min_samples_values}
+    for (eps, min_samples), labels in results.items():
+        expected = DBSCAN(eps=eps, min_samples=min_samples).fit_predict(X)
+        np.testing.assert_array_equal(labels == -1, expected == -1)
+        assert same_partition(labels, expected)
+
+
+def test_sweep_more_eps_than_int8():
+    # > 127 eps -> bucket index tidak boleh wrap
+    X = generate_sample_data("blobs", n_samples=300)
+    eps_values = list(np.linspace(0.05, 0.8, 300))
+    results = dbscan_sweep(X, eps_values, [5])
+    for eps in eps_values[::37] + [eps_values[-1]]:
+        reference = sklearn_cluster.DBSCAN(eps=eps, min_samples=5).fit(X)
+        labels = results[(eps, 5)]
+        np.testing.assert_array_equal(labels == -1, reference.labels_ == -1)
+        core = reference.core_sample_indices_
+        assert same_partition(labels[core], reference.labels_[core])
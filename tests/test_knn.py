@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+from knn import KNN, KNNLoop, brute_kneighbors, recall_at_k
+
+
+def reference_kneighbors(X_train, Q, k):
+    """brute force paling sederhana : semua jarak, argsort penuh"""
+    dist = np.sqrt(((Q[:, None, :] - X_train[None, :, :]) ** 2).sum(axis=2))
+    indices = np.argsort(dist, axis=1, kind="stable")[:, :k]
+    return np.take_along_axis(dist, indices, axis=1), indices
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(600, 3))
+    y = (X[:, 0] + X[:, 1] > 0).astype(int) + (X[:, 2] > 1)
+    Q = rng.normal(size=(80, 3))
+    return X, y, Q
+
+
+def test_brute_kneighbors_matches_reference(data):
+    X, _, Q = data
+    distances, indices = brute_kneighbors(X, Q, k=7, max_memory_mb=0.01)   # paksa banyak chunk
+    ref_distances, ref_indices = reference_kneighbors(X, Q, 7)
+    np.testing.assert_allclose(distances, ref_distances, atol=1e-10)
+    np.testing.assert_array_equal(indices, ref_indices)
+
+
+@pytest.mark.parametrize("algorithm", ["kd_tree", "ball_tree"])
+@pytest.mark.parametrize("leaf_size", [1, 5, 40])
+def test_tree_kneighbors_exact(data, algorithm, leaf_size):
+    X, y, Q = data
+    distances, indices = KNN(k=5, algorithm=algorithm, leaf_size=leaf_size).fit(X, y).kneighbors(Q)
+    ref_distances, ref_indices = reference_kneighbors(X, Q, 5)
+    np.testing.assert_allclose(distances, ref_distances, atol=1e-10)
+    np.testing.assert_array_equal(indices, ref_indices)
+
+
+def test_ivf_probing_all_lists_is_exact(data):
+    X, y, Q = data
+    model = KNN(k=5, algorithm="ivf", n_lists=12, n_probe=12).fit(X, y)
+    distances, indices = model.kneighbors(Q)
+    ref_distances, ref_indices = reference_kneighbors(X, Q, 5)
+    np.testing.assert_allclose(distances, ref_distances, atol=1e-10)
+    assert recall_at_k(indices, ref_indices) == 1.0
+
+
+@pytest.mark.parametrize("algorithm", ["brute", "kd_tree", "ball_tree"])
+def test_predict_matches_loop_version(data, algorithm):
+    X, y, Q = data
+    expected = KNNLoop(k=4).fit(X, y).predict(Q)     # k genap -> seri juga ikut di cek
+    np.testing.assert_array_equal(KNN(k=4, algorithm=algorithm).fit(X, y).predict(Q), expected)
+
+
+@pytest.mark.parametrize("algorithm", ["brute", "kd_tree", "ivf"])
+def test_partial_fit_same_as_fit(data, algorithm):
+    X, y, Q = data
+    full = KNN(k=3, algorithm=algorithm, n_lists=8, n_probe=8).fit(X, y)
+    incremental = KNN(k=3, algorithm=algorithm, n_lists=8, n_probe=8).fit(X[:400], y[:400])
+    incremental.partial_fit(X[400:], y[400:])
+    np.testing.assert_allclose(incremental.kneighbors(Q)[0], full.kneighbors(Q)[0], atol=1e-10)
+
+
+def test_unknown_algorithm():
+    with pytest.raises(ValueError):
+        KNN(algorithm="lsh")
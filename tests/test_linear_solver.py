@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+from linear_solver import LinearRegressionFromScratch, SufficientStats, self_check
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_self_check(seed):
+    # semua solver / ridge / multi target / partial_fit / ill-conditioned vs lstsq
+    self_check(seed=seed)
+
+
+def test_sufficient_stats_merge_matches_direct():
+    # mean besar -> rumus naif Σxxᵀ - n x̄x̄ᵀ kehilangan presisi, Chan merge tidak
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(1000, 3)) + 1e6
+    y = rng.normal(size=1000) + 1e6
+    left = SufficientStats.from_arrays(X[:300], y[:300], chunk_size=70)
+    right = SufficientStats.from_arrays(X[300:], y[300:], chunk_size=1000)
+    merged = left.merge(right)
+
+    Xc, yc = X - X.mean(axis=0), y - y.mean()
+    assert merged.n == 1000
+    np.testing.assert_allclose(merged.mean_x, X.mean(axis=0), rtol=1e-14)
+    np.testing.assert_allclose(merged.Sxx, Xc.T @ Xc, rtol=1e-9)
+    np.testing.assert_allclose(merged.Sxy[:, 0], Xc.T @ yc, rtol=1e-9, atol=1e-9 * np.abs(Xc.T @ yc).max())
+    np.testing.assert_allclose(merged.Syy[0], yc @ yc, rtol=1e-9)
+
+
+def test_matches_sklearn():
+    linear_model = pytest.importorskip("sklearn.linear_model")
+    rng = np.random.default_rng(3)
+    X = rng.normal(size=(500, 4))
+    y = X @ [1.0, -2.0, 0.5, 0.0] + 4 + rng.normal(size=500)
+    for alpha, reference in ((0.0, linear_model.LinearRegression()), (10.0, linear_model.Ridge(alpha=10.0))):
+        reference.fit(X, y)
+        model = LinearRegressionFromScratch(alpha=alpha).fit(X, y)
+        np.testing.assert_allclose(model.coefficients, reference.coef_, rtol=1e-10)
+        assert model.intercept == pytest.approx(reference.intercept_, rel=1e-10)
+
+
+def test_unknown_solver():
+    with pytest.raises(ValueError):
+        LinearRegressionFromScratch(solver="svd")
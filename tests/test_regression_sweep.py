@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+from regression_sweep import regression_sweep
+
+sklearn_linear_model = pytest.importorskip("sklearn.linear_model")
+from sklearn.metrics import mean_absolute_error, r2_score
+from sklearn.model_selection import train_test_split
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(800, 4)) * [1, 10, 0.1, 1] + [0, 100, 5, 0]
+    y = X @ [2.0, 0.3, -4.0, 0.0] + 1 + rng.normal(size=800)
+    return X, y, ["a", "b", "c", "d"]
+
+
+def test_sweep_matches_sklearn(data):
+    X, y, names = data
+    result = regression_sweep(X, y, feature_names=names, max_size=2, chunk_size=123)
+    assert len(result) == 4 + 6
+    assert result["r2_test"].is_monotonic_decreasing
+
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+    for row in result.itertuples():
+        columns = [names.index(f) for f in row.features]
+        reference = sklearn_linear_model.LinearRegression().fit(X_train[:, columns], y_train)
+        pred_train = reference.predict(X_train[:, columns])
+        pred_test = reference.predict(X_test[:, columns])
+        np.testing.assert_allclose(row.coef, reference.coef_, rtol=1e-8)
+        assert row.intercept == pytest.approx(reference.intercept_, rel=1e-8)
+        assert row.r2_train == pytest.approx(r2_score(y_train, pred_train), rel=1e-9)
+        assert row.r2_test == pytest.approx(r2_score(y_test, pred_test), rel=1e-9)
+        assert row.rmse_test == pytest.approx(np.sqrt(np.mean((y_test - pred_test) ** 2)), rel=1e-9)
+        assert row.mae_test == pytest.approx(mean_absolute_error(y_test, pred_test), rel=1e-9)
+
+
+def test_ridge_matches_sklearn(data):
+    X, y, names = data
+    result = regression_sweep(X, y, feature_names=names, combinations=[["a", "c"]], max_size=0, alpha=50.0)
+    X_train, _, y_train, _ = train_test_split(X, y, test_size=0.2, random_state=42)
+    reference = sklearn_linear_model.Ridge(alpha=50.0).fit(X_train[:, [0, 2]], y_train)
+    np.testing.assert_allclose(result.loc[0, "coef"], reference.coef_, rtol=1e-8)
+
+
+@pytest.mark.parametrize("mae_top", [0, 1, 3, 10])
+def test_mae_top_exact_count_with_ties(data, mae_top):
+    X, y, names = data
+    X = np.c_[X, X[:, 0]]                       # kolom duplikat -> R² test seri
+    result = regression_sweep(X, y, feature_names=names + ["a_copy"], max_size=2, mae_top=mae_top)
+    assert result["mae_test"].notna().sum() == min(mae_top, len(result))
+    # yang dapat MAE harus kombinasi terbaik (seri di batas boleh pilih salah satu)
+    selected = result["mae_test"].notna()
+    if 0 < selected.sum() < len(result):
+        assert result.loc[selected, "r2_test"].min() >= result.loc[~selected, "r2_test"].max()
+
+
+def test_bad_feature_and_empty_request(data):
+    X, y, names = data
+    with pytest.raises(KeyError):
+        regression_sweep(X, y, feature_names=names, combinations=[["a", "zzz"]])
+    with pytest.raises(ValueError):
+        regression_sweep(X, y, combinations=[[7]])
+    assert regression_sweep(X, y, max_size=0).empty
@@ -0,0 +1,421 @@
+# ========================================
+# ML OPTIMIZER ENGINE
+# ========================================
+# versi module dari ML_Optimizer_Tutorial_LENGKAP.ipynb
+# notebook punya 3 loop training yang hampir sama (train_gradient_descent,
+# train_momentum, train_adam), dan setiap epoch membuat array baru
+# (w = w - lr * dw, y_pred, error, dw, ...)
+#
+# di sini :
+# - satu training driver (train) + optimizer sebagai object step yang bisa diganti
+#   GD, Momentum, AdaGrad, RMSProp, Adam
+# - semua buffer (y_pred, error, dw, state optimizer) dialokasikan sekali,
+#   update pakai ufunc dengan out= (in-place)
+# - early stopping kalau loss sudah tidak turun (tol + patience)
+# - opsional mini-batch (batch_size)
+#
+# contoh :
+#   from optimizers import Adam, train
+#   result = train(X_train, y_train, Adam(lr=0.01), epochs=150)
+#   y_pred = predict(X_test, result.w, result.b)
+#
+# benchmark (tulis ulang optimizer_results.csv) :
+#   python tutorial/optimizers.py
+
+import argparse
+import os
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+import numpy as np
+
+
+# ========== FUNGSI INTI (SAMA SEPERTI NOTEBOOK) ==========
+
+def predict(X, w, b):
+    """Prediksi: ŷ = Xw + b"""
+    return np.dot(X, w) + b
+
+
+def mse(y_pred, y):
+    """Mean Squared Error: MSE = (1/n) Σ(ŷᵢ - yᵢ)²"""
+    return np.mean((y_pred - y) ** 2)
+
+
+def compute_gradients(X, y, y_pred):
+    """dw = (2/n) Xᵀ(ŷ - y), db = (2/n) Σ(ŷ - y)"""
+    n = len(y)
+    dw = (2.0 / n) * np.dot(X.T, (y_pred - y))
+    db = (2.0 / n) * np.sum(y_pred - y)
+    return dw, db
+
+
+# ========== OPTIMIZER (STEP OBJECT) ==========
+
+class Optimizer(ABC):
+    """
+    base class optimizer (abstract, subclass wajib implement _update)
+    - reset(params) : alokasi state (velocity, moment, ...) sekali sebelum training
+    - step(params, grads) : update setiap param IN-PLACE dengan gradient-nya
+    params / grads = list array numpy (w dan b), b disimpan sebagai array shape (1,)
+    """
+
+    def __init__(self, lr=0.01):
+        self.lr = lr
+
+    def reset(self, params):
+        # scratch buffer supaya step tidak alokasi array baru
+        self._tmp = [np.empty_like(p) for p in params]
+        self.t = 0
+
+    def step(self, params, grads):
+        self.t += 1
+        for i, (param, grad) in enumerate(zip(params, grads)):
+            self._update(i, param, grad, self._tmp[i])
+
+    @abstractmethod
+    def _update(self, i, param, grad, tmp):
+        """update satu param in-place ; tmp = scratch buffer dengan shape yang sama"""
+
+    @property
+    def name(self):
+        return type(self).__name__
+
+
+class GD(Optimizer):
+    """Gradient Descent : w = w - α × gradient"""
+
+    def _update(self, i, param, grad, tmp):
+        np.multiply(grad, self.lr, out=tmp)
+        param -= tmp
+
+
+class Momentum(Optimizer):
+    """Momentum : v = β×v + α×gradient, w = w - v"""
+
+    def __init__(self, lr=0.01, beta=0.9):
+        super().__init__(lr)
+        self.beta = beta
+
+    def reset(self, params):
+        super().reset(params)
+        self.velocity = [np.zeros_like(p) for p in params]
+
+    def _update(self, i, param, grad, tmp):
+        v = self.velocity[i]
+        v *= self.beta
+        np.multiply(grad, self.lr, out=tmp)
+        v += tmp
+        param -= v
+
+
+class AdaGrad(Optimizer):
+    """AdaGrad : G = G + gradient², w = w - α × gradient / (√G + ε)"""
+
+    def __init__(self, lr=0.01, eps=1e-8):
+        super().__init__(lr)
+        self.eps = eps
+
+    def reset(self, params):
+        super().reset(params)
+        self.accumulator = [np.zeros_like(p) for p in params]
+
+    def _update(self, i, param, grad, tmp):
+        acc = self.accumulator[i]
+        np.multiply(grad, grad, out=tmp)
+        acc += tmp
+        np.sqrt(acc, out=tmp)
+        tmp += self.eps
+        np.divide(grad, tmp, out=tmp)
+        tmp *= self.lr
+        param -= tmp
+
+
+class RMSProp(Optimizer):
+    """RMSProp : s = ρ×s + (1-ρ)×gradient², w = w - α × gradient / (√s + ε)"""
+
+    def __init__(self, lr=0.01, rho=0.9, eps=1e-8):
+        super().__init__(lr)
+        self.rho = rho
+        self.eps = eps
+
+    def reset(self, params):
+        super().reset(params)
+        self.square_avg = [np.zeros_like(p) for p in params]
+
+    def _update(self, i, param, grad, tmp):
+        s = self.square_avg[i]
+        s *= self.rho
+        np.multiply(grad, grad, out=tmp)
+        tmp *= 1 - self.rho
+        s += tmp
+        np.sqrt(s, out=tmp)
+        tmp += self.eps
+        np.divide(grad, tmp, out=tmp)
+        tmp *= self.lr
+        param -= tmp
+
+
+class Adam(Optimizer):
+    """
+    Adam : m = β₁×m + (1-β₁)×gradient, v = β₂×v + (1-β₂)×gradient²
+           w = w - α × m̂ / (√v̂ + ε)  (m̂, v̂ = bias correction)
+    """
+
+    def __init__(self, lr=0.01, b1=0.9, b2=0.999, eps=1e-8):
+        super().__init__(lr)
+        self.b1 = b1
+        self.b2 = b2
+        self.eps = eps
+
+    def reset(self, params):
+        super().reset(params)
+        self.m = [np.zeros_like(p) for p in params]
+        self.v = [np.zeros_like(p) for p in params]
+        self._tmp2 = [np.empty_like(p) for p in params]
+
+    def _update(self, i, param, grad, tmp):
+        m, v, tmp2 = self.m[i], self.v[i], self._tmp2[i]
+        m *= self.b1
+        np.multiply(grad, 1 - self.b1, out=tmp)
+        m += tmp
+        v *= self.b2
+        np.multiply(grad, grad, out=tmp)
+        tmp *= 1 - self.b2
+        v += tmp
+
+        # bias correction digabung ke skalar supaya tidak perlu array m̂ / v̂
+        correction1 = 1 - self.b1 ** self.t
+        correction2 = 1 - self.b2 ** self.t
+        np.divide(v, correction2, out=tmp)
+        np.sqrt(tmp, out=tmp)
+        tmp += self.eps
+        np.divide(m, tmp, out=tmp2)
+        tmp2 *= self.lr / correction1
+        param -= tmp2
+
+
+OPTIMIZERS = {
+    "GD"       : GD,
+    "Momentum" : Momentum,
+    "AdaGrad"  : AdaGrad,
+    "RMSProp"  : RMSProp,
+    "Adam"     : Adam,
+}
+
+
+# ========== TRAINING DRIVER ==========
+
+@dataclass
+class TrainResult:
+    w: np.ndarray
+    b: float
+    losses: List[float] = field(default_factory=list)
+    epoch_times: List[float] = field(default_factory=list)
+    training_time: float = 0.0
+    stopped_early: bool = False
+
+    @property
+    def n_epochs(self):
+        return len(self.losses)
+
+
+class LinearBuffers:
+    """buffer forward/backward untuk satu ukuran batch, dialokasikan sekali"""
+
+    def __init__(self, n_rows, n_features, dtype):
+        self.y_pred = np.empty((n_rows, 1), dtype=dtype)
+        self.dw = np.empty((n_features, 1), dtype=dtype)
+        self.db = np.empty(1, dtype=dtype)
+
+    def forward_backward(self, X, y, w, b):
+        """hitung loss (MSE) dan isi dw, db IN-PLACE, return loss"""
+        n = len(y)
+        y_pred = self.y_pred[:n]
+        np.matmul(X, w, out=y_pred)
+        y_pred += b
+        y_pred -= y                       # y_pred sekarang berisi error (ŷ - y)
+        error = y_pred
+        loss = float(np.vdot(error, error)) / n
+
+        np.matmul(X.T, error, out=self.dw)
+        self.dw *= 2.0 / n
+        self.db[0] = 2.0 / n * error.sum()
+        return loss
+
+
+def train(X, y, optimizer: Optimizer, epochs=150, batch_size: Optional[int] = None,
+          tol: Optional[float] = None, patience=10, shuffle=True, seed=42, verbose=False,
+          print_every=30) -> TrainResult:
+    """
+    training linear regression (MSE) dengan optimizer apa saja
+
+    Parameters :
+    - batch_size : None = full batch (seperti notebook), angka = mini-batch
+    - tol        : early stopping kalau loss terbaik tidak turun (relatif) lebih dari tol
+                   selama `patience` epoch (None = tidak pernah stop)
+                   dibanding loss terbaik, bukan epoch sebelumnya, karena loss
+                   Momentum / Adam naik-turun (osilasi) di awal training
+    - shuffle    : acak urutan data setiap epoch (hanya untuk mini-batch)
+
+    loss per epoch = loss sebelum update (full batch) atau rata2 loss batch (mini-batch)
+    """
+    X = np.asarray(X)
+    dtype = X.dtype if X.dtype in (np.float32, np.float64) else np.float64
+    y = np.asarray(y, dtype=dtype).reshape(-1, 1)
+    n, n_features = X.shape
+
+    w = np.zeros((n_features, 1), dtype=dtype)
+    b = np.zeros(1, dtype=dtype)
+    params = [w, b]
+    optimizer.reset(params)
+
+    full_batch = batch_size is None or batch_size >= n
+    batch_size = n if full_batch else batch_size
+    buffers = LinearBuffers(batch_size, n_features, dtype)
+    grads = [buffers.dw, buffers.db]
+
+    if not full_batch:
+        # buffer batch untuk np.take(..., out=) supaya shuffle tidak alokasi tiap batch
+        X_batch = np.empty((batch_size, n_features), dtype=dtype)
+        y_batch = np.empty((batch_size, 1), dtype=dtype)
+        rng = np.random.default_rng(seed)
+        index = np.arange(n)
+
+    result = TrainResult(w=w, b=0.0)
+    best_loss, stall = np.inf, 0
+    start_time = time.perf_counter()
+
+    for epoch in range(epochs):
+        epoch_start = time.perf_counter()
+
+        if full_batch:
+            loss = buffers.forward_backward(X, y, w, b[0])
+            optimizer.step(params, grads)
+        else:
+            if shuffle:
+                rng.shuffle(index)
+            loss = 0.0
+            for start in range(0, n, batch_size):
+                rows = index[start:start + batch_size]
+                xb, yb = X_batch[:len(rows)], y_batch[:len(rows)]
+                np.take(X, rows, axis=0, out=xb)
+                np.take(y, rows, axis=0, out=yb)
+                loss += buffers.forward_backward(xb, yb, w, b[0]) * len(rows)
+                optimizer.step(params, grads)
+            loss /= n
+
+        result.epoch_times.append(time.perf_counter() - epoch_start)
+        result.losses.append(loss)
+
+        if verbose and epoch % print_every == 0:
+            print(f"Epoch {epoch:3d} | Loss: {loss:,.2f}")
+
+        # early stopping
+        if tol is not None:
+            if loss < best_loss * (1 - tol):
+                best_loss, stall = loss, 0
+            else:
+                stall += 1
+            if stall >= patience:
+                result.stopped_early = True
+                break
+
+    result.training_time = time.perf_counter() - start_time
+    result.b = float(b[0])
+    if verbose:
+        print(f"\n✅ Training selesai dalam {result.training_time:.2f} detik ({result.n_epochs} epoch)")
+    return result
+
+
+# ========== WRAPPER (API NOTEBOOK) ==========
+# return (w, b, losses, training_time) sama seperti fungsi di notebook
+
+def train_gradient_descent(X, y, lr=0.01, epochs=150, verbose=True):
+    r = train(X, y, GD(lr), epochs, verbose=verbose)
+    return r.w, r.b, r.losses, r.training_time
+
+
+def train_momentum(X, y, lr=0.01, epochs=150, beta=0.9, verbose=True):
+    r = train(X, y, Momentum(lr, beta), epochs, verbose=verbose)
+    return r.w, r.b, r.losses, r.training_time
+
+
+def train_adam(X, y, lr=0.01, epochs=150, b1=0.9, b2=0.999, eps=1e-8, verbose=True):
+    r = train(X, y, Adam(lr, b1, b2, eps), epochs, verbose=verbose)
+    return r.w, r.b, r.losses, r.training_time
+
+
+# ========== BENCHMARK ==========
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def load_car_price(path=os.path.join(REPO_ROOT, "dataset", "CarPrice_Assignment.csv"), test_size=0.2, seed=42):
+    """preprocessing sama seperti notebook : drop car_ID, one-hot, standardize, split 80/20"""
+    import pandas as pd
+    from sklearn.model_selection import train_test_split
+    from sklearn.preprocessing import StandardScaler
+
+    df = pd.read_csv(path).drop("car_ID", axis=1)
+    y = df["price"].values.reshape(-1, 1).astype(np.float64)
+    X = pd.get_dummies(df.drop("price", axis=1), drop_first=True)
+
+    num_cols = X.select_dtypes(include=["int64", "float64"]).columns
+    X[num_cols] = StandardScaler().fit_transform(X[num_cols])
+    X = X.values.astype(np.float64)
+    return train_test_split(X, y, test_size=test_size, random_state=seed)
+
+
+def benchmark(output=os.path.join(REPO_ROOT, "optimizer_results.csv"), lr=0.01, epochs=150,
+              batch_size=32, tol=None, repeat=5):
+    """
+    training semua optimizer di data CarPrice lalu tulis optimizer_results.csv
+    waktu = median dari `repeat` kali training (data kecil, jadi noise timer besar)
+    """
+    import pandas as pd
+    from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+
+    X_train, X_test, y_train, y_test = load_car_price()
+
+    runs = {name: (cls(lr), None) for name, cls in OPTIMIZERS.items()}
+    runs["MiniBatch"] = (GD(lr), batch_size)
+
+    rows = []
+    for name, (optimizer, batch) in runs.items():
+        results = [train(X_train, y_train, optimizer, epochs, batch_size=batch, tol=tol) for _ in range(repeat)]
+        times = [r.training_time for r in results]
+        result = results[int(np.argsort(times)[len(times) // 2])]
+
+        y_pred_test = predict(X_test, result.w, result.b)
+        rows.append({
+            "Optimizer"           : name,
+            "Train Loss"          : result.losses[-1],
+            "Test RMSE"           : np.sqrt(mean_squared_error(y_test, y_pred_test)),
+            "Test MAE"            : mean_absolute_error(y_test, y_pred_test),
+            "R² Score"            : r2_score(y_test, y_pred_test),
+            "Training Time (s)"   : result.training_time,
+            "Epochs"              : result.n_epochs,
+            "Time per Epoch (ms)" : 1000 * float(np.mean(result.epoch_times)),
+        })
+
+    results_df = pd.DataFrame(rows).sort_values("R² Score", ascending=False)
+    results_df.to_csv(output, index=False)
+    print(results_df.to_string(index=False))
+    print(f"\n✅ disimpan ke {output}")
+    return results_df
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark optimizer di data CarPrice -> optimizer_results.csv")
+    parser.add_argument("--output", default=os.path.join(REPO_ROOT, "optimizer_results.csv"))
+    parser.add_argument("--lr", type=float, default=0.01)
+    parser.add_argument("--epochs", type=int, default=150)
+    parser.add_argument("--batch-size", type=int, default=32, help="ukuran batch untuk baris MiniBatch")
+    parser.add_argument("--tol", type=float, default=None, help="early stopping (penurunan loss relatif)")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    benchmark(args.output, args.lr, args.epochs, args.batch_size, args.tol, args.repeat)
@@ -0,0 +1,326 @@
+# ========================================
+# OUT-OF-CORE MINI-BATCH SGD
+# ========================================
+# optimizers.py (dan Gradient_Descent.py) butuh seluruh X / y di RAM sebagai float64
+# module ini training linear regression dari dataset yang lebih besar dari RAM :
+# - fitur dibaca dari .npy memory-mapped (np.load(mmap_mode='r'))
+# - CSV bisa dikonversi SEKALI ke cache binary (.npy) per chunk, konversi berikutnya di skip
+#   selama CSV tidak berubah
+# - shuffle per block : urutan block diacak + baris di dalam block diacak,
+#   jadi disk tetap dibaca sequential (per block), tidak random access per baris
+# - compute float32 (setengah memory & bandwidth dibanding float64)
+# - optimizer sama dengan optimizers.py (GD, Momentum, AdaGrad, RMSProp, Adam)
+#
+# contoh :
+#   X_path, y_path = csv_to_npy("data.csv", target="price", cache_dir="cache/")
+#   model = StreamingSGDRegressor(Adam(lr=0.01), batch_size=256, block_size=65536)
+#   model.fit(np.load(X_path, mmap_mode="r"), np.load(y_path, mmap_mode="r"))
+#
+# demo (dataset sintetis memmap) :
+#   python tutorial/streaming_sgd.py --rows 2000000 --features 16
+
+import argparse
+import json
+import os
+import platform
+import resource
+import tempfile
+import time
+
+import numpy as np
+
+from optimizers import Adam, LinearBuffers, OPTIMIZERS, Optimizer
+
+
+# ========== CSV -> BINARY CACHE ==========
+
+def csv_to_npy(csv_path, target, columns=None, cache_dir=None, chunksize=100_000, dtype=np.float32):
+    """
+    konversi CSV ke X.npy + y.npy (row-major, dtype float32) per chunk
+    hanya kolom numerik (one-hot butuh semua kategori di depan, tidak cocok untuk streaming)
+
+    cache disimpan di cache_dir (default : folder CSV) bersama meta json (ukuran + mtime CSV),
+    kalau CSV belum berubah konversi di skip
+
+    Returns : (X_path, y_path)
+    """
+    import pandas as pd
+
+    cache_dir = cache_dir or os.path.dirname(os.path.abspath(csv_path))
+    os.makedirs(cache_dir, exist_ok=True)
+    stem = os.path.splitext(os.path.basename(csv_path))[0]
+    X_path = os.path.join(cache_dir, f"{stem}.X.npy")
+    y_path = os.path.join(cache_dir, f"{stem}.y.npy")
+    meta_path = os.path.join(cache_dir, f"{stem}.meta.json")
+
+    stat = os.stat(csv_path)
+    meta = {"size": stat.st_size, "mtime": stat.st_mtime, "target": target,
+            "columns": columns, "dtype": np.dtype(dtype).name}
+    if os.path.exists(meta_path) and os.path.exists(X_path) and os.path.exists(y_path):
+        with open(meta_path, encoding="utf-8") as f:
+            if json.load(f) == meta:
+                return X_path, y_path
+
+    # PASS 1 : jumlah baris + kolom numerik (tanpa load seluruh CSV)
+    n_rows = 0
+    for chunk in pd.read_csv(csv_path, chunksize=chunksize):
+        if columns is None:
+            columns = [c for c in chunk.select_dtypes("number").columns if c != target]
+        n_rows += len(chunk)
+
+    # PASS 2 : tulis langsung ke file .npy lewat memmap
+    X_out = np.lib.format.open_memmap(X_path, mode="w+", dtype=dtype, shape=(n_rows, len(columns)))
+    y_out = np.lib.format.open_memmap(y_path, mode="w+", dtype=dtype, shape=(n_rows,))
+    row = 0
+    for chunk in pd.read_csv(csv_path, chunksize=chunksize, usecols=list(columns) + [target]):
+        X_out[row:row + len(chunk)] = chunk[columns].to_numpy(dtype=dtype)
+        y_out[row:row + len(chunk)] = chunk[target].to_numpy(dtype=dtype)
+        row += len(chunk)
+    X_out.flush()
+    y_out.flush()
+    del X_out, y_out
+
+    with open(meta_path, "w", encoding="utf-8") as f:
+        json.dump(meta, f)
+    return X_path, y_path
+
+
+# ========== BLOCK SHUFFLE ==========
+
+def iter_blocks(n_rows, block_size, rng=None):
+    """range (start, end) per block, urutan block diacak kalau rng diberikan"""
+    starts = np.arange(0, n_rows, block_size)
+    if rng is not None:
+        rng.shuffle(starts)
+    for start in starts:
+        yield int(start), int(min(start + block_size, n_rows))
+
+
+def streaming_mean_std(X, block_size=65_536):
+    """mean dan std per kolom dalam satu pass (akumulasi float64 per block)"""
+    n, n_features = X.shape
+    total = np.zeros(n_features)
+    total_sq = np.zeros(n_features)
+    for start, end in iter_blocks(n, block_size):
+        block = np.asarray(X[start:end], dtype=np.float64)
+        total += block.sum(axis=0)
+        total_sq += np.einsum("ij,ij->j", block, block)
+    mean = total / n
+    std = np.sqrt(np.maximum(total_sq / n - mean ** 2, 0.0))
+    std[std == 0] = 1.0
+    return mean, std
+
+
+# ========== STREAMING REGRESSOR ==========
+
+class StreamingSGDRegressor:
+    """
+    linear regression (MSE) dengan mini-batch SGD dari array memory-mapped
+
+    Parameters :
+    - optimizer   : object optimizer dari optimizers.py (default Adam)
+    - batch_size  : jumlah baris per update
+    - block_size  : jumlah baris yang dibaca dari disk sekaligus (unit shuffle)
+    - epochs      : jumlah pass penuh
+    - dtype       : dtype compute (default float32)
+    - standardize : scaling fitur (mean/std dihitung streaming, diterapkan per block)
+    - tol / patience : early stopping berdasarkan loss per epoch (sama seperti optimizers.train)
+
+    memory yang dipakai = satu block + buffer batch, tidak tergantung jumlah baris
+    """
+
+    def __init__(self, optimizer: Optimizer = None, batch_size=256, block_size=65_536, epochs=5,
+                 dtype=np.float32, standardize=True, tol=None, patience=2, seed=42, verbose=False):
+        self.optimizer = optimizer or Adam(lr=0.01)
+        self.batch_size = batch_size
+        self.block_size = max(block_size, batch_size)
+        self.epochs = epochs
+        self.dtype = np.dtype(dtype)
+        self.standardize = standardize
+        self.tol = tol
+        self.patience = patience
+        self.seed = seed
+        self.verbose = verbose
+
+    def _init_params(self, n_features):
+        self.w = np.zeros((n_features, 1), dtype=self.dtype)
+        self.b = np.zeros(1, dtype=self.dtype)
+        self._params = [self.w, self.b]
+        self.optimizer.reset(self._params)
+        self._buffers = LinearBuffers(self.batch_size, n_features, self.dtype)
+        self._block_X = np.empty((self.block_size, n_features), dtype=self.dtype)
+        self._block_y = np.empty((self.block_size, 1), dtype=self.dtype)
+        self._batch_X = np.empty((self.batch_size, n_features), dtype=self.dtype)
+        self._batch_y = np.empty((self.batch_size, 1), dtype=self.dtype)
+        self._rng = np.random.default_rng(self.seed)
+
+    def _load_block(self, X, y, start, end):
+        """baca satu block dari disk (sequential) ke buffer RAM, scaling in-place"""
+        n = end - start
+        block_X, block_y = self._block_X[:n], self._block_y[:n]
+        block_X[...] = X[start:end]
+        block_y[:, 0] = y[start:end]
+        if self.standardize:
+            block_X -= self.mean_
+            block_X /= self.scale_
+        return block_X, block_y
+
+    def _train_block(self, block_X, block_y):
+        """shuffle baris di dalam block lalu update per mini-batch, return jumlah loss × baris"""
+        n = len(block_X)
+        order = self._rng.permutation(n)
+        buffers, grads = self._buffers, [self._buffers.dw, self._buffers.db]
+        loss_sum = 0.0
+        for start in range(0, n, self.batch_size):
+            rows = order[start:start + self.batch_size]
+            xb, yb = self._batch_X[:len(rows)], self._batch_y[:len(rows)]
+            np.take(block_X, rows, axis=0, out=xb)
+            np.take(block_y, rows, axis=0, out=yb)
+            loss_sum += buffers.forward_backward(xb, yb, self.w, self.b[0]) * len(rows)
+            self.optimizer.step(self._params, grads)
+        return loss_sum
+
+    def fit(self, X, y):
+        """X : (n, d) array / memmap, y : (n,) atau (n, 1) array / memmap"""
+        y = np.asarray(y).reshape(-1)   # sama dengan partial_fit ; memmap tetap view, tidak di copy ke RAM
+        n, n_features = X.shape
+        if self.standardize:
+            mean, std = streaming_mean_std(X, self.block_size)
+            self.mean_, self.scale_ = mean.astype(self.dtype), std.astype(self.dtype)
+        self._init_params(n_features)
+
+        self.losses, self.epoch_times = [], []
+        best_loss, stall = np.inf, 0
+        for epoch in range(self.epochs):
+            epoch_start = time.perf_counter()
+            loss_sum = 0.0
+            for start, end in iter_blocks(n, self.block_size, self._rng):
+                loss_sum += self._train_block(*self._load_block(X, y, start, end))
+            self.losses.append(loss_sum / n)
+            self.epoch_times.append(time.perf_counter() - epoch_start)
+
+            if self.verbose:
+                print(f"Epoch {epoch:3d} | Loss: {self.losses[-1]:,.4f} | "
+                      f"{n / self.epoch_times[-1]:,.0f} baris/detik")
+
+            if self.tol is not None:
+                if self.losses[-1] < best_loss * (1 - self.tol):
+                    best_loss, stall = self.losses[-1], 0
+                else:
+                    stall += 1
+                if stall >= self.patience:
+                    break
+        return self
+
+    def partial_fit(self, X, y):
+        """
+        satu pass SGD untuk chunk (X, y) yang sudah di RAM, misalnya dari stream
+        scaling pakai mean_/scale_ yang sudah ada (set manual atau dari fit sebelumnya)
+        """
+        X = np.asarray(X)
+        if not hasattr(self, "w"):
+            if self.standardize and not hasattr(self, "mean_"):
+                mean, std = streaming_mean_std(X, self.block_size)
+                self.mean_, self.scale_ = mean.astype(self.dtype), std.astype(self.dtype)
+            self._init_params(X.shape[1])
+        y = np.asarray(y).reshape(-1)
+        for start, end in iter_blocks(len(X), self.block_size):
+            self._train_block(*self._load_block(X, y, start, end))
+        return self
+
+    def coef_intercept(self):
+        """bobot di skala fitur ASLI : y = X @ coef + intercept"""
+        w = self.w[:, 0].astype(np.float64)
+        if not self.standardize:
+            return w, float(self.b[0])
+        coef = w / self.scale_
+        return coef, float(self.b[0]) - float(coef @ self.mean_)
+
+    def predict(self, X, block_size=None):
+        """prediksi per block (X boleh memmap)"""
+        coef, intercept = self.coef_intercept()
+        coef = coef.astype(self.dtype)
+        block_size = block_size or self.block_size
+        out = np.empty(len(X), dtype=self.dtype)
+        for start, end in iter_blocks(len(X), block_size):
+            np.matmul(np.asarray(X[start:end], dtype=self.dtype), coef, out=out[start:end])
+            out[start:end] += intercept
+        return out
+
+    def score(self, X, y, block_size=None):
+        """R², RMSE, MAE dihitung per block (akumulasi float64)"""
+        coef, intercept = self.coef_intercept()
+        block_size = block_size or self.block_size
+        n = len(y)
+        sse = sae = total = total_sq = 0.0
+        for start, end in iter_blocks(n, block_size):
+            y_true = np.asarray(y[start:end], dtype=np.float64).reshape(-1)
+            error = np.asarray(X[start:end], dtype=np.float64) @ coef + intercept - y_true
+            sse += float(error @ error)
+            sae += float(np.abs(error).sum())
+            total += float(y_true.sum())
+            total_sq += float(y_true @ y_true)
+        sst = total_sq - total * total / n
+        return {"r2": 1 - sse / sst if sst > 0 else 0.0, "rmse": float(np.sqrt(sse / n)), "mae": sae / n}
+
+
+# ========== DEMO ==========
+
+def _max_rss_mb():
+    # linux : kilobytes, macOS : bytes
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024) if platform.system() == "Darwin" else rss / 1024
+
+
+def make_synthetic_memmap(directory, n_rows, n_features, seed=42, block_size=262_144):
+    """dataset regresi sintetis langsung ke .npy memmap (tidak pernah penuh di RAM)"""
+    rng = np.random.default_rng(seed)
+    true_w = rng.normal(size=n_features)
+    X_path, y_path = os.path.join(directory, "X.npy"), os.path.join(directory, "y.npy")
+    X = np.lib.format.open_memmap(X_path, mode="w+", dtype=np.float32, shape=(n_rows, n_features))
+    y = np.lib.format.open_memmap(y_path, mode="w+", dtype=np.float32, shape=(n_rows,))
+    scales = rng.uniform(0.5, 50, size=n_features)
+    for start, end in iter_blocks(n_rows, block_size):
+        block = rng.normal(size=(end - start, n_features)) * scales + 3.0
+        X[start:end] = block
+        y[start:end] = block @ true_w + 5.0 + rng.normal(scale=0.5, size=end - start)
+    X.flush()
+    y.flush()
+    return X_path, y_path
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Out-of-core mini-batch SGD dari memmap .npy")
+    parser.add_argument("--csv", help="pakai CSV (di konversi sekali ke cache .npy) bukan data sintetis")
+    parser.add_argument("--cache-dir", help="folder cache .npy untuk --csv (default : folder CSV, dipakai ulang antar run)")
+    parser.add_argument("--target", default="price")
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    parser.add_argument("--features", type=int, default=16)
+    parser.add_argument("--optimizer", choices=sorted(OPTIMIZERS), default="Adam")
+    parser.add_argument("--lr", type=float, default=0.01)
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument("--block-size", type=int, default=65_536)
+    parser.add_argument("--epochs", type=int, default=3)
+    parser.add_argument("--float64", action="store_true", help="compute float64 (default float32)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        if args.csv:
+            # cache persisten (bukan tmp) -> run berikutnya langsung pakai .npy tanpa konversi ulang
+            X_path, y_path = csv_to_npy(args.csv, args.target, cache_dir=args.cache_dir)
+        else:
+            X_path, y_path = make_synthetic_memmap(tmp, args.rows, args.features)
+        print(f"dataset siap dalam {time.perf_counter() - start:.2f}s "
+              f"({os.path.getsize(X_path) / 1e6:,.0f} MB di disk)")
+
+        X, y = np.load(X_path, mmap_mode="r"), np.load(y_path, mmap_mode="r")
+        model = StreamingSGDRegressor(
+            OPTIMIZERS[args.optimizer](lr=args.lr), batch_size=args.batch_size,
+            block_size=args.block_size, epochs=args.epochs,
+            dtype=np.float64 if args.float64 else np.float32, verbose=True)
+        model.fit(X, y)
+
+        print(f"score     : {model.score(X, y)}")
+        print(f"throughput: {len(X) * len(model.epoch_times) / sum(model.epoch_times):,.0f} baris/detik")
+        print(f"max RSS   : {_max_rss_mb():,.0f} MB")